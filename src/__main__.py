@@ -2,85 +2,798 @@
 
 Usage:
     python -m src ingest --audio /path/to/audio.wav --session-id S001
+    python -m src ingest --dir /path/to/recordings --workers 8
+    python -m src ingest --audio /path/to/audio.wav --session-id S001 --persist
+    python -m src ingest --dir /path/to/recordings --queue data/ingest-queue --persist
+    python -m src ingest --resume --queue data/ingest-queue
+    python -m src ingest --dir /path/to/recordings --vad
+    python -m src ingest --audio /path/to/audio.wav --session-id S001 --merge-gap 1.5
     python -m src search --topic "recursion"
+    python -m src search --topic "recursion" --in-transcripts
+    python -m src search --under ii-poiesis
+    python -m src search --tag ORGAN-I --tag ORGAN-VI --match all
+    python -m src search --fuzzy "recusion" --threshold 0.4
+    python -m src index build --seed-dir ../koinonia-db/seed
+    python -m src search --local --topic '"creative practice" tag:ii-poiesis'
     python -m src export --session-id 1 --format json
-    python -m src stats
+    python -m src export --all --out site/sessions --workers 4
+    python -m src stats --cached --json
+    python -m src migrate
 """
 
 from __future__ import annotations
 
+import json
+import os
 import sys
+from collections.abc import Callable, Iterable, Iterator
+from datetime import date, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import click
 
 from .config import Settings
-from .export import export_session_json, export_session_markdown, session_to_dict
-from .transcription import TranscriptionPipeline
+from .export import (
+    bundle_to_dict,
+    format_time,
+    parse_time,
+    write_session_json,
+    write_session_jsonl,
+    write_session_markdown,
+)
+from .transcription import (
+    Segment,
+    TranscriptionPipeline,
+    TranscriptionResult,
+    TranscriptionStatus,
+    discover_audio,
+    load_manifest,
+)
+
+if TYPE_CHECKING:
+    from .ingest import IngestReport
+    from .jobs import IngestJob, JobQueue
+    from .repository import SalonRepository
+    from .transcription_cache import TranscriptionCache
 
 
 @click.group()
 def cli() -> None:
     """Salon transcription, search, and export toolkit."""
-    pass
 
 
 @cli.command()
-@click.option("--audio", required=True, help="Path to audio file")
-@click.option("--session-id", required=True, help="Unique session identifier")
+@click.option("--audio", default=None, help="Path to audio file")
+@click.option("--session-id", default=None, help="Unique session identifier (with --audio)")
+@click.option(
+    "--dir",
+    "audio_dir",
+    default=None,
+    type=click.Path(exists=True, file_okay=False),
+    help="Transcribe every audio file in a directory (session id = file stem)",
+)
+@click.option(
+    "--manifest",
+    default=None,
+    type=click.Path(exists=True, dir_okay=False),
+    help="JSON list of {session_id, audio_path} jobs",
+)
 @click.option("--language", default="en", help="Language code (default: en)")
-def ingest(audio: str, session_id: str, language: str) -> None:
-    """Ingest an audio recording and produce a transcription."""
-    pipeline = TranscriptionPipeline(language=language)
-    result = pipeline.process_audio(session_id, audio)
-    click.echo(f"Ingested session {session_id}: {len(result.segments)} segment(s)")
-    click.echo(f"Status: {result.status.value}")
-    click.echo(f"Duration: {result.total_duration}")
-    if result.speaker_list:
-        click.echo(f"Speakers: {', '.join(result.speaker_list)}")
+@click.option("--stream", is_flag=True, help="Print segments as they are transcribed (--audio)")
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Concurrent transcriptions for --dir/--manifest (default: $TRANSCRIPTION_WORKERS)",
+)
+@click.option(
+    "--executor",
+    type=click.Choice(["thread", "process"]),
+    default="thread",
+    help="Pool type for batch ingest",
+)
+@click.option(
+    "--cache-dir",
+    default=None,
+    help="Transcript cache directory (default: $TRANSCRIPTION_CACHE_DIR)",
+)
+@click.option("--no-cache", is_flag=True, help="Always re-transcribe, bypassing the cache")
+@click.option(
+    "--persist",
+    is_flag=True,
+    help="Write sessions and segments to the database as they are transcribed",
+)
+@click.option("--title", default=None, help="Session title with --persist (default: session id)")
+@click.option(
+    "--date",
+    "session_date",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    default=None,
+    help="Session date with --persist, YYYY-MM-DD (default: today)",
+)
+@click.option("--session-format", default="deep_dive", help="Session format with --persist")
+@click.option(
+    "--batch-size",
+    type=int,
+    default=None,
+    help="Segments per insert transaction with --persist",
+)
+@click.option(
+    "--queue",
+    "queue_dir",
+    default=None,
+    help="Queue --dir/--manifest jobs in this durable job queue directory and work it",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Work the remaining jobs of a queue (default: $SALON_INGEST_QUEUE_DIR), "
+    "retrying failed ones; run in several processes to share the backlog",
+)
+@click.option(
+    "--vad",
+    is_flag=True,
+    help="Only transcribe speech regions of WAV files (energy voice-activity detection)",
+)
+@click.option(
+    "--vad-threshold",
+    type=float,
+    default=-45.0,
+    show_default=True,
+    help="Frame level in dBFS above which --vad counts audio as speech",
+)
+@click.option(
+    "--merge-gap",
+    type=float,
+    default=None,
+    help="Merge same-speaker segments at most this many seconds apart and smooth "
+    "short speaker flips before output (not with --stream)",
+)
+@click.option(
+    "--min-flip",
+    type=float,
+    default=1.0,
+    show_default=True,
+    help="With --merge-gap, relabel sandwiched speaker turns shorter than this (seconds)",
+)
+def ingest(
+    audio: str | None,
+    session_id: str | None,
+    audio_dir: str | None,
+    manifest: str | None,
+    language: str,
+    stream: bool,
+    workers: int | None,
+    executor: str,
+    cache_dir: str | None,
+    no_cache: bool,
+    persist: bool,
+    title: str | None,
+    session_date: datetime | None,
+    session_format: str,
+    batch_size: int | None,
+    queue_dir: str | None,
+    resume: bool,
+    vad: bool,
+    vad_threshold: float,
+    merge_gap: float | None,
+    min_flip: float,
+) -> None:
+    """Ingest audio recordings and produce transcriptions.
+
+    With --persist, each session and its segments are written to the
+    database while transcription runs. Re-running with the same session id
+    skips completed sessions and resumes interrupted ones.
+    """
+    sources = sum(x is not None for x in (audio, audio_dir, manifest))
+    if sources != 1 and not (resume and sources == 0):
+        click.echo("Error: pass exactly one of --audio, --dir, or --manifest", err=True)
+        raise SystemExit(1)
+    if (queue_dir is not None or resume) and audio is not None:
+        click.echo("Error: --queue and --resume work with --dir or --manifest", err=True)
+        raise SystemExit(1)
+
+    cache = None
+    cache_dir = cache_dir or Settings.TRANSCRIPTION_CACHE_DIR
+    if cache_dir and not no_cache:
+        from .transcription_cache import TranscriptionCache
+
+        cache = TranscriptionCache(
+            cache_dir, max_bytes=Settings.TRANSCRIPTION_CACHE_MAX_MB * 1024 * 1024
+        )
+    pipeline = TranscriptionPipeline(language=language, cache=cache)
+    if vad:
+        try:
+            from .audio import VADConfig, VoiceActivityBackend
+        except ImportError:
+            click.echo(
+                "Error: --vad requires NumPy (pip install 'salon-archive[audio]')", err=True
+            )
+            raise SystemExit(1)
+        pipeline.backend = VoiceActivityBackend(
+            pipeline.backend, VADConfig(threshold_db=vad_threshold)
+        )
+    clean: Callable[[TranscriptionResult], TranscriptionResult] | None = None
+    if merge_gap is not None:
+        if stream:
+            click.echo("Error: --merge-gap needs whole transcripts; drop --stream", err=True)
+            raise SystemExit(1)
+        try:
+            from .diarization import clean_result
+        except ImportError:
+            click.echo(
+                "Error: --merge-gap requires NumPy (pip install 'salon-archive[audio]')", err=True
+            )
+            raise SystemExit(1)
+
+        def clean(result: TranscriptionResult) -> TranscriptionResult:
+            return clean_result(result, max_gap_seconds=merge_gap, min_flip_seconds=min_flip)
+
+    repo = _ingest_repository() if persist else None
+    persist_options = {"batch_size": batch_size} if batch_size else {}
+
+    def session_fields(key: str, audio_path: str, session_title: str | None = None) -> dict:
+        return {
+            "title": session_title or key,
+            "date": session_date or datetime.combine(date.today(), datetime.min.time()),
+            "format": session_format,
+            "notes": f"Transcribed from {Path(audio_path).name}",
+        }
+
+    if audio is not None:
+        if not session_id:
+            click.echo("Error: --audio requires --session-id", err=True)
+            raise SystemExit(1)
+        if repo is not None:
+            from .ingest import persist_segments
+
+            if clean is not None:
+                segments = clean(pipeline.process_audio(session_id, audio)).segments
+            else:
+                segments = pipeline.stream_audio(session_id, audio, retain=cache is not None)
+            report = persist_segments(
+                repo,
+                session_id,
+                session_fields(session_id, audio, title),
+                _echo_segments(segments) if stream else segments,
+                **persist_options,
+            )
+            _report_ingest(report)
+            _report_cache(cache)
+            return
+        if stream:
+            for seg in pipeline.stream_audio(session_id, audio, retain=False):
+                start = format_time(seg.start_time.total_seconds())
+                click.echo(f"[{start}] {seg.speaker}: {seg.text}")
+            click.echo(f"Status: {pipeline.get_result(session_id).status.value}")
+            return
+        result = pipeline.process_audio(session_id, audio)
+        if clean is not None:
+            raw = len(result.segments)
+            result = clean(result)
+            click.echo(f"Merged {raw} segment(s) into {len(result.segments)}")
+        click.echo(f"Ingested session {session_id}: {len(result.segments)} segment(s)")
+        click.echo(f"Status: {result.status.value}")
+        click.echo(f"Duration: {result.total_duration}")
+        if result.speaker_list:
+            click.echo(f"Speakers: {', '.join(result.speaker_list)}")
+        if clean is not None:
+            _echo_speaker_metrics(result)
+        _report_cache(cache)
+        return
+
+    if queue_dir is not None or resume:
+        from .jobs import JobQueue
+
+        queue = JobQueue(queue_dir or Settings.INGEST_QUEUE_DIR)
+        if sources:
+            added = queue.enqueue(
+                discover_audio(audio_dir) if audio_dir else load_manifest(manifest)
+            )
+            click.echo(f"Queued {added} new job(s) in {queue.directory}.")
+        if resume and (retried := queue.retry_failed()):
+            click.echo(f"Retrying {retried} failed job(s).")
+
+        def persist_job(job: IngestJob) -> None:
+            from .ingest import persist_segments
+
+            segments = queue.read_transcript(job)
+            if clean is not None:
+                segments = clean(TranscriptionResult(job.session_id, segments=segments)).segments
+            persist_segments(
+                repo,
+                job.session_id,
+                session_fields(job.session_id, job.audio_path),
+                segments,
+                **persist_options,
+            )
+
+        _work_queue(
+            queue,
+            pipeline,
+            workers or Settings.TRANSCRIPTION_WORKERS,
+            persist_job if repo is not None else None,
+        )
+        _report_cache(cache)
+        return
+
+    jobs = discover_audio(audio_dir) if audio_dir else load_manifest(manifest)
+    if not jobs:
+        click.echo("No audio files found.")
+        return
+    if repo is not None:
+        completed = {sid for sid, _ in jobs if (run := repo.get_ingest_run(sid)) and run.completed}
+        if completed:
+            click.echo(f"Skipping {len(completed)} already persisted session(s).")
+            jobs = [(sid, path) for sid, path in jobs if sid not in completed]
+        if not jobs:
+            return
+
+    persist_failed = 0
+
+    def report(result: TranscriptionResult) -> None:
+        nonlocal persist_failed
+        if clean is not None and result.status is TranscriptionStatus.COMPLETED:
+            result = clean(result)
+        detail = (
+            f"{len(result.segments)} segment(s)"
+            if result.status is TranscriptionStatus.COMPLETED
+            else result.error
+        )
+        click.echo(f"  [{result.status.value}] {result.session_id}: {detail}")
+        if repo is None or result.status is not TranscriptionStatus.COMPLETED:
+            return
+        from .ingest import persist_segments
+
+        try:
+            # DB writes for this file overlap transcription of the rest of the batch
+            persist_segments(
+                repo,
+                result.session_id,
+                session_fields(result.session_id, result.audio_path),
+                result.segments,
+                **persist_options,
+            )
+        except Exception as exc:  # noqa: BLE001 - reported per file; the batch goes on
+            persist_failed += 1
+            click.echo(f"    not persisted: {type(exc).__name__}: {exc}", err=True)
+
+    results = pipeline.process_many(
+        jobs,
+        max_workers=workers or Settings.TRANSCRIPTION_WORKERS,
+        executor=executor,
+        on_result=report,
+    )
+    failed = sum(r.status is TranscriptionStatus.FAILED for r in results)
+    click.echo(f"\nIngested {len(results) - failed}/{len(results)} file(s).")
+    if repo is not None:
+        click.echo(f"Persisted {len(results) - failed - persist_failed} session(s).")
+    _report_cache(cache)
+    if failed or persist_failed:
+        raise SystemExit(1)
+
+
+def _work_queue(
+    queue: JobQueue,
+    pipeline: TranscriptionPipeline,
+    workers: int,
+    on_transcribed: Callable[[IngestJob], None] | None,
+) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .jobs import run_worker
+
+    def report(job: IngestJob) -> None:
+        detail = (
+            f"{job.segments_written} segment(s)"
+            if job.status is TranscriptionStatus.COMPLETED
+            else f"attempt {job.attempts}: {job.error}"
+        )
+        click.echo(f"  [{job.status.value}] {job.session_id}: {detail}")
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(run_worker, queue, pipeline, None, on_transcribed, report)
+            for _ in range(workers)
+        ]
+        for future in futures:
+            future.result()
+    counts = queue.counts()
+    click.echo(
+        f"\nQueue: {counts[TranscriptionStatus.COMPLETED]} completed, "
+        f"{counts[TranscriptionStatus.PENDING]} pending, "
+        f"{counts[TranscriptionStatus.PROCESSING]} in progress, "
+        f"{counts[TranscriptionStatus.FAILED]} failed."
+    )
+    if counts[TranscriptionStatus.FAILED]:
+        raise SystemExit(1)
+
+
+def _echo_speaker_metrics(result: TranscriptionResult) -> None:
+    from .diarization import speaker_metrics
+
+    for name, figures in speaker_metrics(result.segments).to_dict().items():
+        overlap = sum(figures["overlap_seconds"].values())
+        click.echo(
+            f"  {name}: {format_time(figures['talk_seconds'])} talk time, "
+            f"{figures['turns']} turn(s), {format_time(overlap)} overlapping"
+        )
+
+
+def _ingest_repository() -> SalonRepository:
+    try:
+        db_url = Settings.require_db()
+    except RuntimeError as exc:
+        click.echo(f"Error: {exc}", err=True)
+        raise SystemExit(1)
+
+    from .repository import SalonRepository
+
+    return SalonRepository(db_url)
+
+
+def _echo_segments(segments: Iterable[Segment]) -> Iterator[Segment]:
+    for seg in segments:
+        start = format_time(seg.start_time.total_seconds())
+        click.echo(f"[{start}] {seg.speaker}: {seg.text}")
+        yield seg
+
+
+def _report_ingest(report: IngestReport) -> None:
+    if report.already_complete:
+        click.echo(f"Session {report.session_key} already persisted as #{report.session_id}.")
+        return
+    click.echo(
+        f"Persisted session {report.session_key} as #{report.session_id}: "
+        f"{report.segments_written} segment(s)"
+    )
+    if report.segments_skipped:
+        click.echo(f"Resumed after {report.segments_skipped} previously written segment(s).")
+
+
+def _report_cache(cache: TranscriptionCache | None) -> None:
+    if cache is not None:
+        st = cache.stats
+        click.echo(f"Cache: {st.hits} hit(s), {st.misses} miss(es), {st.evictions} eviction(s)")
 
 
 @cli.command()
-@click.option("--topic", default=None, help="Search by topic keyword (text search)")
+@click.option(
+    "--topic", default=None, help="Ranked full-text search over titles, notes, transcripts"
+)
 @click.option("--exact-tag", default=None, help="Search by exact organ_tags array match")
+@click.option("--tag", "tags", multiple=True, help="Filter by organ tag (repeatable)")
+@click.option(
+    "--match",
+    type=click.Choice(["any", "all"]),
+    default="any",
+    show_default=True,
+    help="With several --tag, match sessions carrying any or all of them",
+)
+@click.option(
+    "--under",
+    default=None,
+    help="Sessions tagged with this taxonomy slug or any node beneath it",
+)
+@click.option("--fuzzy", default=None, help="Typo-tolerant match, ranked by similarity")
+@click.option(
+    "--fuzzy-field",
+    type=click.Choice(["title", "taxonomy", "speaker"]),
+    default="title",
+    show_default=True,
+    help="What --fuzzy matches: session titles, taxonomy labels, or speaker names",
+)
+@click.option(
+    "--threshold",
+    type=click.FloatRange(0.0, 1.0),
+    default=0.3,
+    show_default=True,
+    help="Minimum similarity for --fuzzy",
+)
 @click.option("--limit", type=int, default=20, help="Max results")
-def search(topic: str | None, exact_tag: str | None, limit: int) -> None:
-    """Search the session archive by topic or tag."""
+@click.option("--offset", type=int, default=0, help="Skip this many ranked results")
+@click.option("--page-size", type=int, default=None, help="Results per page (default: --limit)")
+@click.option("--cursor", default=None, help="Continue from a previous page's cursor")
+@click.option(
+    "--in-transcripts",
+    is_flag=True,
+    help="Search inside transcripts and list matching segments",
+)
+@click.option("--local", is_flag=True, help="Search the on-disk index instead of the database")
+@click.option(
+    "--index-dir",
+    default=None,
+    help="Local index directory (default: $SALON_INDEX_DIR or data/search-index)",
+)
+def search(
+    topic: str | None,
+    exact_tag: str | None,
+    tags: tuple[str, ...],
+    match: str,
+    under: str | None,
+    fuzzy: str | None,
+    fuzzy_field: str,
+    threshold: float,
+    limit: int,
+    offset: int,
+    page_size: int | None,
+    cursor: str | None,
+    in_transcripts: bool,
+    local: bool,
+    index_dir: str | None,
+) -> None:
+    """Search the session archive by topic or tag.
+
+    Results are paged: when more remain, the command prints a cursor to
+    pass back with --cursor for the next page.
+    """
+    if in_transcripts and not topic:
+        click.echo("Error: --in-transcripts requires --topic", err=True)
+        raise SystemExit(1)
+    if offset and cursor:
+        click.echo("Error: --offset and --cursor cannot be combined", err=True)
+        raise SystemExit(1)
+
+    tag_list = [*tags, *([exact_tag] if exact_tag else [])]
+
+    if local and under:
+        click.echo("Error: --under needs the database taxonomy; drop --local", err=True)
+        raise SystemExit(1)
+    if local and match == "any" and len(tag_list) > 1:
+        click.echo("Error: the local index only supports --match all", err=True)
+        raise SystemExit(1)
+
+    if local and fuzzy and fuzzy_field != "title":
+        click.echo("Error: the local index only supports --fuzzy-field title", err=True)
+        raise SystemExit(1)
+
+    if local:
+        path = Path(index_dir or Settings.SEARCH_INDEX_DIR)
+        if fuzzy:
+            _search_local_fuzzy(fuzzy, threshold, limit, path)
+        else:
+            _search_local(topic, tag_list, limit, path)
+        return
+
     try:
         db_url = Settings.require_db()
     except RuntimeError as exc:
         click.echo(f"Error: {exc}", err=True)
         raise SystemExit(1)
 
-    from .repository import SalonRepository
+    from .repository import Page, SalonRepository
 
     repo = SalonRepository(db_url)
-    if exact_tag:
-        results = repo.search_by_topic(exact_tag)
-    elif topic:
-        results = repo.search_by_text(topic)
-    else:
-        results = repo.list_sessions(limit=limit)
+    if fuzzy:
+        _search_fuzzy(repo, fuzzy, fuzzy_field, threshold, limit)
+        return
+
+    size = page_size or limit
+    try:
+        if in_transcripts:
+            if offset:
+                page = Page(repo.search_transcripts(topic, limit=size, offset=offset))
+            else:
+                page = repo.search_transcripts_page(topic, page_size=size, cursor=cursor)
+            if not page.items:
+                click.echo("No matching segments found.")
+                return
+            for hit in page.items:
+                click.echo(
+                    f"  [{hit.session_id}] {hit.session_title} @ {format_time(hit.start_seconds)}"
+                    f" {hit.speaker}: {hit.snippet}"
+                )
+            click.echo(f"\n{len(page.items)} segment(s) found.")
+            _report_next_page(page.next_cursor)
+            return
 
-    if not results:
+        if topic and not (tag_list or under):
+            if offset:
+                ranked = Page(repo.search_fulltext(topic, limit=size, offset=offset))
+            else:
+                ranked = repo.search_fulltext_page(topic, page_size=size, cursor=cursor)
+            if not ranked.items:
+                click.echo("No matching sessions found.")
+                return
+            for row, rank in ranked.items:
+                click.echo(f"  [{row.id}] {row.title} ({row.date})  rank={rank:.3f}")
+            click.echo(f"\n{len(ranked.items)} session(s) found.")
+            _report_next_page(ranked.next_cursor)
+            return
+
+        if under:
+            results = repo.search_by_taxonomy_page(under, page_size=size, cursor=cursor)
+        elif tag_list:
+            results = repo.search_by_tags_page(
+                tag_list, match=match, page_size=size, cursor=cursor
+            )
+        else:
+            results = repo.list_sessions_page(page_size=size, cursor=cursor)
+    except ValueError as exc:
+        click.echo(f"Error: {exc}", err=True)
+        raise SystemExit(1)
+
+    if not results.items:
         click.echo("No matching sessions found.")
         return
 
-    for row in results:
+    for row in results.items:
         click.echo(f"  [{row.id}] {row.title} ({row.date})")
-    click.echo(f"\n{len(results)} session(s) found.")
+    click.echo(f"\n{len(results.items)} session(s) found.")
+    _report_next_page(results.next_cursor)
+
+
+def _report_next_page(cursor: str | None) -> None:
+    if cursor:
+        click.echo(f"More results: --cursor {cursor}")
+
+
+def _search_fuzzy(
+    repo: SalonRepository, query: str, field: str, threshold: float, limit: int
+) -> None:
+    if field == "speaker":
+        speakers = repo.fuzzy_search_speakers(query, threshold, limit)
+        for name, score in speakers:
+            click.echo(f"  {name}  similarity={score:.2f}")
+        click.echo(f"\n{len(speakers)} speaker(s) found.")
+    elif field == "taxonomy":
+        nodes = repo.fuzzy_search_taxonomy(query, threshold, limit)
+        for node, score in nodes:
+            click.echo(f"  {node.slug}: {node.label}  similarity={score:.2f}")
+        click.echo(f"\n{len(nodes)} taxonomy node(s) found.")
+    else:
+        sessions = repo.fuzzy_search_sessions(query, threshold, limit)
+        for row, score in sessions:
+            click.echo(f"  [{row.id}] {row.title} ({row.date})  similarity={score:.2f}")
+        click.echo(f"\n{len(sessions)} session(s) found.")
+
+
+def _search_local_fuzzy(query: str, threshold: float, limit: int, index_dir: Path) -> None:
+    from .search_index import LocalSearchIndex
+
+    if not (index_dir / "index.json").exists():
+        click.echo(f"Error: no search index at {index_dir} (run `salon index build`)", err=True)
+        raise SystemExit(1)
+    with LocalSearchIndex(index_dir) as index:
+        hits = index.fuzzy_search(query, threshold, limit)
+    for hit in hits:
+        click.echo(f"  [{hit.session_id}] {hit.title} ({hit.date})  similarity={hit.score:.2f}")
+    click.echo(f"\n{len(hits)} session(s) found.")
+
+
+def _search_local(topic: str | None, tags: list[str], limit: int, index_dir: Path) -> None:
+    from .search_index import TAG_PREFIX, LocalSearchIndex
+
+    if not (index_dir / "index.json").exists():
+        click.echo(f"Error: no search index at {index_dir} (run `salon index build`)", err=True)
+        raise SystemExit(1)
+
+    query = " ".join([*([topic] if topic else []), *(TAG_PREFIX + tag for tag in tags)])
+    with LocalSearchIndex(index_dir) as index:
+        hits = index.search(query, limit=limit)
+    if not hits:
+        click.echo("No matching sessions found.")
+        return
+    for hit in hits:
+        click.echo(f"  [{hit.session_id}] {hit.title} ({hit.date})  score={hit.score:.3f}")
+    click.echo(f"\n{len(hits)} session(s) found.")
+
+
+@cli.group()
+def index() -> None:
+    """Manage the offline search index."""
+
+
+@index.command("build")
+@click.option("--seed-dir", default=None, help="koinonia-db seed directory to index")
+@click.option(
+    "--from-json",
+    "json_files",
+    multiple=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Exported session JSON file (repeatable)",
+)
+@click.option("--out", default=None, help="Output directory (default: $SALON_INDEX_DIR)")
+def index_build(seed_dir: str | None, json_files: tuple[str, ...], out: str | None) -> None:
+    """Build the offline search index from seed data or exported sessions."""
+    from .data_export import load_seed_sessions, load_session_files
+    from .search_index import build_index
+
+    if json_files:
+        sessions = load_session_files([Path(p) for p in json_files])
+    else:
+        sessions = load_seed_sessions(Path(seed_dir) if seed_dir else None)
+    out_dir = build_index(sessions, Path(out or Settings.SEARCH_INDEX_DIR))
+    click.echo(f"Indexed {len(sessions)} session(s) into {out_dir}")
+
+
+def _time_option(ctx: click.Context, param: click.Parameter, value: str | None) -> float | None:
+    if value is None:
+        return None
+    try:
+        return parse_time(value)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc)) from None
 
 
 @cli.command("export")
-@click.option("--session-id", required=True, type=int, help="Session ID to export")
+@click.option("--session-id", default=None, type=int, help="Session ID to export")
+@click.option("--all", "export_all_", is_flag=True, help="Export every session into --out DIR")
 @click.option(
     "--format",
     "fmt",
-    type=click.Choice(["json", "markdown"]),
+    type=click.Choice(["json", "jsonl", "markdown"]),
     default="json",
     help="Output format",
 )
-def export_cmd(session_id: int, fmt: str) -> None:
-    """Export a session record in the requested format."""
+@click.option(
+    "--out",
+    "out_path",
+    type=click.Path(),
+    default=None,
+    help="Output file (default: stdout); with --all, the output directory",
+)
+@click.option("--workers", type=int, default=os.cpu_count() or 1, help="Render processes (--all)")
+@click.option("--force", is_flag=True, help="Re-render unchanged sessions (--all)")
+@click.option(
+    "--seed-dir",
+    default=None,
+    help="Export koinonia-db seed sessions instead of the database (--all)",
+)
+@click.option(
+    "--from",
+    "from_seconds",
+    default=None,
+    callback=_time_option,
+    help="Only segments still under way at or after this time (H:MM:SS, M:SS or seconds)",
+)
+@click.option(
+    "--to",
+    "to_seconds",
+    default=None,
+    callback=_time_option,
+    help="Only segments starting before this time",
+)
+@click.option("--speaker", default=None, help="Only this speaker's segments")
+def export_cmd(
+    session_id: int | None,
+    export_all_: bool,
+    fmt: str,
+    out_path: str | None,
+    workers: int,
+    force: bool,
+    seed_dir: str | None,
+    from_seconds: float | None,
+    to_seconds: float | None,
+    speaker: str | None,
+) -> None:
+    """Export a session record in the requested format.
+
+    Segments are streamed from the database straight to the output, so
+    large transcripts are never held in memory. --from/--to/--speaker
+    export a slice of the transcript through the segment seek indexes
+    (see `salon migrate`). With --all, every session is rendered as
+    markdown and JSON into --out, skipping sessions that are unchanged
+    since the last run.
+    """
+    sliced = from_seconds is not None or to_seconds is not None or speaker is not None
+    if from_seconds is not None and to_seconds is not None and to_seconds <= from_seconds:
+        click.echo("Error: --to must be later than --from", err=True)
+        raise SystemExit(1)
+    if export_all_:
+        if sliced:
+            click.echo("Error: --from/--to/--speaker apply to a single --session-id", err=True)
+            raise SystemExit(1)
+        if not out_path:
+            click.echo("Error: --all requires --out DIR", err=True)
+            raise SystemExit(1)
+        _export_archive(Path(out_path), workers, force, seed_dir)
+        return
+    if session_id is None:
+        click.echo("Error: pass --session-id or --all", err=True)
+        raise SystemExit(1)
+
     try:
         db_url = Settings.require_db()
     except RuntimeError as exc:
@@ -90,23 +803,63 @@ def export_cmd(session_id: int, fmt: str) -> None:
     from .repository import SalonRepository
 
     repo = SalonRepository(db_url)
-    row = repo.get_session(session_id)
-    if row is None:
+    bundle = repo.get_session_bundle(session_id, include_segments=False)
+    if bundle is None:
         click.echo(f"Session {session_id} not found.", err=True)
         raise SystemExit(1)
 
-    segments = repo.get_segments(session_id)
-    data = session_to_dict(row, participants=[], segments=segments)
+    data = bundle_to_dict(bundle)
+    writer = {
+        "json": write_session_json,
+        "jsonl": write_session_jsonl,
+        "markdown": write_session_markdown,
+    }[fmt]
+    with click.open_file(out_path or "-", "w", encoding="utf-8") as out:
+        segments = repo.iter_segments(
+            session_id, from_seconds=from_seconds, to_seconds=to_seconds, speaker=speaker
+        )
+        writer(data, out, segments=segments)
+
 
-    if fmt == "json":
-        click.echo(export_session_json(data))
+def _export_archive(out_dir: Path, workers: int, force: bool, seed_dir: str | None) -> None:
+    from .data_export import export_archive, load_seed_sessions
+
+    sessions: Iterable[dict[str, Any]]
+    if seed_dir:
+        sessions = load_seed_sessions(Path(seed_dir))
     else:
-        click.echo(export_session_markdown(data))
+        try:
+            db_url = Settings.require_db()
+        except RuntimeError as exc:
+            click.echo(f"Error: {exc}", err=True)
+            raise SystemExit(1)
+
+        from .repository import SalonRepository
+
+        repo = SalonRepository(db_url)
+        sessions = (bundle_to_dict(bundle) for bundle in repo.iter_session_bundles())
+
+    report = export_archive(sessions, out_dir, workers=workers, force=force)
+    click.echo(
+        f"Wrote {len(report.written)} file(s); {len(report.skipped)} session(s) unchanged; "
+        f"removed {len(report.removed)} stale file(s)."
+    )
 
 
 @cli.command()
-def stats() -> None:
-    """Show archive statistics."""
+@click.option("--cached", is_flag=True, help="Read the summary table instead of scanning")
+@click.option("--refresh", is_flag=True, help="Recompute and store the summary table")
+@click.option("--json", "as_json", is_flag=True, help="Print statistics as JSON")
+def stats(cached: bool, refresh: bool, as_json: bool) -> None:
+    """Show archive statistics.
+
+    By default the figures are computed live. --refresh stores them in the
+    salon_stats summary table (created by `salon migrate`), which later
+    ingests keep current; --cached reads them back without scanning.
+    """
+    if cached and refresh:
+        click.echo("Error: --cached and --refresh cannot be combined", err=True)
+        raise SystemExit(1)
     try:
         db_url = Settings.require_db()
     except RuntimeError as exc:
@@ -116,10 +869,72 @@ def stats() -> None:
     from .repository import SalonRepository
 
     repo = SalonRepository(db_url)
-    sessions = repo.count_sessions()
-    nodes = repo.count_taxonomy_nodes()
-    click.echo(f"Sessions:       {sessions}")
-    click.echo(f"Taxonomy nodes: {nodes}")
+    if cached:
+        figures = repo.cached_stats()
+        if figures is None:
+            click.echo("Error: no cached statistics (run `salon stats --refresh`)", err=True)
+            raise SystemExit(1)
+    elif refresh:
+        figures = repo.refresh_stats()
+    else:
+        figures = repo.compute_stats()
+
+    if as_json:
+        click.echo(
+            json.dumps(
+                {
+                    "sessions": figures.sessions,
+                    "segments": figures.segments,
+                    "transcript_hours": round(figures.transcript_hours, 2),
+                    "taxonomy_nodes": figures.taxonomy_nodes,
+                    "taxonomy_depth": figures.taxonomy_depth,
+                    "by_format": dict(figures.by_format),
+                    "by_month": dict(sorted(figures.by_month.items())),
+                    "by_tag": dict(figures.by_tag.most_common()),
+                    "speaker_hours": {
+                        k: round(v / 3600, 2) for k, v in figures.speaker_seconds.most_common()
+                    },
+                    "refreshed_at": figures.refreshed_at,
+                },
+                indent=2,
+            )
+        )
+        return
+
+    click.echo(f"Sessions:         {figures.sessions}")
+    click.echo(f"Segments:         {figures.segments}")
+    click.echo(f"Transcript hours: {figures.transcript_hours:.1f}")
+    click.echo(f"Taxonomy nodes:   {figures.taxonomy_nodes} (depth {figures.taxonomy_depth})")
+    _echo_counts("By format", figures.by_format.most_common())
+    _echo_counts("By month", sorted(figures.by_month.items()))
+    _echo_counts("By tag", figures.by_tag.most_common())
+    _echo_counts(
+        "Talk time (hours)",
+        [(k, f"{v / 3600:.1f}") for k, v in figures.speaker_seconds.most_common(10)],
+    )
+
+
+def _echo_counts(heading: str, items: list[tuple[str, object]]) -> None:
+    if items:
+        click.echo(f"\n{heading}:")
+        for key, value in items:
+            click.echo(f"  {key:<24} {value}")
+
+
+@cli.command()
+def migrate() -> None:
+    """Create the supplementary indexes and tables (idempotent)."""
+    try:
+        db_url = Settings.require_db()
+    except RuntimeError as exc:
+        click.echo(f"Error: {exc}", err=True)
+        raise SystemExit(1)
+
+    from .repository import get_engine
+    from .schema import apply_migrations
+
+    for name in apply_migrations(get_engine(db_url, **Settings.engine_options())):
+        click.echo(f"Applied {name}")
 
 
 # Legacy entry point for `python -m src`
@@ -0,0 +1,230 @@
+"""Asyncio variant of the salon archive repository, for service deployments.
+
+:class:`AsyncSalonRepository` exposes the same sessions, segments,
+taxonomy, search, and count methods as
+:class:`~src.repository.SalonRepository`, as coroutines on an
+``AsyncEngine`` (``postgresql+psycopg://`` works for both; SQLite needs
+``sqlite+aiosqlite://``). Rather than duplicating every query, each method
+runs the synchronous implementation against the async session via
+``AsyncSession.run_sync``, so the SQL is identical and the event loop is
+never blocked on I/O.
+
+Independent reads can be fanned out with ``asyncio.gather``: each call
+outside :meth:`~AsyncSalonRepository.transaction` checks out its own pooled
+connection. :meth:`~AsyncSalonRepository.compute_stats` does this for the
+archive statistics queries.
+
+Pooled async connections belong to the event loop that opened them, so
+share a repository within one loop (a service's), not across
+``asyncio.run`` calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import functools
+import threading
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from koinonia_db.models.salon import SalonSessionRow
+from koinonia_db.models.salon import Segment as SegmentRow
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from .config import Settings
+from .repository import (
+    DEFAULT_BATCH_SIZE,
+    SalonRepository,
+    _taxonomy_versions,
+    segments_query,
+)
+from .stats import ArchiveStats
+
+_async_engines: dict[tuple[str, tuple[tuple[str, Any], ...]], AsyncEngine] = {}
+_async_engines_lock = threading.Lock()
+
+
+def get_async_engine(database_url: str, **options: Any) -> AsyncEngine:
+    """Return the process-wide async engine for a URL and option set (see ``get_engine``)."""
+    key = (database_url, tuple(sorted(options.items())))
+    with _async_engines_lock:
+        engine = _async_engines.get(key)
+        if engine is None:
+            engine = _async_engines[key] = create_async_engine(database_url, **options)
+    return engine
+
+
+async def dispose_async_engines() -> None:
+    """Close every pooled connection and forget all registered async engines."""
+    with _async_engines_lock:
+        engines = list(_async_engines.values())
+        _async_engines.clear()
+    for engine in engines:
+        await engine.dispose()
+
+
+def _bound_call(
+    sync_session: Session, method: Callable[..., Any], args: tuple, kwargs: dict[str, Any]
+) -> Any:
+    """Run a SalonRepository method with the repository bound to ``sync_session``."""
+    repo = SalonRepository.__new__(SalonRepository)
+    repo._engine = sync_session.get_bind()
+    repo._bound = sync_session
+    return method(repo, *args, **kwargs)
+
+
+def _delegate(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Expose a SalonRepository method as a coroutine on AsyncSalonRepository."""
+
+    async def call(self: AsyncSalonRepository, *args: Any, **kwargs: Any) -> Any:
+        async with self._session() as s:
+            result = await s.run_sync(_bound_call, method, args, kwargs)
+            await self._commit(s)
+            return result
+
+    return functools.wraps(method)(call)
+
+
+class AsyncSalonRepository:
+    """Asyncio repository for salon sessions, with the SalonRepository surface."""
+
+    def __init__(
+        self,
+        database_url: str,
+        engine_options: dict[str, Any] | None = None,
+    ) -> None:
+        if engine_options is None:
+            engine_options = Settings.engine_options()
+        self._engine = get_async_engine(database_url, **engine_options)
+        self._bound: AsyncSession | None = None
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[AsyncSalonRepository]:
+        """Run several calls in one session and transaction (see SalonRepository.transaction).
+
+        Calls through the bound repository share one connection, so they run
+        one at a time; do not ``gather`` them.
+        """
+        if self._bound is not None:
+            yield self
+            return
+        async with AsyncSession(self._engine, expire_on_commit=False) as s, s.begin():
+            bound = copy.copy(self)
+            bound._bound = s
+            yield bound
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[AsyncSession]:
+        if self._bound is not None:
+            yield self._bound
+        else:
+            async with AsyncSession(self._engine, expire_on_commit=False) as s:
+                yield s
+
+    async def _commit(self, s: AsyncSession) -> None:
+        if self._bound is None:
+            await s.commit()
+        else:
+            await s.flush()
+
+    # ── Sessions ──────────────────────────────────────────────────────
+
+    add_session = _delegate(SalonRepository.add_session)
+    add_sessions_bulk = _delegate(SalonRepository.add_sessions_bulk)
+    bulk_insert_segments = _delegate(SalonRepository.bulk_insert_segments)
+    get_session = _delegate(SalonRepository.get_session)
+    get_session_bundle = _delegate(SalonRepository.get_session_bundle)
+    get_session_bundles = _delegate(SalonRepository.get_session_bundles)
+    list_sessions = _delegate(SalonRepository.list_sessions)
+    list_sessions_page = _delegate(SalonRepository.list_sessions_page)
+    get_segments = _delegate(SalonRepository.get_segments)
+
+    async def iter_sessions(
+        self, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> AsyncIterator[SalonSessionRow]:
+        """Stream every session in id order through a server-side cursor."""
+        stmt = (
+            select(SalonSessionRow)
+            .order_by(SalonSessionRow.id)
+            .execution_options(yield_per=batch_size)
+        )
+        async with self._session() as s:
+            async for row in await s.stream_scalars(stmt):
+                yield row
+
+    async def iter_segments(
+        self,
+        session_id: int,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        *,
+        from_seconds: float | None = None,
+        to_seconds: float | None = None,
+        speaker: str | None = None,
+    ) -> AsyncIterator[SegmentRow]:
+        """Stream a session's segments in start order through a server-side cursor."""
+        stmt = segments_query(session_id, from_seconds, to_seconds, speaker).execution_options(
+            yield_per=batch_size
+        )
+        async with self._session() as s:
+            async for row in await s.stream_scalars(stmt):
+                yield row
+
+    # ── Search ────────────────────────────────────────────────────────
+
+    search_by_topic = _delegate(SalonRepository.search_by_topic)
+    search_by_topic_page = _delegate(SalonRepository.search_by_topic_page)
+    search_by_tags = _delegate(SalonRepository.search_by_tags)
+    search_by_tags_page = _delegate(SalonRepository.search_by_tags_page)
+    search_by_taxonomy = _delegate(SalonRepository.search_by_taxonomy)
+    search_by_taxonomy_page = _delegate(SalonRepository.search_by_taxonomy_page)
+    search_by_text = _delegate(SalonRepository.search_by_text)
+    search_by_text_page = _delegate(SalonRepository.search_by_text_page)
+    search_fulltext = _delegate(SalonRepository.search_fulltext)
+    search_fulltext_page = _delegate(SalonRepository.search_fulltext_page)
+    search_transcripts = _delegate(SalonRepository.search_transcripts)
+    search_transcripts_page = _delegate(SalonRepository.search_transcripts_page)
+    fuzzy_search_sessions = _delegate(SalonRepository.fuzzy_search_sessions)
+    fuzzy_search_taxonomy = _delegate(SalonRepository.fuzzy_search_taxonomy)
+    fuzzy_search_speakers = _delegate(SalonRepository.fuzzy_search_speakers)
+
+    # ── Taxonomy ──────────────────────────────────────────────────────
+
+    add_taxonomy_node = _delegate(SalonRepository.add_taxonomy_node)
+    get_taxonomy_nodes = _delegate(SalonRepository.get_taxonomy_nodes)
+    get_taxonomy_roots = _delegate(SalonRepository.get_taxonomy_roots)
+    search_taxonomy = _delegate(SalonRepository.search_taxonomy)
+    expand_taxonomy = _delegate(SalonRepository.expand_taxonomy)
+
+    @property
+    def taxonomy_version(self) -> int:
+        """Counter bumped by each taxonomy write made in this process."""
+        return _taxonomy_versions.get(self._engine.sync_engine, 0)
+
+    # ── Counts and statistics ─────────────────────────────────────────
+
+    count_sessions = _delegate(SalonRepository.count_sessions)
+    count_taxonomy_nodes = _delegate(SalonRepository.count_taxonomy_nodes)
+    refresh_stats = _delegate(SalonRepository.refresh_stats)
+    cached_stats = _delegate(SalonRepository.cached_stats)
+
+    async def compute_stats(self) -> ArchiveStats:
+        """Aggregate the archive, running the independent queries concurrently."""
+        statements = SalonRepository._stats_statements()
+        if self._bound is not None:
+            results = [await self._fetch_all(stmt) for stmt in statements.values()]
+        else:
+            results = await asyncio.gather(
+                *(self._fetch_all(stmt) for stmt in statements.values())
+            )
+        stats = ArchiveStats()
+        for name, rows in zip(statements, results):
+            SalonRepository._fill_stats(stats, name, rows)
+        return stats
+
+    async def _fetch_all(self, stmt: Any) -> list[Any]:
+        async with self._session() as s:
+            return list((await s.execute(stmt)).all())
@@ -0,0 +1,324 @@
+"""Asyncio transcription backends and pipeline for remote transcription APIs.
+
+A remote API is bound by request latency, not local CPU, so the async
+pipeline splits a recording into overlapping chunks (see
+:func:`~src.transcription.iter_wav_chunks`) and keeps up to
+``max_concurrency`` chunk requests in flight, retrying transient failures
+with exponential backoff under an optional requests-per-second limit.
+Chunk results are stitched back in order with the same boundary
+de-duplication as the synchronous streaming path.
+
+Existing synchronous backends (e.g. ``MockBackend``) plug in through
+:class:`SyncBackendAdapter`, which runs them in a worker thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import json
+import time
+import urllib.error
+import urllib.request
+import wave
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, replace
+from typing import Any, TypeVar
+
+from .transcription import (
+    AudioChunk,
+    ChunkedTranscriptionBackend,
+    Segment,
+    TranscriptionBackend,
+    TranscriptionResult,
+    TranscriptionStatus,
+    iter_wav_chunks,
+    stitch_segments,
+)
+
+T = TypeVar("T")
+
+
+class TransientBackendError(Exception):
+    """A failure worth retrying: throttling, timeouts, or 5xx responses."""
+
+
+# ── Backends ──────────────────────────────────────────────────────────
+
+
+class AsyncTranscriptionBackend(ABC):
+    """Abstract base for asyncio-native transcription backends."""
+
+    version: str = "1"
+
+    # True when transcribe_chunk() is implemented and the pipeline may fan out chunks
+    supports_chunks: bool = False
+
+    def cache_identity(self) -> str:
+        cls = type(self)
+        return f"{cls.__module__}.{cls.__qualname__}"
+
+    @abstractmethod
+    async def transcribe(self, audio_path: str) -> list[Segment]:
+        """Convert an audio file to a list of time-aligned segments."""
+        ...
+
+    async def transcribe_chunk(self, chunk: AudioChunk) -> list[Segment]:
+        """Transcribe one chunk; segment times are relative to ``chunk.start_seconds``."""
+        raise NotImplementedError(f"{type(self).__name__} does not transcribe chunks")
+
+
+class SyncBackendAdapter(AsyncTranscriptionBackend):
+    """Run a synchronous TranscriptionBackend from async code via a worker thread."""
+
+    def __init__(self, backend: TranscriptionBackend) -> None:
+        self.backend = backend
+        self.supports_chunks = isinstance(backend, ChunkedTranscriptionBackend)
+        self.version = backend.version
+
+    def cache_identity(self) -> str:
+        return self.backend.cache_identity()
+
+    async def transcribe(self, audio_path: str) -> list[Segment]:
+        return await asyncio.to_thread(self.backend.transcribe, audio_path)
+
+    async def transcribe_chunk(self, chunk: AudioChunk) -> list[Segment]:
+        if not isinstance(self.backend, ChunkedTranscriptionBackend):
+            return await super().transcribe_chunk(chunk)
+        return await asyncio.to_thread(self.backend.transcribe_chunk, chunk)
+
+
+def _chunk_wav_bytes(chunk: AudioChunk) -> bytes:
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wav:
+        wav.setnchannels(chunk.channels)
+        wav.setsampwidth(chunk.sample_width)
+        wav.setframerate(chunk.sample_rate)
+        wav.writeframes(chunk.frames)
+    return buf.getvalue()
+
+
+class HTTPTranscriptionBackend(AsyncTranscriptionBackend):
+    """Send WAV chunks to a remote transcription endpoint over HTTP.
+
+    Each chunk is POSTed as ``audio/wav`` with ``X-Chunk-Index``,
+    ``X-Chunk-Start`` and ``X-Language`` headers. The endpoint replies with
+    ``{"segments": [{"speaker", "text", "start_seconds", "end_seconds",
+    "confidence"}]}`` timed relative to the chunk. 429 and 5xx responses
+    and connection errors raise :class:`TransientBackendError`.
+    """
+
+    supports_chunks = True
+
+    def __init__(
+        self,
+        endpoint: str,
+        api_key: str | None = None,
+        language: str = "en",
+        timeout: float = 120.0,
+    ) -> None:
+        self.endpoint = endpoint
+        self.api_key = api_key
+        self.language = language
+        self.timeout = timeout
+
+    def cache_identity(self) -> str:
+        return f"{super().cache_identity()}:{self.endpoint}"
+
+    async def transcribe(self, audio_path: str) -> list[Segment]:
+        """Transcribe chunk by chunk, one request at a time."""
+        results = [
+            (replace(chunk, frames=b""), await self.transcribe_chunk(chunk))
+            for chunk in iter_wav_chunks(audio_path)
+        ]
+        return list(stitch_segments(results))
+
+    async def transcribe_chunk(self, chunk: AudioChunk) -> list[Segment]:
+        return await asyncio.to_thread(self._post, chunk)
+
+    def _post(self, chunk: AudioChunk) -> list[Segment]:
+        headers = {
+            "Content-Type": "audio/wav",
+            "X-Chunk-Index": str(chunk.index),
+            "X-Chunk-Start": str(chunk.start_seconds),
+            "X-Language": self.language,
+        }
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        request = urllib.request.Request(
+            self.endpoint, data=_chunk_wav_bytes(chunk), headers=headers, method="POST"
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                payload = json.loads(response.read())
+        except urllib.error.HTTPError as exc:
+            if exc.code == 429 or exc.code >= 500:
+                raise TransientBackendError(f"HTTP {exc.code} for chunk {chunk.index}") from exc
+            raise RuntimeError(f"HTTP {exc.code} for chunk {chunk.index}") from exc
+        except (urllib.error.URLError, TimeoutError) as exc:
+            raise TransientBackendError(f"{exc} for chunk {chunk.index}") from exc
+        return [Segment.from_dict(d) for d in payload["segments"]]
+
+
+# ── Flow control ──────────────────────────────────────────────────────
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff: ``base_delay * 2**attempt``, capped at ``max_delay``."""
+
+    attempts: int = 4
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    retry_on: tuple[type[BaseException], ...] = (TransientBackendError,)
+
+    def delay(self, attempt: int) -> float:
+        return min(self.base_delay * 2**attempt, self.max_delay)
+
+
+class RateLimiter:
+    """Space request starts at least ``1 / rate`` seconds apart."""
+
+    def __init__(self, rate: float) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.interval = 1.0 / rate
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+# ── Pipeline ──────────────────────────────────────────────────────────
+
+
+class AsyncTranscriptionPipeline:
+    """Concurrent, rate-limited transcription against an async backend."""
+
+    def __init__(
+        self,
+        backend: AsyncTranscriptionBackend | TranscriptionBackend,
+        language: str = "en",
+        max_concurrency: int = 8,
+        retry: RetryPolicy | None = None,
+        rate_limit: float | None = None,
+        chunk_seconds: float = 30.0,
+        overlap_seconds: float = 2.0,
+    ) -> None:
+        if isinstance(backend, TranscriptionBackend):
+            backend = SyncBackendAdapter(backend)
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.backend = backend
+        self.language = language
+        self.max_concurrency = max_concurrency
+        self.retry = retry or RetryPolicy()
+        self.rate_limit = rate_limit
+        self.chunk_seconds = chunk_seconds
+        self.overlap_seconds = overlap_seconds
+
+    async def process_audio(self, session_id: str, audio_path: str) -> TranscriptionResult:
+        """Transcribe one file, fanning chunk requests out when the backend supports it."""
+        flow = _Flow(self)
+        result = TranscriptionResult(
+            session_id=session_id,
+            status=TranscriptionStatus.PROCESSING,
+            language=self.language,
+            audio_path=audio_path,
+        )
+        if self.backend.supports_chunks:
+            result.segments = await self._transcribe_chunks(flow, audio_path)
+        else:
+            result.segments = await flow.call(self.backend.transcribe, audio_path)
+        result.status = TranscriptionStatus.COMPLETED
+        return result
+
+    async def process_many(self, jobs: Iterable[tuple[str, str]]) -> list[TranscriptionResult]:
+        """Transcribe many files sharing one concurrency and rate budget.
+
+        Results come back in input order; a failing file is marked FAILED
+        with ``error`` set without affecting the others.
+        """
+        flow = _Flow(self)
+
+        async def run(session_id: str, audio_path: str) -> TranscriptionResult:
+            result = TranscriptionResult(
+                session_id=session_id,
+                status=TranscriptionStatus.PROCESSING,
+                language=self.language,
+                audio_path=audio_path,
+            )
+            try:
+                if self.backend.supports_chunks:
+                    result.segments = await self._transcribe_chunks(flow, audio_path)
+                else:
+                    result.segments = await flow.call(self.backend.transcribe, audio_path)
+                result.status = TranscriptionStatus.COMPLETED
+            except Exception as exc:  # noqa: BLE001 - any backend error is reported on the result
+                result.status = TranscriptionStatus.FAILED
+                result.error = f"{type(exc).__name__}: {exc}"
+            return result
+
+        return list(await asyncio.gather(*(run(sid, path) for sid, path in jobs)))
+
+    def run(self, session_id: str, audio_path: str) -> TranscriptionResult:
+        """Blocking wrapper around :meth:`process_audio` for synchronous callers."""
+        return asyncio.run(self.process_audio(session_id, audio_path))
+
+    async def _transcribe_chunks(self, flow: _Flow, audio_path: str) -> list[Segment]:
+        tasks: list[asyncio.Task[list[Segment]]] = []
+        chunks: list[AudioChunk] = []
+        try:
+            for chunk in iter_wav_chunks(audio_path, self.chunk_seconds, self.overlap_seconds):
+                # Don't read further ahead than the requests we can have in flight
+                await flow.slots.acquire()
+                tasks.append(asyncio.create_task(flow.call_chunk(self.backend, chunk)))
+                chunks.append(replace(chunk, frames=b""))
+            results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return list(stitch_segments(zip(chunks, results)))
+
+
+class _Flow:
+    """Per-run concurrency slots, rate limiter, and retry loop."""
+
+    def __init__(self, pipeline: AsyncTranscriptionPipeline) -> None:
+        self.slots = asyncio.Semaphore(pipeline.max_concurrency)
+        self.retry = pipeline.retry
+        self.limiter = RateLimiter(pipeline.rate_limit) if pipeline.rate_limit else None
+
+    async def call_chunk(
+        self, backend: AsyncTranscriptionBackend, chunk: AudioChunk
+    ) -> list[Segment]:
+        """Run one chunk request in an already-acquired slot."""
+        try:
+            return await self._with_retry(backend.transcribe_chunk, chunk)
+        finally:
+            self.slots.release()
+
+    async def call(self, fn: Callable[..., Awaitable[T]], *args: Any) -> T:
+        async with self.slots:
+            return await self._with_retry(fn, *args)
+
+    async def _with_retry(self, fn: Callable[..., Awaitable[T]], *args: Any) -> T:
+        attempt = 0
+        while True:
+            if self.limiter is not None:
+                await self.limiter.acquire()
+            try:
+                return await fn(*args)
+            except self.retry.retry_on:
+                attempt += 1
+                if attempt >= self.retry.attempts:
+                    raise
+                await asyncio.sleep(self.retry.delay(attempt - 1))
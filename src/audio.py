@@ -0,0 +1,329 @@
+"""Memory-mapped WAV decoding and energy-based voice-activity detection.
+
+Salon recordings carry long stretches of silence: breaks, set-up, pauses
+between speakers. :class:`VoiceActivityBackend` wraps any transcription
+backend and only hands it the speech regions of a WAV file, so silence is
+never sent for transcription.
+
+:func:`read_wav` maps the file's sample data straight into a NumPy array
+without reading it. :func:`detect_speech` measures the energy of short
+frames a block at a time, thresholds it, and turns the voiced frames into
+regions with vectorized run-length operations: short gaps are bridged,
+short blips dropped, and each region padded so word onsets are not
+clipped. Regions reach chunked backends as :class:`~src.transcription.AudioChunk`
+objects at their absolute offsets, and other backends as temporary WAV
+files whose segments are shifted back, so segment times always refer to
+the original recording.
+
+Requires NumPy (the ``audio`` extra).
+"""
+
+from __future__ import annotations
+
+import os
+import struct
+import tempfile
+import wave
+from collections.abc import Iterator
+from dataclasses import dataclass, field, replace
+
+import numpy as np
+
+from .transcription import (
+    AudioChunk,
+    ChunkedTranscriptionBackend,
+    Segment,
+    TranscriptionBackend,
+    _shift,
+    stitch_segments,
+)
+
+_WAVE_FORMAT_PCM = 1
+_WAVE_FORMAT_IEEE_FLOAT = 3
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# Frames per block when computing energies, bounding memory for long recordings
+_ENERGY_BLOCK = 8192
+_ENERGY_FLOOR = 1e-12  # -120 dBFS
+
+
+@dataclass
+class WavAudio:
+    """A WAV file's samples as a read-only ``(frames, channels)`` memory map."""
+
+    samples: np.ndarray
+    sample_rate: int
+    sample_width: int
+    is_float: bool = False
+
+    @property
+    def channels(self) -> int:
+        return self.samples.shape[1]
+
+    @property
+    def frames(self) -> int:
+        return self.samples.shape[0]
+
+    @property
+    def duration(self) -> float:
+        return self.frames / self.sample_rate
+
+    def full_scale(self) -> float:
+        """Magnitude of a full-scale sample, for normalizing to ``[-1, 1]``."""
+        return 1.0 if self.is_float else float(1 << (8 * self.sample_width - 1))
+
+    @property
+    def pcm_width(self) -> int:
+        """Bytes per sample of :meth:`pcm_bytes` (float audio is converted to 16-bit)."""
+        return 2 if self.is_float else self.sample_width
+
+    def pcm_bytes(self, start: int, end: int) -> bytes:
+        """Integer PCM data for frames ``[start, end)``, as a WAV writer expects it."""
+        block = self.samples[start:end]
+        if self.is_float:
+            return (np.clip(block, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+        return block.tobytes()
+
+
+def read_wav(path: str | os.PathLike[str]) -> WavAudio:
+    """Memory-map the sample data of a PCM (8/16/32-bit) or 32-bit float WAV file."""
+    with open(path, "rb") as f:
+        riff, _, kind = struct.unpack("<4sI4s", f.read(12))
+        if riff != b"RIFF" or kind != b"WAVE":
+            raise ValueError(f"{path} is not a RIFF/WAVE file")
+        fmt: tuple[int, int, int, int] | None = None
+        while header := f.read(8):
+            if len(header) < 8:
+                break
+            chunk_id, size = struct.unpack("<4sI", header)
+            if chunk_id == b"fmt ":
+                body = f.read(size)
+                tag, channels, rate = struct.unpack("<HHI", body[:8])
+                bits = struct.unpack("<H", body[14:16])[0]
+                if tag == _WAVE_FORMAT_EXTENSIBLE and size >= 26:
+                    tag = struct.unpack("<H", body[24:26])[0]
+                fmt = (tag, channels, rate, bits)
+                f.seek(size % 2, os.SEEK_CUR)
+            elif chunk_id == b"data":
+                if fmt is None:
+                    raise ValueError(f"{path}: data chunk before fmt chunk")
+                return _map_samples(path, f.tell(), size, *fmt)
+            else:
+                f.seek(size + size % 2, os.SEEK_CUR)
+    raise ValueError(f"{path} has no data chunk")
+
+
+def _map_samples(
+    path: str | os.PathLike[str],
+    offset: int,
+    size: int,
+    tag: int,
+    channels: int,
+    rate: int,
+    bits: int,
+) -> WavAudio:
+    if tag == _WAVE_FORMAT_PCM and bits in (8, 16, 32):
+        dtype = np.dtype({8: "u1", 16: "<i2", 32: "<i4"}[bits])
+    elif tag == _WAVE_FORMAT_IEEE_FLOAT and bits == 32:
+        dtype = np.dtype("<f4")
+    else:
+        raise ValueError(f"{path}: unsupported WAV encoding (format {tag}, {bits}-bit)")
+    frames = min(size, os.path.getsize(path) - offset) // (dtype.itemsize * channels)
+    if frames == 0:
+        samples = np.zeros((0, channels), dtype=dtype)
+    else:
+        samples = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(frames, channels))
+    return WavAudio(samples, rate, dtype.itemsize, is_float=tag == _WAVE_FORMAT_IEEE_FLOAT)
+
+
+# ── Voice-activity detection ──────────────────────────────────────────
+
+
+@dataclass(frozen=True)
+class VADConfig:
+    """Energy VAD settings.
+
+    A frame is voiced when its RMS level is above ``threshold_db`` dBFS.
+    Voiced runs closer than ``min_silence_seconds`` are joined, runs shorter
+    than ``min_speech_seconds`` dropped, and each region widened by
+    ``padding_seconds`` on both sides.
+    """
+
+    frame_seconds: float = 0.03
+    threshold_db: float = -45.0
+    min_speech_seconds: float = 0.25
+    min_silence_seconds: float = 0.5
+    padding_seconds: float = 0.2
+
+
+@dataclass(frozen=True)
+class SpeechRegion:
+    """A span of speech, in sample frames of the original recording."""
+
+    start: int
+    end: int
+    sample_rate: int = field(repr=False)
+
+    @property
+    def start_seconds(self) -> float:
+        return self.start / self.sample_rate
+
+    @property
+    def end_seconds(self) -> float:
+        return self.end / self.sample_rate
+
+    @property
+    def duration(self) -> float:
+        return (self.end - self.start) / self.sample_rate
+
+
+def frame_levels(audio: WavAudio, frame_seconds: float = 0.03) -> np.ndarray:
+    """RMS level in dBFS of each whole ``frame_seconds`` frame (channels pooled)."""
+    frame_len = max(1, round(frame_seconds * audio.sample_rate))
+    count = audio.frames // frame_len
+    levels = np.empty(count, dtype=np.float64)
+    scale = audio.full_scale() ** 2
+    for start in range(0, count, _ENERGY_BLOCK):
+        stop = min(count, start + _ENERGY_BLOCK)
+        x = np.asarray(audio.samples[start * frame_len : stop * frame_len], dtype=np.float64)
+        if audio.sample_width == 1 and not audio.is_float:
+            x -= 128.0  # 8-bit PCM is unsigned
+        x = x.reshape(stop - start, frame_len * audio.channels)
+        power = np.einsum("ij,ij->i", x, x) / x.shape[1] / scale
+        levels[start:stop] = 10.0 * np.log10(np.maximum(power, _ENERGY_FLOOR))
+    return levels
+
+
+def _merge_close(starts: np.ndarray, ends: np.ndarray, gap: int) -> tuple[np.ndarray, np.ndarray]:
+    """Join consecutive runs separated by fewer than ``gap`` units."""
+    if len(starts) < 2:
+        return starts, ends
+    keep_gap = starts[1:] - ends[:-1] >= gap
+    return starts[np.r_[True, keep_gap]], ends[np.r_[keep_gap, True]]
+
+
+def detect_speech(audio: WavAudio, config: VADConfig | None = None) -> list[SpeechRegion]:
+    """Speech regions of a recording, in order and non-overlapping."""
+    config = config or VADConfig()
+    frame_len = max(1, round(config.frame_seconds * audio.sample_rate))
+    voiced = frame_levels(audio, config.frame_seconds) > config.threshold_db
+    edges = np.diff(np.r_[0, voiced.view(np.int8), 0])
+    starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+    frames_per_second = audio.sample_rate / frame_len
+    starts, ends = _merge_close(
+        starts, ends, round(config.min_silence_seconds * frames_per_second)
+    )
+    long_enough = ends - starts >= round(config.min_speech_seconds * frames_per_second)
+    starts, ends = starts[long_enough] * frame_len, ends[long_enough] * frame_len
+
+    pad = round(config.padding_seconds * audio.sample_rate)
+    starts = np.maximum(starts - pad, 0)
+    ends = np.minimum(ends + pad, audio.frames)
+    starts, ends = _merge_close(starts, ends, 1)
+    return [
+        SpeechRegion(int(s), int(e), audio.sample_rate)
+        for s, e in zip(starts.tolist(), ends.tolist())
+    ]
+
+
+def iter_speech_chunks(
+    audio: WavAudio,
+    regions: list[SpeechRegion],
+    chunk_seconds: float = 30.0,
+    overlap_seconds: float = 2.0,
+) -> Iterator[AudioChunk]:
+    """Split speech regions into overlapping chunks at their absolute offsets.
+
+    Chunks overlap only within a region; the first and last chunk of each
+    region have no overlap on the outer side.
+    """
+    if overlap_seconds < 0 or overlap_seconds >= chunk_seconds:
+        raise ValueError("overlap_seconds must be >= 0 and smaller than chunk_seconds")
+    rate = audio.sample_rate
+    chunk_frames = max(int(chunk_seconds * rate), 1)
+    overlap_frames = int(overlap_seconds * rate)
+    index = 0
+    for region in regions:
+        pos = region.start
+        while True:
+            end = min(pos + chunk_frames, region.end)
+            last = end >= region.end
+            yield AudioChunk(
+                index=index,
+                start_seconds=pos / rate,
+                end_seconds=end / rate,
+                frames=audio.pcm_bytes(pos, end),
+                sample_rate=rate,
+                channels=audio.channels,
+                sample_width=audio.pcm_width,
+                overlap_before=overlap_frames / rate if pos > region.start else 0.0,
+                overlap_after=0.0 if last else overlap_frames / rate,
+            )
+            index += 1
+            if last:
+                break
+            pos = end - overlap_frames
+
+
+# ── Backend ───────────────────────────────────────────────────────────
+
+
+class VoiceActivityBackend(TranscriptionBackend):
+    """Transcribe only the speech regions of WAV files with another backend.
+
+    Chunked backends receive speech chunks directly; other backends are
+    called once per region on a temporary WAV file. Non-WAV input, and WAV
+    encodings :func:`read_wav` cannot map (such as 24-bit PCM), are passed
+    through unchanged.
+    """
+
+    def __init__(self, backend: TranscriptionBackend, config: VADConfig | None = None) -> None:
+        self.backend = backend
+        self.config = config or VADConfig()
+        self.version = backend.version
+
+    def cache_identity(self) -> str:
+        c = self.config
+        return (
+            f"{super().cache_identity()}:{self.backend.cache_identity()}:"
+            f"{c.frame_seconds}:{c.threshold_db}:{c.min_speech_seconds}:"
+            f"{c.min_silence_seconds}:{c.padding_seconds}"
+        )
+
+    def transcribe(self, audio_path: str) -> list[Segment]:
+        return list(self.stream(audio_path))
+
+    def stream(self, audio_path: str) -> Iterator[Segment]:
+        try:
+            audio = read_wav(audio_path) if audio_path.lower().endswith(".wav") else None
+        except ValueError:
+            audio = None
+        if audio is None:
+            yield from self.backend.stream(audio_path)
+            return
+        regions = detect_speech(audio, self.config)
+        backend = self.backend
+        if isinstance(backend, ChunkedTranscriptionBackend):
+            chunks = iter_speech_chunks(
+                audio, regions, backend.chunk_seconds, backend.overlap_seconds
+            )
+            yield from stitch_segments(
+                (replace(chunk, frames=b""), backend.transcribe_chunk(chunk)) for chunk in chunks
+            )
+            return
+        for region in regions:
+            for seg in self._transcribe_region(audio, region):
+                yield _shift(seg, region.start_seconds)
+
+    def _transcribe_region(self, audio: WavAudio, region: SpeechRegion) -> list[Segment]:
+        fd, path = tempfile.mkstemp(suffix=".wav")
+        try:
+            with os.fdopen(fd, "wb") as f, wave.open(f, "wb") as wav:
+                wav.setnchannels(audio.channels)
+                wav.setsampwidth(audio.pcm_width)
+                wav.setframerate(audio.sample_rate)
+                wav.writeframes(audio.pcm_bytes(region.start, region.end))
+            return self.backend.transcribe(path)
+        finally:
+            os.unlink(path)
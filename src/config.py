@@ -1,6 +1,7 @@
 """Settings from environment variables."""
 
 import os
+from typing import Any
 
 from koinonia_db.config import require_database_url
 
@@ -10,8 +11,37 @@ class Settings:
 
     DATABASE_URL: str = os.environ.get("DATABASE_URL", "")
     WHISPER_BACKEND: str = os.environ.get("WHISPER_BACKEND", "mock")  # mock, whisper_api
+    TRANSCRIPTION_WORKERS: int = int(os.environ.get("TRANSCRIPTION_WORKERS", "4"))
+    # Persistent transcript cache; empty disables it
+    TRANSCRIPTION_CACHE_DIR: str = os.environ.get("TRANSCRIPTION_CACHE_DIR", "")
+    TRANSCRIPTION_CACHE_MAX_MB: int = int(os.environ.get("TRANSCRIPTION_CACHE_MAX_MB", "1024"))
+    # Durable job queue for `salon ingest --queue/--resume`
+    INGEST_QUEUE_DIR: str = os.environ.get("SALON_INGEST_QUEUE_DIR", "data/ingest-queue")
+
+    # Connection pool tuning for the shared per-URL engine
+    DB_POOL_SIZE: int = int(os.environ.get("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.environ.get("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_PRE_PING: bool = os.environ.get("DB_POOL_PRE_PING", "1").lower() not in (
+        "0",
+        "false",
+        "no",
+    )
+    DB_POOL_RECYCLE: int = int(os.environ.get("DB_POOL_RECYCLE", "1800"))  # seconds
+
+    # Offline search index built by `salon index build`
+    SEARCH_INDEX_DIR: str = os.environ.get("SALON_INDEX_DIR", "data/search-index")
 
     @classmethod
     def require_db(cls) -> str:
         """Return DATABASE_URL or raise if unset. Converts to psycopg driver."""
         return require_database_url()
+
+    @classmethod
+    def engine_options(cls) -> dict[str, Any]:
+        """Return create_engine() pool keyword arguments from the settings above."""
+        return {
+            "pool_size": cls.DB_POOL_SIZE,
+            "max_overflow": cls.DB_MAX_OVERFLOW,
+            "pool_pre_ping": cls.DB_POOL_PRE_PING,
+            "pool_recycle": cls.DB_POOL_RECYCLE,
+        }
@@ -5,14 +5,27 @@
   data/sample-session.md   — first session rendered as markdown
 
 Reads seed JSON directly (no database required).
+
+``export_archive`` renders a whole archive (every session as markdown and
+JSON) for the published site, skipping sessions whose content hash is
+unchanged since the previous run.
 """
+
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import re
+import tempfile
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import ExitStack
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from .export import export_session_markdown
+from .export import export_session_json, export_session_markdown
 
 SEED_DIR = Path(__file__).parent.parent.parent / "koinonia-db" / "seed"
 
@@ -27,6 +40,22 @@ def load_seed_sessions(seed_dir: Path | None = None) -> list[dict[str, Any]]:
     return data.get("sessions", [])
 
 
+def load_session_files(paths: list[Path]) -> list[dict[str, Any]]:
+    """Load sessions from exported JSON files.
+
+    Each file may hold a single session dict (as written by ``salon export
+    --format json``) or a seed-style ``{"sessions": [...]}`` document.
+    """
+    sessions: list[dict[str, Any]] = []
+    for path in paths:
+        data = json.loads(Path(path).read_text())
+        if isinstance(data, dict) and "sessions" in data:
+            sessions.extend(data["sessions"])
+        else:
+            sessions.append(data)
+    return sessions
+
+
 def build_sessions_index(sessions: list[dict[str, Any]]) -> dict[str, Any]:
     """Build a summary index from session data."""
     formats = sorted({s.get("format", "unknown") for s in sessions})
@@ -91,6 +120,154 @@ def export_all(
     return outputs
 
 
+# ── Archive export ────────────────────────────────────────────────────
+
+MANIFEST_FILE = "manifest.json"
+MANIFEST_VERSION = 1
+ARCHIVE_FORMATS = {"markdown": ".md", "json": ".json"}
+
+
+@dataclass
+class ArchiveExportReport:
+    """What one ``export_archive`` run did."""
+
+    written: list[Path] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    removed: list[Path] = field(default_factory=list)
+
+
+def session_file_stem(session: dict[str, Any]) -> str:
+    """File name stem for a session: ``<YYYY-MM-DD>-<title-slug>``."""
+    date = str(session.get("date") or "undated")[:10]
+    slug = re.sub(r"[^a-z0-9]+", "-", session.get("title", "").lower()).strip("-")
+    return f"{date}-{slug or 'untitled'}"
+
+
+def session_content_hash(session: dict[str, Any]) -> str:
+    """Stable SHA-256 of a session dict's content."""
+    payload = json.dumps(session, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _render_session(session: dict[str, Any], formats: tuple[str, ...]) -> dict[str, str]:
+    rendered: dict[str, str] = {}
+    if "markdown" in formats:
+        rendered["markdown"] = export_session_markdown(session)
+    if "json" in formats:
+        rendered["json"] = export_session_json(session) + "\n"
+    return rendered
+
+
+def _atomic_write(path: Path, text: str) -> None:
+    """Write via a temp file in the same directory and rename over ``path``."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _load_manifest(out_dir: Path) -> dict[str, Any]:
+    path = out_dir / MANIFEST_FILE
+    if not path.exists():
+        return {}
+    manifest = json.loads(path.read_text())
+    return manifest if manifest.get("version") == MANIFEST_VERSION else {}
+
+
+def export_archive(
+    sessions: Iterable[dict[str, Any]],
+    out_dir: Path,
+    workers: int = 1,
+    formats: tuple[str, ...] = ("markdown", "json"),
+    force: bool = False,
+) -> ArchiveExportReport:
+    """Render every session into ``out_dir``, rebuilding only what changed.
+
+    A ``manifest.json`` records each session's content hash and files.
+    Sessions whose hash and format set match the previous run (and whose
+    files still exist) are skipped; files for sessions no longer present
+    are deleted. Changed sessions are rendered across ``workers``
+    processes and every file is written atomically.
+
+    ``sessions`` is consumed as a stream: each session is hashed and
+    handed to a renderer as it arrives, with at most ``2 * workers``
+    rendering at once, so memory stays flat however large the archive.
+    """
+    unknown = set(formats) - set(ARCHIVE_FORMATS)
+    if unknown:
+        raise ValueError(f"Unknown archive format(s): {', '.join(sorted(unknown))}")
+    out_dir.mkdir(parents=True, exist_ok=True)
+    previous = _load_manifest(out_dir)
+    same_formats = previous.get("formats") == list(formats)
+    old_entries: dict[str, Any] = previous.get("sessions", {})
+
+    report = ArchiveExportReport()
+    entries: dict[str, Any] = {}
+    in_flight: dict[Future[dict[str, str]], str] = {}
+
+    def collect(limit: int) -> None:
+        while len(in_flight) > limit:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                stem = in_flight.pop(future)
+                report.written.extend(_write_outputs(out_dir, stem, future.result()))
+
+    with ExitStack() as stack:
+        pool: ProcessPoolExecutor | None = None
+        for session in sessions:
+            stem = base = session_file_stem(session)
+            n = 2
+            while stem in entries:
+                stem = f"{base}-{n}"
+                n += 1
+            digest = session_content_hash(session)
+            files = [stem + ARCHIVE_FORMATS[f] for f in formats]
+            entries[stem] = {"hash": digest, "files": files}
+            old = old_entries.get(stem)
+            if (
+                not force
+                and same_formats
+                and old is not None
+                and old["hash"] == digest
+                and all((out_dir / f).exists() for f in files)
+            ):
+                report.skipped.append(stem)
+            elif workers > 1:
+                if pool is None:
+                    pool = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+                collect(2 * workers - 1)
+                in_flight[pool.submit(_render_session, session, formats)] = stem
+            else:
+                outputs = _render_session(session, formats)
+                report.written.extend(_write_outputs(out_dir, stem, outputs))
+        collect(0)
+
+    current_files = {f for entry in entries.values() for f in entry["files"]}
+    for entry in old_entries.values():
+        for name in entry["files"]:
+            path = out_dir / name
+            if name not in current_files and path.exists():
+                path.unlink()
+                report.removed.append(path)
+
+    manifest = {"version": MANIFEST_VERSION, "formats": list(formats), "sessions": entries}
+    _atomic_write(out_dir / MANIFEST_FILE, json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+    return report
+
+
+def _write_outputs(out_dir: Path, stem: str, outputs: dict[str, str]) -> list[Path]:
+    paths = []
+    for fmt, text in outputs.items():
+        path = out_dir / (stem + ARCHIVE_FORMATS[fmt])
+        _atomic_write(path, text)
+        paths.append(path)
+    return paths
+
+
 def main() -> None:
     """CLI entry point for data export."""
     paths = export_all()
@@ -0,0 +1,208 @@
+"""Speaker post-processing for transcripts: smoothing, merging, and metrics.
+
+Backends tend to emit many short fragments and spurious one-word speaker
+changes. Working on the columns of a :class:`~src.transcription.SegmentStore`
+as NumPy arrays:
+
+- :func:`smooth_speakers` relabels a short segment sandwiched between two
+  segments of the same other speaker (``A B A`` becomes ``A A A``);
+- :func:`merge_segments` joins consecutive same-speaker segments separated
+  by at most a gap threshold into one segment, keeping the
+  duration-weighted confidence;
+- :func:`speaker_metrics` computes talk time, turn counts, and the
+  speaker-by-speaker overlap matrix in one pass over the transcript's
+  elementary time intervals.
+
+:func:`clean_result` applies smoothing then merging to a
+``TranscriptionResult``. Requires NumPy (the ``audio`` extra).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, replace
+from datetime import timedelta
+from itertools import pairwise
+from typing import Any
+
+import numpy as np
+
+from .transcription import Segment, SegmentStore, TranscriptionResult
+
+DEFAULT_MAX_GAP_SECONDS = 1.0
+DEFAULT_MIN_FLIP_SECONDS = 1.0
+
+
+@dataclass
+class _Columns:
+    """A transcript as parallel arrays, in start-time order."""
+
+    starts: np.ndarray
+    ends: np.ndarray
+    confidence: np.ndarray
+    speaker_ids: np.ndarray
+    speakers: list[str]
+    texts: list[str]
+
+    @classmethod
+    def of(cls, segments: SegmentStore | Iterable[Segment]) -> _Columns:
+        store = segments if isinstance(segments, SegmentStore) else SegmentStore(segments)
+        starts, ends, confidence, speaker_ids = (
+            np.frombuffer(column, dtype=dtype)
+            for column, dtype in zip(
+                store.columns(), (np.float64, np.float64, np.float64, np.uint32)
+            )
+        )
+        texts = store.texts()
+        order = np.argsort(starts, kind="stable")
+        if np.any(order != np.arange(len(order))):
+            starts, ends, confidence, speaker_ids = (
+                a[order] for a in (starts, ends, confidence, speaker_ids)
+            )
+            texts = [texts[i] for i in order]
+        return cls(starts, ends, confidence, speaker_ids.astype(np.intp), store.speakers, texts)
+
+    def to_store(self) -> SegmentStore:
+        return SegmentStore(
+            Segment(
+                speaker=self.speakers[sid],
+                text=text,
+                start_time=timedelta(seconds=start),
+                end_time=timedelta(seconds=end),
+                confidence=conf,
+            )
+            for sid, text, start, end, conf in zip(
+                self.speaker_ids.tolist(),
+                self.texts,
+                self.starts.tolist(),
+                self.ends.tolist(),
+                self.confidence.tolist(),
+            )
+        )
+
+
+def smooth_speakers(
+    segments: SegmentStore | Iterable[Segment],
+    min_flip_seconds: float = DEFAULT_MIN_FLIP_SECONDS,
+) -> SegmentStore:
+    """Relabel segments shorter than ``min_flip_seconds`` flanked by one other speaker."""
+    cols = _Columns.of(segments)
+    _smooth(cols, min_flip_seconds)
+    return cols.to_store()
+
+
+def _smooth(cols: _Columns, min_flip_seconds: float) -> None:
+    ids = cols.speaker_ids
+    if len(ids) < 3:
+        return
+    before, middle, after = ids[:-2], ids[1:-1], ids[2:]
+    short = (cols.ends[1:-1] - cols.starts[1:-1]) < min_flip_seconds
+    flip = (before == after) & (middle != before) & short
+    # decided from the original labels, so alternating runs are not chained
+    cols.speaker_ids = ids.copy()
+    cols.speaker_ids[1:-1][flip] = before[flip]
+
+
+def merge_segments(
+    segments: SegmentStore | Iterable[Segment],
+    max_gap_seconds: float = DEFAULT_MAX_GAP_SECONDS,
+) -> SegmentStore:
+    """Join consecutive same-speaker segments whose gap is at most ``max_gap_seconds``."""
+    cols = _Columns.of(segments)
+    return _merge(cols, max_gap_seconds).to_store()
+
+
+def _merge(cols: _Columns, max_gap_seconds: float) -> _Columns:
+    n = len(cols.starts)
+    if n < 2:
+        return cols
+    ids = cols.speaker_ids
+    gap = cols.starts[1:] - cols.ends[:-1]
+    boundary = np.r_[True, (ids[1:] != ids[:-1]) | (gap > max_gap_seconds)]
+    first = np.flatnonzero(boundary)
+    durations = np.maximum(cols.ends - cols.starts, 0.0)
+    weight = np.add.reduceat(durations, first)
+    weighted = np.add.reduceat(cols.confidence * durations, first)
+    plain = np.add.reduceat(cols.confidence, first) / np.diff(np.r_[first, n])
+    confidence = np.divide(weighted, weight, out=plain, where=weight > 0)
+    bounds = np.r_[first, n].tolist()
+    texts = [" ".join(cols.texts[a:b]) for a, b in pairwise(bounds)]
+    return _Columns(
+        starts=cols.starts[first],
+        ends=np.maximum.reduceat(cols.ends, first),
+        confidence=confidence,
+        speaker_ids=ids[first],
+        speakers=cols.speakers,
+        texts=texts,
+    )
+
+
+def clean_result(
+    result: TranscriptionResult,
+    max_gap_seconds: float = DEFAULT_MAX_GAP_SECONDS,
+    min_flip_seconds: float = DEFAULT_MIN_FLIP_SECONDS,
+) -> TranscriptionResult:
+    """A copy of ``result`` with speaker flips smoothed and fragments merged."""
+    cols = _Columns.of(result.segments)
+    _smooth(cols, min_flip_seconds)
+    return replace(result, segments=_merge(cols, max_gap_seconds).to_store())
+
+
+# ── Metrics ───────────────────────────────────────────────────────────
+
+
+@dataclass
+class SpeakerMetrics:
+    """Per-speaker figures for one transcript.
+
+    ``talk_seconds[i]`` sums speaker ``i``'s segment durations;
+    ``turns[i]`` counts the times the floor passes to them; and
+    ``overlap_seconds[i, j]`` is how long ``i`` and ``j`` speak at the same
+    time (the diagonal is ``i``'s talk time with their own overlapping
+    segments counted once).
+    """
+
+    speakers: list[str]
+    talk_seconds: np.ndarray
+    turns: np.ndarray
+    overlap_seconds: np.ndarray
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        """JSON-ready ``{speaker: {talk_seconds, turns, overlap_seconds: {other: s}}}``."""
+        return {
+            name: {
+                "talk_seconds": float(self.talk_seconds[i]),
+                "turns": int(self.turns[i]),
+                "overlap_seconds": {
+                    other: float(self.overlap_seconds[i, j])
+                    for j, other in enumerate(self.speakers)
+                    if j != i and self.overlap_seconds[i, j] > 0
+                },
+            }
+            for i, name in enumerate(self.speakers)
+        }
+
+
+def speaker_metrics(segments: SegmentStore | Iterable[Segment]) -> SpeakerMetrics:
+    """Talk time, turns, and pairwise overlap for every speaker."""
+    cols = _Columns.of(segments)
+    k = len(cols.speakers)
+    ids = cols.speaker_ids
+    if len(ids) == 0:
+        zeros = np.zeros(k)
+        return SpeakerMetrics(cols.speakers, zeros, zeros.astype(np.intp), np.zeros((k, k)))
+
+    durations = np.maximum(cols.ends - cols.starts, 0.0)
+    talk = np.bincount(ids, weights=durations, minlength=k)
+    new_turn = np.r_[True, ids[1:] != ids[:-1]]
+    turns = np.bincount(ids[new_turn], minlength=k)
+
+    # Elementary intervals between consecutive boundaries; a speaker is
+    # active in one if any of their segments covers it
+    edges = np.unique(np.r_[cols.starts, cols.ends])
+    delta = np.zeros((k, len(edges)), dtype=np.int64)
+    np.add.at(delta, (ids, np.searchsorted(edges, cols.starts)), 1)
+    np.add.at(delta, (ids, np.searchsorted(edges, cols.ends)), -1)
+    active = (np.cumsum(delta, axis=1)[:, :-1] > 0).astype(np.float64)
+    overlap = (active * np.diff(edges)) @ active.T
+    return SpeakerMetrics(cols.speakers, talk, turns, overlap)
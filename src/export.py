@@ -1,10 +1,19 @@
-"""Export salon session data in markdown, JSON, and YAML formats."""
+"""Export salon session data in markdown, JSON, and YAML formats.
+
+The ``write_*`` functions stream a session to a text file object. Their
+``segments`` argument may be any iterable (for example rows fetched from
+a server-side cursor), so a transcript is written as it is read rather
+than assembled in memory first.
+"""
 
 from __future__ import annotations
 
+import io
 import json
+from collections.abc import Iterable
 from datetime import datetime
-from typing import Any
+from itertools import chain
+from typing import Any, TextIO
 
 
 def export_session_json(session_data: dict[str, Any]) -> str:
@@ -14,29 +23,83 @@ def export_session_json(session_data: dict[str, Any]) -> str:
 
 def export_session_markdown(session_data: dict[str, Any]) -> str:
     """Render a session data dict as a human-readable markdown document."""
-    md = f"# {session_data['title']}\n\n"
-    md += f"**Date:** {session_data['date']}\n"
-    md += f"**Format:** {session_data['format']}\n"
+    out = io.StringIO()
+    write_session_markdown(session_data, out)
+    return out.getvalue()
+
+
+def _segments_of(session_data: dict[str, Any], segments: Iterable[Any] | None) -> Iterable[Any]:
+    return (session_data.get("segments") or []) if segments is None else segments
+
+
+def write_session_markdown(
+    session_data: dict[str, Any],
+    out: TextIO,
+    segments: Iterable[Any] | None = None,
+) -> None:
+    """Write a session as markdown to ``out``, one transcript line at a time.
+
+    ``segments`` (ORM rows or dicts) overrides ``session_data["segments"]``.
+    """
+    out.write(f"# {session_data['title']}\n\n")
+    out.write(f"**Date:** {session_data['date']}\n")
+    out.write(f"**Format:** {session_data['format']}\n")
     if session_data.get("facilitator"):
-        md += f"**Facilitator:** {session_data['facilitator']}\n"
-    md += f"**Tags:** {', '.join(session_data.get('organ_tags', []))}\n\n"
+        out.write(f"**Facilitator:** {session_data['facilitator']}\n")
+    out.write(f"**Tags:** {', '.join(session_data.get('organ_tags', []))}\n\n")
 
     if session_data.get("notes"):
-        md += f"## Notes\n\n{session_data['notes']}\n\n"
+        out.write(f"## Notes\n\n{session_data['notes']}\n\n")
 
     if session_data.get("participants"):
-        md += "## Participants\n\n"
-        for p in session_data["participants"]:
-            md += f"- {p['name']} ({p['role']})\n"
-        md += "\n"
-
-    if session_data.get("segments"):
-        md += "## Transcript\n\n"
-        for seg in session_data["segments"]:
+        out.write("## Participants\n\n")
+        out.writelines(f"- {p['name']} ({p['role']})\n" for p in session_data["participants"])
+        out.write("\n")
+
+    it = iter(_segments_of(session_data, segments))
+    first = next(it, None)
+    if first is not None:
+        out.write("## Transcript\n\n")
+        for seg in map(segment_to_dict, chain([first], it)):
             start = format_time(seg["start_seconds"])
-            md += f"**[{start}] {seg['speaker']}:** {seg['text']}\n\n"
+            out.write(f"**[{start}] {seg['speaker']}:** {seg['text']}\n\n")
+
+
+def write_session_json(
+    session_data: dict[str, Any],
+    out: TextIO,
+    segments: Iterable[Any] | None = None,
+) -> None:
+    """Write a session as one JSON object, streaming the ``segments`` array.
+
+    Session fields are indented like :func:`export_session_json`; each
+    segment is written as a single line as soon as it is read.
+    """
+    header = {k: v for k, v in session_data.items() if k != "segments"}
+    out.write("{\n")
+    for key, value in header.items():
+        body = json.dumps(value, indent=2, default=str).replace("\n", "\n  ")
+        out.write(f"  {json.dumps(key)}: {body},\n")
+    out.write('  "segments": [')
+    sep = "\n    "
+    for seg in _segments_of(session_data, segments):
+        out.write(sep + json.dumps(segment_to_dict(seg), default=str))
+        sep = ",\n    "
+    out.write("\n  ]\n}\n" if sep != "\n    " else "]\n}\n")
 
-    return md
+
+def write_session_jsonl(
+    session_data: dict[str, Any],
+    out: TextIO,
+    segments: Iterable[Any] | None = None,
+) -> None:
+    """Write a session as JSON Lines: a ``session`` record, then one ``segment`` record each."""
+    header = {k: v for k, v in session_data.items() if k != "segments"}
+    out.write(json.dumps({"type": "session", **header}, default=str) + "\n")
+    out.writelines(
+        json.dumps({"type": "segment", **segment_to_dict(seg)}, default=str) + "\n"
+        for seg in _segments_of(session_data, segments)
+    )
 
 
 def format_time(seconds: float) -> str:
@@ -48,6 +111,22 @@ def format_time(seconds: float) -> str:
     return f"{m}:{s:02d}"
 
 
+def parse_time(value: str) -> float:
+    """Parse an H:MM:SS, M:SS or plain seconds string (the inverse of :func:`format_time`)."""
+    parts = value.strip().split(":")
+    try:
+        if len(parts) > 3:
+            raise ValueError
+        seconds = 0.0
+        for part in parts:
+            seconds = seconds * 60 + float(part)
+    except ValueError:
+        raise ValueError(f"invalid time {value!r}; expected H:MM:SS, M:SS or seconds") from None
+    if seconds < 0:
+        raise ValueError(f"invalid time {value!r}; must not be negative")
+    return seconds
+
+
 def session_to_dict(
     session_row: Any,
     participants: list[Any] | None = None,
@@ -66,17 +145,24 @@ def session_to_dict(
         "facilitator": session_row.facilitator,
         "notes": session_row.notes,
         "organ_tags": session_row.organ_tags or [],
-        "participants": [
-            {"name": p.name, "role": p.role} for p in (participants or [])
-        ],
-        "segments": [
-            {
-                "speaker": s.speaker,
-                "text": s.text,
-                "start_seconds": s.start_seconds,
-                "end_seconds": s.end_seconds,
-                "confidence": s.confidence,
-            }
-            for s in (segments or [])
-        ],
+        "participants": [{"name": p.name, "role": p.role} for p in (participants or [])],
+        "segments": [segment_to_dict(s) for s in (segments or [])],
+    }
+
+
+def bundle_to_dict(bundle: Any) -> dict[str, Any]:
+    """Convert a repository ``SessionBundle`` to a plain dict for export."""
+    return session_to_dict(bundle.session, bundle.participants, bundle.segments)
+
+
+def segment_to_dict(segment: Any) -> dict[str, Any]:
+    """Convert a Segment ORM row (or an already-plain dict) to an export dict."""
+    if isinstance(segment, dict):
+        return segment
+    return {
+        "speaker": segment.speaker,
+        "text": segment.text,
+        "start_seconds": segment.start_seconds,
+        "end_seconds": segment.end_seconds,
+        "confidence": segment.confidence,
     }
@@ -0,0 +1,169 @@
+"""Trigram similarity, compatible with Postgres ``pg_trgm``.
+
+The database path uses ``pg_trgm`` GIN indexes (see ``schema.MIGRATIONS``);
+this module is the offline fallback. Strings are split into alphanumeric
+words, each padded as ``"  word "`` and cut into three-character
+trigrams, exactly as ``pg_trgm`` does. ``similarity`` is the Jaccard
+index of two trigram sets; ``word_similarity`` follows ``pg_trgm``'s
+extent search, scoring the query against the best-matching stretch of
+the target, so a short query can match inside a long title and the same
+threshold selects the same rows offline as in the database.
+
+:class:`TrigramIndex` keeps a postings list per trigram so a search only
+scores entries sharing at least one trigram with the query.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass
+
+_WORD_RE = re.compile(r"[^\W_]+")
+
+DEFAULT_THRESHOLD = 0.3
+
+
+def _words(text: str) -> list[str]:
+    return _WORD_RE.findall(text.lower())
+
+
+def _word_trigrams(word: str) -> set[str]:
+    padded = f"  {word} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def trigrams(text: str) -> frozenset[str]:
+    """The ``pg_trgm`` trigram set of ``text``."""
+    result: set[str] = set()
+    for word in _words(text):
+        result |= _word_trigrams(word)
+    return frozenset(result)
+
+
+def _jaccard(a: frozenset[str] | set[str], b: frozenset[str] | set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+def similarity(a: str, b: str) -> float:
+    """Jaccard similarity of the trigram sets of ``a`` and ``b`` (0.0–1.0)."""
+    return _jaccard(trigrams(a), trigrams(b))
+
+
+def _trigram_sequence(text: str) -> list[str]:
+    """Trigrams of ``text`` in order, with repeats, as ``pg_trgm`` scans them."""
+    sequence: list[str] = []
+    for word in _words(text):
+        padded = f"  {word} "
+        sequence.extend(padded[i : i + 3] for i in range(len(padded) - 2))
+    return sequence
+
+
+def word_similarity(query: str, text: str) -> float:
+    """``pg_trgm``'s ``word_similarity(query, text)`` (0.0–1.0).
+
+    The greatest similarity between the query's trigram set and any
+    contiguous extent of ``text``'s trigram sequence, scored as shared /
+    (query + extent - shared); for an extent of only shared trigrams that
+    is shared / query. A port of ``iterate_word_similarity`` in
+    ``trgm_op.c``, so scores (and thresholds) match the ``<%`` database
+    search.
+    """
+    query_trgm = trigrams(query)
+    sequence = _trigram_sequence(text)
+    if not query_trgm or not sequence:
+        return 0.0
+    ulen1 = len(query_trgm)
+    found = [gram in query_trgm for gram in sequence]
+    last_pos: dict[str, int] = {}
+    ulen2 = count = 0
+    lower = -1
+    best = 0.0
+    for i, gram in enumerate(sequence):
+        # extents start at the first shared trigram
+        if lower >= 0 or found[i]:
+            if gram not in last_pos:
+                ulen2 += 1
+                if found[i]:
+                    count += 1
+            last_pos[gram] = i
+        if not found[i]:
+            continue
+        # extent ends at a shared trigram; move its start for a better score
+        upper = i
+        if lower == -1:
+            lower = i
+            ulen2 = 1
+        current = count / (ulen1 + ulen2 - count)
+        tmp_count, tmp_ulen2, prev_lower = count, ulen2, lower
+        for tmp_lower in range(lower, upper + 1):
+            score = tmp_count / (ulen1 + tmp_ulen2 - tmp_count)
+            if score > current:
+                current, ulen2, lower, count = score, tmp_ulen2, tmp_lower, tmp_count
+            if last_pos.get(sequence[tmp_lower]) == tmp_lower:
+                tmp_ulen2 -= 1
+                if found[tmp_lower]:
+                    tmp_count -= 1
+        best = max(best, current)
+        for tmp_lower in range(prev_lower, lower):
+            if last_pos.get(sequence[tmp_lower]) == tmp_lower:
+                del last_pos[sequence[tmp_lower]]
+    return best
+
+
+@dataclass
+class FuzzyMatch:
+    """One :class:`TrigramIndex` result."""
+
+    key: Hashable
+    text: str
+    score: float
+
+
+class TrigramIndex:
+    """In-memory trigram index over ``(key, text)`` entries."""
+
+    def __init__(self, entries: Iterable[tuple[Hashable, str]] = ()) -> None:
+        self._texts: list[tuple[Hashable, str]] = []
+        self._trigrams: list[frozenset[str]] = []
+        self._postings: dict[str, list[int]] = defaultdict(list)
+        for key, text in entries:
+            self.add(key, text)
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def add(self, key: Hashable, text: str) -> None:
+        doc = len(self._texts)
+        grams = trigrams(text)
+        self._texts.append((key, text))
+        self._trigrams.append(grams)
+        for gram in grams:
+            self._postings[gram].append(doc)
+
+    def search(
+        self, query: str, threshold: float = DEFAULT_THRESHOLD, limit: int = 20
+    ) -> list[FuzzyMatch]:
+        """Entries scoring at least ``threshold`` on :func:`word_similarity`, best first."""
+        query_trgm = trigrams(query)
+        if not query_trgm:
+            return []
+        shared: dict[int, int] = defaultdict(int)
+        for gram in query_trgm:
+            for doc in self._postings.get(gram, ()):
+                shared[doc] += 1
+        matches = []
+        for doc, count in shared.items():
+            # the score of any extent is at most shared / |query|
+            if count / len(query_trgm) < threshold:
+                continue
+            key, text = self._texts[doc]
+            score = word_similarity(query, text)
+            if score >= threshold:
+                matches.append(FuzzyMatch(key, text, score))
+        matches.sort(key=lambda m: (-m.score, m.text))
+        return matches[:limit]
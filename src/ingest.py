@@ -0,0 +1,133 @@
+"""Persist transcriptions to the archive while they are being produced.
+
+``salon ingest --persist`` overlaps transcription with database writes.
+The calling thread pulls segments from the transcription stream and groups
+them into batches; a writer thread takes batches off a bounded queue and
+inserts each one in its own transaction, which also advances the run's
+checkpoint in the ``salon_ingest_runs`` table. When the database falls
+behind, the full queue makes transcription wait instead of buffering the
+whole transcript.
+
+Runs are keyed by the ingest session key (``--session-id``). Ingesting a
+completed key again is a no-op. Ingesting an interrupted one reuses its
+session row and skips the segments already written, which relies on the
+backend producing the same segments for the same audio (as it does with
+the transcription cache).
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from itertools import islice
+from typing import TYPE_CHECKING, Any
+
+from .repository import DEFAULT_BATCH_SIZE, IngestRun, _batched
+from .transcription import Segment
+
+if TYPE_CHECKING:
+    from .repository import SalonRepository
+
+# Batches buffered between transcription and the writer
+DEFAULT_QUEUE_DEPTH = 4
+
+
+@dataclass
+class IngestReport:
+    """Outcome of :func:`persist_segments` for one key."""
+
+    session_key: str
+    session_id: int
+    segments_written: int = 0
+    segments_skipped: int = 0
+    already_complete: bool = False
+
+
+class _SegmentWriter:
+    """Writer thread inserting segment batches from a bounded queue."""
+
+    def __init__(self, repo: SalonRepository, run: IngestRun, queue_depth: int) -> None:
+        self.repo = repo
+        self.run = run
+        self.written = 0
+        self.error: BaseException | None = None
+        self._queue: queue.Queue[list[dict[str, Any]] | None] = queue.Queue(queue_depth)
+        self._thread = threading.Thread(
+            target=self._drain, name=f"ingest-writer-{run.session_key}", daemon=True
+        )
+        self._thread.start()
+
+    def put(self, batch: list[dict[str, Any]]) -> None:
+        """Queue a batch, blocking while the queue is full; re-raises a writer failure."""
+        if self.error is not None:
+            raise self.error
+        self._queue.put(batch)
+
+    def close(self) -> None:
+        """Wait for every queued batch to be written (or discarded after a failure)."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _drain(self) -> None:
+        while (batch := self._queue.get()) is not None:
+            if self.error is not None:
+                continue  # keep consuming so the producer never blocks
+            try:
+                self.written += self.repo.append_ingest_segments(
+                    self.run.session_key, self.run.session_id, batch
+                )
+            except BaseException as exc:  # noqa: BLE001 - re-raised on the producer thread
+                self.error = exc
+
+
+def persist_segments(
+    repo: SalonRepository,
+    session_key: str,
+    session: dict[str, Any],
+    segments: Iterable[Segment],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    queue_depth: int = DEFAULT_QUEUE_DEPTH,
+) -> IngestReport:
+    """Write a session and its segments under ``session_key``, pipelined and resumable.
+
+    Args:
+        repo: Repository to write through.
+        session_key: Ingest key; one key always maps to one session row.
+        session: Session fields as for ``SalonRepository.add_session``
+            (``segments`` is ignored). Only used the first time the key is seen.
+        segments: Transcript segments, typically a lazy stream such as
+            ``TranscriptionPipeline.stream_audio``. Not consumed at all when
+            the key has already completed.
+        batch_size: Segments per insert transaction.
+        queue_depth: Batches buffered ahead of the writer.
+
+    Returns:
+        An IngestReport; ``segments_skipped`` counts segments an earlier,
+        interrupted run had already written. If transcription or a write
+        fails, the batches written so far stay committed and the error is
+        re-raised; the run can then be resumed.
+    """
+    # validate before begin_ingest_run creates anything
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    if queue_depth < 1:
+        raise ValueError("queue_depth must be at least 1")
+    run = repo.begin_ingest_run(session_key, session)
+    report = IngestReport(session_key, run.session_id, segments_skipped=run.segments_written)
+    if run.completed:
+        report.already_complete = True
+        return report
+    writer = _SegmentWriter(repo, run, queue_depth)
+    rows = (seg.to_dict() for seg in islice(segments, run.segments_written, None))
+    try:
+        for batch in _batched(rows, batch_size):
+            writer.put(batch)
+    finally:
+        writer.close()
+        report.segments_written = writer.written
+    if writer.error is not None:
+        raise writer.error
+    repo.finish_ingest_run(session_key)
+    return report
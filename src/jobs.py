@@ -0,0 +1,535 @@
+"""Durable, resumable queue of ingest jobs for large transcription backlogs.
+
+A :class:`JobQueue` is a directory holding a SQLite database of jobs (one
+row per audio file, keyed by session id) and a ``transcripts/`` folder with
+one JSON-lines transcript per job. Each job records its
+:class:`~src.transcription.TranscriptionStatus`, attempt count, and a
+checkpoint: the number of audio chunks processed and segments written.
+
+Workers claim jobs inside ``BEGIN IMMEDIATE`` transactions, so several
+worker threads or processes can drain the same queue without taking the
+same job twice. A claim is a lease: a heartbeat thread renews it while the
+job runs, and a job whose lease expires (its worker crashed) becomes
+claimable again, up to ``max_attempts`` claims, and resumes from its last
+checkpoint. Each attempt writes its own ``.part`` file, which is renamed
+over the job's transcript only when the job completes, so a worker that
+lost its lease never writes into another worker's file. With a
+:class:`~src.transcription.ChunkedTranscriptionBackend` and a WAV file the
+checkpoint advances after every chunk; other backends resume by skipping
+the segments already written, which assumes they reproduce the same
+segments for the same audio.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO
+
+from .transcription import (
+    ChunkedTranscriptionBackend,
+    Segment,
+    TranscriptionPipeline,
+    TranscriptionStatus,
+    _is_duplicate,
+    iter_wav_chunks,
+    stitch_segments,
+)
+
+DB_NAME = "jobs.sqlite3"
+DEFAULT_LEASE_SECONDS = 600.0
+DEFAULT_MAX_ATTEMPTS = 3
+
+# Segments between checkpoints when the backend cannot resume mid-file by chunk
+CHECKPOINT_SEGMENTS = 50
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    session_id TEXT PRIMARY KEY,
+    audio_path TEXT NOT NULL,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    chunk_offset INTEGER NOT NULL DEFAULT 0,
+    segments_written INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    lease_expires REAL,
+    error TEXT,
+    seq INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    part_file TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_jobs_status ON jobs (status, seq);
+"""
+
+
+class LeaseLost(RuntimeError):
+    """The job was reclaimed by another worker after this worker's lease expired."""
+
+
+@dataclass
+class IngestJob:
+    """One queued audio file and its checkpoint.
+
+    ``part_file`` holds the checkpointed transcript lines; ``attempt_file``
+    is the file the current claim writes (set by :meth:`JobQueue.claim`).
+    """
+
+    session_id: str
+    audio_path: str
+    status: TranscriptionStatus = TranscriptionStatus.PENDING
+    attempts: int = 0
+    chunk_offset: int = 0
+    segments_written: int = 0
+    worker: str | None = None
+    error: str | None = None
+    part_file: str | None = None
+    attempt_file: str | None = None
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> IngestJob:
+        return cls(
+            session_id=row["session_id"],
+            audio_path=row["audio_path"],
+            status=TranscriptionStatus(row["status"]),
+            attempts=row["attempts"],
+            chunk_offset=row["chunk_offset"],
+            segments_written=row["segments_written"],
+            worker=row["worker"],
+            error=row["error"],
+            part_file=row["part_file"],
+        )
+
+
+def default_worker_id() -> str:
+    """``host:pid:thread`` — unique across the processes sharing a queue."""
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+class JobQueue:
+    """SQLite-backed job queue with leased claims and per-job checkpoints."""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.directory = Path(directory)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.transcript_dir.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(jobs)")}
+            if "part_file" not in columns:  # queues created before per-attempt files
+                conn.execute("ALTER TABLE jobs ADD COLUMN part_file TEXT")
+
+    @property
+    def db_path(self) -> Path:
+        return self.directory / DB_NAME
+
+    @property
+    def transcript_dir(self) -> Path:
+        return self.directory / "transcripts"
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """A short-lived autocommit connection; transactions are opened explicitly."""
+        with closing(sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)) as conn:
+            conn.row_factory = sqlite3.Row
+            yield conn
+
+    @contextmanager
+    def _immediate(self) -> Iterator[sqlite3.Connection]:
+        """A write transaction that takes the database lock up front."""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    # ── Enqueue and inspect ───────────────────────────────────────────
+
+    def enqueue(self, jobs: Iterable[tuple[str, str]]) -> int:
+        """Add (session_id, audio_path) jobs; ids already queued are left as they are.
+
+        Returns the number of new jobs.
+        """
+        now = time.time()
+        with self._immediate() as conn:
+            seq = conn.execute("SELECT coalesce(max(seq), 0) FROM jobs").fetchone()[0]
+            before = conn.total_changes
+            for session_id, audio_path in jobs:
+                seq += 1
+                conn.execute(
+                    "INSERT OR IGNORE INTO jobs (session_id, audio_path, status, seq, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (session_id, audio_path, TranscriptionStatus.PENDING.value, seq, now),
+                )
+            return conn.total_changes - before
+
+    def get(self, session_id: str) -> IngestJob | None:
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE session_id = ?", (session_id,)).fetchone()
+        return IngestJob.from_row(row) if row is not None else None
+
+    def jobs(self) -> list[IngestJob]:
+        """Every job, in enqueue order."""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT * FROM jobs ORDER BY seq").fetchall()
+        return [IngestJob.from_row(row) for row in rows]
+
+    def counts(self) -> dict[TranscriptionStatus, int]:
+        """Number of jobs in each status (zero for statuses with none)."""
+        counts = dict.fromkeys(TranscriptionStatus, 0)
+        with self._connect() as conn:
+            for status, n in conn.execute("SELECT status, count(*) FROM jobs GROUP BY status"):
+                counts[TranscriptionStatus(status)] = n
+        return counts
+
+    def retry_failed(self) -> int:
+        """Return failed jobs to the queue with a fresh attempt budget, keeping checkpoints."""
+        with self._immediate() as conn:
+            cur = conn.execute(
+                "UPDATE jobs SET status = ?, attempts = 0, updated_at = ? WHERE status = ?",
+                (
+                    TranscriptionStatus.PENDING.value,
+                    time.time(),
+                    TranscriptionStatus.FAILED.value,
+                ),
+            )
+            return cur.rowcount
+
+    # ── Worker protocol ───────────────────────────────────────────────
+
+    def claim(self, worker: str) -> IngestJob | None:
+        """Lease the oldest pending job (or one whose lease expired); None when drained.
+
+        A job whose lease expired after its last allowed attempt (its
+        worker keeps dying on it) is marked FAILED instead of reclaimed.
+        """
+        now = time.time()
+        processing = TranscriptionStatus.PROCESSING.value
+        with self._immediate() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, lease_expires = NULL, updated_at = ? "
+                "WHERE status = ? AND lease_expires < ? AND attempts >= ?",
+                (
+                    TranscriptionStatus.FAILED.value,
+                    f"lease expired on attempt {self.max_attempts}; worker lost",
+                    now,
+                    processing,
+                    now,
+                    self.max_attempts,
+                ),
+            )
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE status = ? "
+                "OR (status = ? AND lease_expires < ? AND attempts < ?) "
+                "ORDER BY seq LIMIT 1",
+                (TranscriptionStatus.PENDING.value, processing, now, self.max_attempts),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = ?, attempts = attempts + 1, worker = ?, "
+                "lease_expires = ?, error = NULL, updated_at = ? WHERE session_id = ?",
+                (
+                    TranscriptionStatus.PROCESSING.value,
+                    worker,
+                    now + self.lease_seconds,
+                    now,
+                    row["session_id"],
+                ),
+            )
+        job = IngestJob.from_row(row)
+        job.status = TranscriptionStatus.PROCESSING
+        job.attempts += 1
+        job.worker = worker
+        job.attempt_file = f"{job.session_id}.{uuid.uuid4().hex}.part"
+        return job
+
+    def renew(self, job: IngestJob) -> None:
+        """Extend the lease; raises LeaseLost if the job was reclaimed."""
+        now = time.time()
+        self._update_owned(
+            job, "lease_expires = ?, updated_at = ?", (now + self.lease_seconds, now)
+        )
+
+    def checkpoint(self, job: IngestJob, chunk_offset: int, segments_written: int) -> None:
+        """Record progress and renew the lease; raises LeaseLost if the job was reclaimed.
+
+        The attempt's file becomes the checkpoint file, and the previous
+        attempt's file is removed.
+        """
+        now = time.time()
+        self._update_owned(
+            job,
+            "chunk_offset = ?, segments_written = ?, part_file = ?, "
+            "lease_expires = ?, updated_at = ?",
+            (
+                chunk_offset,
+                segments_written,
+                job.attempt_file,
+                now + self.lease_seconds,
+                now,
+            ),
+        )
+        if job.part_file and job.part_file != job.attempt_file:
+            (self.transcript_dir / job.part_file).unlink(missing_ok=True)
+        job.chunk_offset = chunk_offset
+        job.segments_written = segments_written
+        job.part_file = job.attempt_file
+
+    def complete(self, job: IngestJob) -> None:
+        """Mark the job done and move the attempt's file into place as its transcript."""
+        with self._owned(
+            job,
+            "status = ?, part_file = NULL, lease_expires = NULL, updated_at = ?",
+            (TranscriptionStatus.COMPLETED.value, time.time()),
+        ):
+            # inside the transaction, so the rename happens only while we hold the job
+            os.replace(self._attempt_path(job), self.transcript_path(job.session_id))
+        job.status = TranscriptionStatus.COMPLETED
+        job.part_file = None
+
+    def fail(self, job: IngestJob, error: str) -> None:
+        """Release a job after an error: back to pending, or FAILED once out of attempts."""
+        status = (
+            TranscriptionStatus.FAILED
+            if job.attempts >= self.max_attempts
+            else TranscriptionStatus.PENDING
+        )
+        self._update_owned(
+            job,
+            "status = ?, error = ?, lease_expires = NULL, updated_at = ?",
+            (status.value, error, time.time()),
+        )
+        job.status = status
+        job.error = error
+
+    def discard_attempt(self, job: IngestJob) -> None:
+        """Delete the file of an attempt that lost its lease, unless it is the checkpoint."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT part_file FROM jobs WHERE session_id = ?", (job.session_id,)
+            ).fetchone()
+        if job.attempt_file and (row is None or row["part_file"] != job.attempt_file):
+            self._attempt_path(job).unlink(missing_ok=True)
+
+    def _update_owned(self, job: IngestJob, assignments: str, params: tuple) -> None:
+        with self._owned(job, assignments, params):
+            pass
+
+    @contextmanager
+    def _owned(self, job: IngestJob, assignments: str, params: tuple) -> Iterator[None]:
+        """Update a job this worker holds; the body runs before the update commits."""
+        with self._immediate() as conn:
+            cur = conn.execute(
+                f"UPDATE jobs SET {assignments} "
+                "WHERE session_id = ? AND worker = ? AND status = ?",
+                (*params, job.session_id, job.worker, TranscriptionStatus.PROCESSING.value),
+            )
+            if cur.rowcount == 0:
+                raise LeaseLost(f"job {job.session_id} is no longer leased to {job.worker}")
+            yield
+
+    @contextmanager
+    def heartbeat(self, job: IngestJob) -> Iterator[None]:
+        """Renew ``job``'s lease in a background thread for the duration of the block.
+
+        Renewal runs every third of ``lease_seconds``, so a backend call
+        that outlasts the lease does not let another worker reclaim the
+        job. Raises LeaseLost on exit if a renewal found the job reclaimed.
+        """
+        if self.lease_seconds <= 0:
+            yield
+            return
+        stop = threading.Event()
+        lost: list[LeaseLost] = []
+
+        def beat() -> None:
+            while not stop.wait(self.lease_seconds / 3):
+                try:
+                    self.renew(job)
+                except LeaseLost as exc:
+                    lost.append(exc)
+                    return
+
+        thread = threading.Thread(target=beat, name=f"lease-{job.session_id}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+        if lost:
+            raise lost[0]
+
+    # ── Transcripts ───────────────────────────────────────────────────
+
+    def transcript_path(self, session_id: str) -> Path:
+        return self.transcript_dir / f"{session_id}.jsonl"
+
+    def read_transcript(self, job: IngestJob | str) -> Iterator[Segment]:
+        """Stream a job's transcript from disk.
+
+        Given a claimed, not yet completed :class:`IngestJob`, reads the
+        file its current attempt is writing (as ``on_transcribed`` needs).
+        """
+        if isinstance(job, IngestJob) and job.status is not TranscriptionStatus.COMPLETED:
+            path = self._attempt_path(job)
+        else:
+            path = self.transcript_path(job if isinstance(job, str) else job.session_id)
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                yield Segment.from_dict(json.loads(line))
+
+    def _attempt_path(self, job: IngestJob) -> Path:
+        if job.attempt_file is None:
+            raise ValueError(f"job {job.session_id} has not been claimed")
+        return self.transcript_dir / job.attempt_file
+
+    @contextmanager
+    def _open_transcript(self, job: IngestJob) -> Iterator[tuple[IO[str], Segment | None]]:
+        """Start this attempt's file from the job's checkpoint.
+
+        Copies the checkpointed lines from the previous attempt's file;
+        anything that attempt wrote after its last checkpoint is dropped.
+        Yields the open file and the last kept segment.
+        """
+        kept: list[str] = []
+        if job.segments_written and job.part_file:
+            path = self.transcript_dir / job.part_file
+            if path.exists():
+                with open(path, encoding="utf-8") as f:
+                    for line in f:
+                        if len(kept) == job.segments_written:
+                            break
+                        kept.append(line)
+        if len(kept) != job.segments_written:
+            raise RuntimeError(
+                f"transcript for {job.session_id} has {len(kept)} of "
+                f"{job.segments_written} checkpointed segments"
+            )
+        last = Segment.from_dict(json.loads(kept[-1])) if kept else None
+        with open(self._attempt_path(job), "w", encoding="utf-8") as f:
+            f.writelines(kept)
+            yield f, last
+
+
+# ── Workers ───────────────────────────────────────────────────────────
+
+
+@dataclass
+class WorkerReport:
+    """Jobs finished by one :func:`run_worker` call."""
+
+    completed: list[str]
+    failed: list[str]
+
+
+def transcribe_job(queue: JobQueue, job: IngestJob, pipeline: TranscriptionPipeline) -> None:
+    """Transcribe a claimed job into its transcript file, checkpointing as it goes."""
+    backend = pipeline.backend
+    chunked = isinstance(backend, ChunkedTranscriptionBackend) and (
+        job.audio_path.lower().endswith(".wav")
+    )
+    with queue._open_transcript(job) as (out, prev):
+        written = job.segments_written
+        if chunked:
+            chunks = iter_wav_chunks(
+                job.audio_path, backend.chunk_seconds, backend.overlap_seconds
+            )
+            for chunk in chunks:
+                if chunk.index < job.chunk_offset:
+                    continue
+                for seg in stitch_segments([(chunk, backend.transcribe_chunk(chunk))]):
+                    if prev is not None and _is_duplicate(prev, seg):
+                        continue
+                    out.write(json.dumps(seg.to_dict()) + "\n")
+                    prev = seg
+                    written += 1
+                out.flush()
+                queue.checkpoint(job, chunk.index + 1, written)
+        else:
+            stream = pipeline.stream_audio(job.session_id, job.audio_path, retain=False)
+            for i, seg in enumerate(stream):
+                if i < job.segments_written:
+                    continue
+                out.write(json.dumps(seg.to_dict()) + "\n")
+                written += 1
+                if written % CHECKPOINT_SEGMENTS == 0:
+                    out.flush()
+                    queue.checkpoint(job, 0, written)
+            out.flush()
+            queue.checkpoint(job, 0, written)
+
+
+def run_worker(
+    queue: JobQueue,
+    pipeline: TranscriptionPipeline,
+    worker: str | None = None,
+    on_transcribed: Callable[[IngestJob], None] | None = None,
+    on_result: Callable[[IngestJob], None] | None = None,
+    max_jobs: int | None = None,
+) -> WorkerReport:
+    """Claim and transcribe jobs until the queue is drained (or ``max_jobs`` are done).
+
+    Args:
+        queue: Queue to drain; other workers may share it.
+        pipeline: Supplies the backend and language.
+        worker: Lease owner id (default :func:`default_worker_id`).
+        on_transcribed: Called once a job's transcript is complete, before
+            the job is marked COMPLETED (e.g. to persist it). An exception
+            fails the job like a transcription error.
+        on_result: Called after each job is completed or released.
+        max_jobs: Stop after this many claims.
+
+    A failing job is released (retried later, or FAILED after the queue's
+    ``max_attempts``) and the worker moves on to the next one.
+    """
+    worker = worker or default_worker_id()
+    report = WorkerReport(completed=[], failed=[])
+    claimed = 0
+    while max_jobs is None or claimed < max_jobs:
+        job = queue.claim(worker)
+        if job is None:
+            break
+        claimed += 1
+        try:
+            with queue.heartbeat(job):
+                transcribe_job(queue, job, pipeline)
+                if on_transcribed is not None:
+                    on_transcribed(job)
+            queue.complete(job)
+            report.completed.append(job.session_id)
+        except LeaseLost:
+            queue.discard_attempt(job)  # another worker owns it now
+            continue
+        except Exception as exc:  # noqa: BLE001 - recorded as the job's failure
+            try:
+                queue.fail(job, f"{type(exc).__name__}: {exc}")
+            except LeaseLost:
+                queue.discard_attempt(job)
+                continue
+            queue.discard_attempt(job)
+            report.failed.append(job.session_id)
+        if on_result is not None:
+            on_result(job)
+    return report
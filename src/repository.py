@@ -6,22 +6,314 @@
 
 from __future__ import annotations
 
-from sqlalchemy import create_engine, select
-from sqlalchemy.orm import Session
+import base64
+import copy
+import json
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+from typing import Any, Generic, TypeVar
 
 from koinonia_db.models.salon import (
     Participant,
     SalonSessionRow,
-    Segment as SegmentRow,
     TaxonomyNodeRow,
 )
+from koinonia_db.models.salon import (
+    Segment as SegmentRow,
+)
+from sqlalchemy import (
+    Double,
+    Engine,
+    Select,
+    case,
+    cast,
+    create_engine,
+    delete,
+    func,
+    insert,
+    literal,
+    literal_column,
+    or_,
+    select,
+    text,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.orm import Session
+
+from .config import Settings
+from .schema import (
+    FTS_CONFIG,
+    SEGMENTS,
+    SESSIONS,
+    STATS,
+    ingest_runs_table,
+    segment_tsvector,
+    session_tsvector,
+    stats_table,
+)
+from .stats import ArchiveStats
+
+DEFAULT_BATCH_SIZE = 1000
+
+# ts_headline options for transcript snippets; matches are wrapped in ** (markdown bold)
+HEADLINE_OPTIONS = "StartSel=**, StopSel=**, MaxWords=18, MinWords=6, MaxFragments=1"
+
+
+@dataclass
+class TranscriptHit:
+    """A transcript segment matching a full-text query."""
+
+    session_id: int
+    session_title: str
+    speaker: str
+    start_seconds: float
+    end_seconds: float
+    snippet: str
+    rank: float
+    segment_id: int | None = None
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of results and the token to fetch the next, if any."""
+
+    items: list[T]
+    next_cursor: str | None = None
+
+
+def encode_cursor(kind: str, *key: Any) -> str:
+    """Pack a result kind and the last row's sort key into an opaque token."""
+    payload = json.dumps([kind, *key], separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, kind: str) -> list[Any]:
+    """Unpack a token from :func:`encode_cursor`; ValueError unless it is a ``kind`` cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Malformed cursor") from exc
+    if not isinstance(payload, list) or not payload or payload[0] != kind:
+        raise ValueError(f"Cursor does not belong to a {kind} query")
+    return payload[1:]
+
+
+def _page(rows: list[Any], page_size: int, kind: str, key: Any) -> Page[Any]:
+    """Trim a ``page_size + 1`` fetch to a Page, encoding the last row's key."""
+    if len(rows) <= page_size:
+        return Page(rows)
+    rows = rows[:page_size]
+    return Page(rows, encode_cursor(kind, *key(rows[-1])))
+
+
+def _ts_rank(document: Any, query: Any) -> Any:
+    """``ts_rank`` widened to float8, so a rank read into a cursor compares equal.
+
+    ``ts_rank`` returns float4; its text form round-trips through Python as a
+    float8 that no longer equals the widened stored value, which would skip or
+    repeat rows tied on rank at a page boundary.
+    """
+    return cast(func.ts_rank(document, query), Double)
+
+
+# Session listing order, served by the index from migration 007_sessions_date_keyset.
+# Explicit NULLS LAST: Postgres sorts NULL first under DESC, SQLite last.
+_SESSION_ORDER = (SalonSessionRow.date.desc().nulls_last(), SalonSessionRow.id.desc())
+
+
+@dataclass
+class SessionBundle:
+    """A session row with its participants and start-ordered segments."""
+
+    session: SalonSessionRow
+    participants: list[Participant] = field(default_factory=list)
+    segments: list[SegmentRow] = field(default_factory=list)
+
+
+INGEST_RUNNING = "running"
+INGEST_COMPLETED = "completed"
+
+
+@dataclass
+class IngestRun:
+    """Checkpoint for one ingest key: its session row and segments written so far."""
+
+    session_key: str
+    session_id: int
+    status: str = INGEST_RUNNING
+    segments_written: int = 0
+
+    @property
+    def completed(self) -> bool:
+        return self.status == INGEST_COMPLETED
+
+
+_engines: dict[tuple[str, tuple[tuple[str, Any], ...]], Engine] = {}
+_engines_lock = threading.Lock()
+
+
+def get_engine(database_url: str, **options: Any) -> Engine:
+    """Return the process-wide engine for a URL and option set, creating it on first use.
+
+    Repositories built for the same database share one connection pool, so
+    repeated CLI calls and long-running services pay the TLS handshake once
+    per pooled connection rather than once per repository.
+    """
+    key = (database_url, tuple(sorted(options.items())))
+    with _engines_lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = _engines[key] = create_engine(database_url, **options)
+    return engine
+
+
+# Bumped on every taxonomy write through any repository on the engine, so
+# in-process caches (see taxonomy.TaxonomyService) know when to reload
+_taxonomy_versions: dict[Engine, int] = {}
+
+
+def dispose_engines() -> None:
+    """Close every pooled connection and forget all registered engines."""
+    with _engines_lock:
+        for engine in _engines.values():
+            engine.dispose()
+        _engines.clear()
+
+
+def _batched(rows: Iterable[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    """Yield successive lists of at most ``size`` rows."""
+    if size < 1:
+        raise ValueError("batch_size must be at least 1")
+    it = iter(rows)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def _session_params(d: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "title": d["title"],
+        "date": d["date"],
+        "format": d["format"],
+        "facilitator": d.get("facilitator"),
+        "notes": d.get("notes", ""),
+        "organ_tags": d.get("organ_tags", []),
+    }
+
+
+def _participant_params(session_id: int, p: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "session_id": session_id,
+        "name": p["name"],
+        "role": p.get("role", "participant"),
+        "consent_given": p.get("consent_given", False),
+    }
+
+
+def _segment_params(session_id: int, seg: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "session_id": session_id,
+        "speaker": seg["speaker"],
+        "text": seg["text"],
+        "start_seconds": seg["start_seconds"],
+        "end_seconds": seg["end_seconds"],
+        "confidence": seg.get("confidence", 0.0),
+    }
+
+
+def _insert_ignoring_conflicts(s: Session, table: Any) -> Any:
+    """``INSERT ... ON CONFLICT DO NOTHING`` on ``table``'s primary key, per dialect."""
+    name = s.get_bind().dialect.name
+    if name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        raise NotImplementedError(f"ON CONFLICT is not supported on {name}")
+    return dialect_insert(table).on_conflict_do_nothing(
+        index_elements=list(table.primary_key.columns)
+    )
+
+
+def segments_query(
+    session_id: int,
+    from_seconds: float | None = None,
+    to_seconds: float | None = None,
+    speaker: str | None = None,
+) -> Select[tuple[SegmentRow]]:
+    """Select a session's segments in start order, optionally narrowed.
+
+    A segment is kept if it overlaps ``[from_seconds, to_seconds)`` (it
+    starts before ``to_seconds`` and ends after ``from_seconds``) and, if
+    given, is spoken by ``speaker``. The composite indexes from migration
+    ``006_segment_seek`` serve both the range and the speaker filter
+    without sorting.
+    """
+    stmt = select(SegmentRow).where(SegmentRow.session_id == session_id)
+    if speaker is not None:
+        stmt = stmt.where(SegmentRow.speaker == speaker)
+    if to_seconds is not None:
+        stmt = stmt.where(SegmentRow.start_seconds < to_seconds)
+    if from_seconds is not None:
+        stmt = stmt.where(SegmentRow.end_seconds > from_seconds)
+    return stmt.order_by(SegmentRow.start_seconds)
 
 
 class SalonRepository:
     """Synchronous repository for salon session CRUD against Neon/Postgres."""
 
-    def __init__(self, database_url: str) -> None:
-        self._engine = create_engine(database_url)
+    def __init__(
+        self,
+        database_url: str,
+        engine_options: dict[str, Any] | None = None,
+    ) -> None:
+        if engine_options is None:
+            engine_options = Settings.engine_options()
+        self._engine = get_engine(database_url, **engine_options)
+        self._bound: Session | None = None
+
+    @contextmanager
+    def transaction(self) -> Iterator[SalonRepository]:
+        """Run several repository calls in one session and transaction.
+
+        Yields a repository bound to a single Session: every call made
+        through it shares one pooled connection and commits together when
+        the block exits, or rolls back if it raises. Nested calls reuse the
+        outer transaction.
+        """
+        if self._bound is not None:
+            yield self
+            return
+        with Session(self._engine, expire_on_commit=False) as s, s.begin():
+            bound = copy.copy(self)
+            bound._bound = s
+            yield bound
+
+    @contextmanager
+    def _session(self) -> Iterator[Session]:
+        """Yield the bound transaction's Session, or a fresh one for a single call."""
+        if self._bound is not None:
+            yield self._bound
+        else:
+            with Session(self._engine) as s:
+                yield s
+
+    def _commit(self, s: Session) -> None:
+        """Commit a standalone call; inside transaction() only flush."""
+        if self._bound is None:
+            s.commit()
+        else:
+            s.flush()
 
     # ── Sessions ──────────────────────────────────────────────────────
 
@@ -37,85 +329,577 @@ def add_session(
         segments: list[dict],
     ) -> int:
         """Insert a salon session with participants and segments. Returns the new session id."""
-        with Session(self._engine) as s:
-            row = SalonSessionRow(
-                title=title,
-                date=date,
-                format=format,
-                facilitator=facilitator,
-                notes=notes,
-                organ_tags=organ_tags,
-            )
-            s.add(row)
-            s.flush()
-            for p in participants:
-                s.add(
-                    Participant(
-                        session_id=row.id,
-                        name=p["name"],
-                        role=p.get("role", "participant"),
-                        consent_given=p.get("consent_given", False),
+        return self.add_sessions_bulk(
+            [
+                {
+                    "title": title,
+                    "date": date,
+                    "format": format,
+                    "facilitator": facilitator,
+                    "notes": notes,
+                    "organ_tags": organ_tags,
+                    "participants": participants,
+                    "segments": segments,
+                }
+            ]
+        )[0]
+
+    def add_sessions_bulk(
+        self,
+        sessions: Iterable[dict[str, Any]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> list[int]:
+        """Insert many sessions with their participants and segments in one transaction.
+
+        Session rows are inserted ``batch_size`` at a time with a single
+        multi-row ``INSERT ... RETURNING id``; participants and segments are
+        sent as executemany batches of the same size instead of one ORM
+        object per row. Each session dict takes the same keys as
+        :meth:`add_session`. Returns the new session ids in input order.
+        """
+        ids: list[int] = []
+        delta = ArchiveStats()
+        with self._session() as s:
+            for batch in _batched(sessions, batch_size):
+                new_ids = list(
+                    s.scalars(
+                        insert(SalonSessionRow).returning(
+                            SalonSessionRow.id, sort_by_parameter_order=True
+                        ),
+                        [_session_params(d) for d in batch],
                     )
                 )
-            for seg in segments:
-                s.add(
-                    SegmentRow(
-                        session_id=row.id,
-                        speaker=seg["speaker"],
-                        text=seg["text"],
-                        start_seconds=seg["start_seconds"],
-                        end_seconds=seg["end_seconds"],
-                        confidence=seg.get("confidence", 0.0),
-                    )
+                participants = (
+                    _participant_params(sid, p)
+                    for sid, d in zip(new_ids, batch)
+                    for p in d.get("participants", [])
                 )
-            s.commit()
-            return row.id
+                for rows in _batched(participants, batch_size):
+                    s.execute(insert(Participant), rows)
+                for sid, d in zip(new_ids, batch):
+                    delta.add_session(d)
+                    self._insert_segments(s, sid, d.get("segments", []), batch_size, delta)
+                ids.extend(new_ids)
+            self._bump_stats(s, delta)
+            self._commit(s)
+        return ids
+
+    def bulk_insert_segments(
+        self,
+        session_id: int,
+        segments: Iterable[dict[str, Any]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> int:
+        """Append transcript segments to an existing session in executemany batches.
+
+        ``segments`` may be any iterable (including a generator), so long
+        transcripts are never materialized as a whole. Returns the number of
+        rows inserted.
+        """
+        delta = ArchiveStats()
+        with self._session() as s:
+            count = self._insert_segments(s, session_id, segments, batch_size, delta)
+            self._bump_stats(s, delta)
+            self._commit(s)
+            return count
+
+    @staticmethod
+    def _insert_segments(
+        s: Session,
+        session_id: int,
+        segments: Iterable[dict[str, Any]],
+        batch_size: int,
+        delta: ArchiveStats | None = None,
+    ) -> int:
+        count = 0
+        rows = (_segment_params(session_id, seg) for seg in segments)
+        for batch in _batched(rows, batch_size):
+            s.execute(insert(SegmentRow), batch)
+            count += len(batch)
+            if delta is not None:
+                delta.add_segments(batch)
+        return count
 
     def get_session(self, session_id: int) -> SalonSessionRow | None:
         """Fetch a single session by primary key."""
-        with Session(self._engine) as s:
+        with self._session() as s:
             return s.get(SalonSessionRow, session_id)
 
+    def get_session_bundle(
+        self, session_id: int, include_segments: bool = True
+    ) -> SessionBundle | None:
+        """Fetch a session with its participants (and segments) on one connection."""
+        bundles = self.get_session_bundles([session_id], include_segments)
+        return bundles[0] if bundles else None
+
+    def get_session_bundles(
+        self, session_ids: Iterable[int], include_segments: bool = True
+    ) -> list[SessionBundle]:
+        """Fetch many sessions with their children in three queries, whatever N is.
+
+        One ``IN`` query each for sessions, participants, and segments;
+        children are attached in Python. Results follow ``session_ids``
+        order and unknown ids are dropped.
+        """
+        ids = list(dict.fromkeys(session_ids))
+        if not ids:
+            return []
+        with self._session() as s:
+            rows = s.scalars(select(SalonSessionRow).where(SalonSessionRow.id.in_(ids)))
+            bundles = {row.id: SessionBundle(row) for row in rows}
+            self._attach_children(s, bundles, include_segments)
+        return [bundles[i] for i in ids if i in bundles]
+
+    def iter_session_bundles(
+        self, batch_size: int = 200, include_segments: bool = True
+    ) -> Iterator[SessionBundle]:
+        """Stream every session with its children, ``batch_size`` sessions at a time.
+
+        Issues two child queries per batch instead of two per session.
+        """
+        batch: dict[int, SessionBundle] = {}
+        with self._session() as s:
+            for row in self.iter_sessions(batch_size):
+                batch[row.id] = SessionBundle(row)
+                if len(batch) >= batch_size:
+                    self._attach_children(s, batch, include_segments)
+                    yield from batch.values()
+                    batch = {}
+            if batch:
+                self._attach_children(s, batch, include_segments)
+                yield from batch.values()
+
+    @staticmethod
+    def _attach_children(
+        s: Session, bundles: dict[int, SessionBundle], include_segments: bool
+    ) -> None:
+        if not bundles:
+            return
+        ids = list(bundles)
+        participants = select(Participant).where(Participant.session_id.in_(ids))
+        for p in s.scalars(participants.order_by(Participant.session_id, Participant.id)):
+            bundles[p.session_id].participants.append(p)
+        if include_segments:
+            segments = select(SegmentRow).where(SegmentRow.session_id.in_(ids))
+            for seg in s.scalars(
+                segments.order_by(SegmentRow.session_id, SegmentRow.start_seconds)
+            ):
+                bundles[seg.session_id].segments.append(seg)
+
     def search_by_topic(self, topic: str) -> list[SalonSessionRow]:
         """Find sessions whose organ_tags array contains the given topic (exact match)."""
-        with Session(self._engine) as s:
-            stmt = select(SalonSessionRow).where(
-                SalonSessionRow.organ_tags.any(topic)
+        return list(self.iter_search_by_topic(topic))
+
+    def iter_search_by_topic(
+        self, topic: str, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[SalonSessionRow]:
+        """Stream sessions tagged ``topic``, newest first, through a server-side cursor."""
+        criterion = SalonSessionRow.organ_tags.contains([topic])
+        yield from self._iter_sessions_where(criterion, batch_size)
+
+    def search_by_topic_page(
+        self, topic: str, page_size: int = 20, cursor: str | None = None
+    ) -> Page[SalonSessionRow]:
+        """One page of sessions tagged ``topic``, newest first."""
+        return self._session_page(SalonSessionRow.organ_tags.contains([topic]), page_size, cursor)
+
+    def search_by_tags(self, tags: Iterable[str], match: str = "any") -> list[SalonSessionRow]:
+        """Find sessions carrying any (``&&``) or all (``@>``) of ``tags``, newest first.
+
+        Both operators are served by the ``organ_tags`` GIN index.
+        """
+        return list(self._iter_sessions_where(self._tags_filter(tags, match), DEFAULT_BATCH_SIZE))
+
+    def iter_search_by_tags(
+        self, tags: Iterable[str], match: str = "any", batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[SalonSessionRow]:
+        """Stream :meth:`search_by_tags` results through a server-side cursor."""
+        yield from self._iter_sessions_where(self._tags_filter(tags, match), batch_size)
+
+    def search_by_tags_page(
+        self,
+        tags: Iterable[str],
+        match: str = "any",
+        page_size: int = 20,
+        cursor: str | None = None,
+    ) -> Page[SalonSessionRow]:
+        """One page of :meth:`search_by_tags` results, newest first."""
+        return self._session_page(self._tags_filter(tags, match), page_size, cursor)
+
+    @staticmethod
+    def _tags_filter(tags: Iterable[str], match: str) -> Any:
+        tags = list(dict.fromkeys(tags))
+        if not tags:
+            raise ValueError("at least one tag is required")
+        if match == "any":
+            return SalonSessionRow.organ_tags.overlap(tags)
+        if match == "all":
+            return SalonSessionRow.organ_tags.contains(tags)
+        raise ValueError(f"match must be 'any' or 'all', not {match!r}")
+
+    def search_by_taxonomy(self, slug: str) -> list[SalonSessionRow]:
+        """Find sessions tagged with ``slug`` or any taxonomy node beneath it, newest first.
+
+        The subtree is expanded by a recursive CTE inside the same statement
+        and matched with ``organ_tags && ...`` against the GIN index from
+        ``schema.MIGRATIONS``, so the whole search is one query.
+        """
+        return list(self._iter_sessions_where(self._taxonomy_filter(slug), DEFAULT_BATCH_SIZE))
+
+    def search_by_taxonomy_page(
+        self, slug: str, page_size: int = 20, cursor: str | None = None
+    ) -> Page[SalonSessionRow]:
+        """One page of :meth:`search_by_taxonomy` results, newest first."""
+        return self._session_page(self._taxonomy_filter(slug), page_size, cursor)
+
+    def expand_taxonomy(self, slug: str) -> list[str]:
+        """Return ``slug`` followed by the slugs of all its taxonomy descendants."""
+        subtree = self._taxonomy_subtree(slug)
+        with self._session() as s:
+            descendants = s.scalars(select(subtree.c.slug).where(subtree.c.slug != slug))
+            return [slug, *sorted(descendants)]
+
+    @staticmethod
+    def _taxonomy_subtree(slug: str) -> Any:
+        """Recursive CTE of (id, slug) for the node ``slug`` and its descendants."""
+        subtree = (
+            select(TaxonomyNodeRow.id, TaxonomyNodeRow.slug)
+            .where(TaxonomyNodeRow.slug == slug)
+            .cte("taxonomy_subtree", recursive=True)
+        )
+        # UNION (not UNION ALL) so a parent cycle terminates
+        return subtree.union(
+            select(TaxonomyNodeRow.id, TaxonomyNodeRow.slug).join(
+                subtree, TaxonomyNodeRow.parent_id == subtree.c.id
             )
-            return list(s.scalars(stmt))
+        )
+
+    def _taxonomy_filter(self, slug: str) -> Any:
+        subtree = self._taxonomy_subtree(slug)
+        # array_append keeps the slug itself when it is a free-form tag with no node
+        slugs = func.array_append(select(func.array_agg(subtree.c.slug)).scalar_subquery(), slug)
+        return SalonSessionRow.organ_tags.overlap(slugs)
 
     def search_by_text(self, query: str) -> list[SalonSessionRow]:
-        """Find sessions matching query via ILIKE on title, notes, and organ_tags text."""
-        with Session(self._engine) as s:
-            q = f"%{query}%"
-            from sqlalchemy import cast, String
-            stmt = select(SalonSessionRow).where(
-                SalonSessionRow.title.ilike(q)
-                | SalonSessionRow.notes.ilike(q)
-                | cast(SalonSessionRow.organ_tags, String).ilike(q)
+        """Find sessions matching query via ILIKE on title, notes, and organ_tags text.
+
+        Deprecated: this is a sequential scan; prefer :meth:`search_fulltext`.
+        """
+        return list(self.iter_search_by_text(query))
+
+    def iter_search_by_text(
+        self, query: str, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> Iterator[SalonSessionRow]:
+        """Stream :meth:`search_by_text` matches, newest first."""
+        yield from self._iter_sessions_where(self._text_filter(query), batch_size)
+
+    def search_by_text_page(
+        self, query: str, page_size: int = 20, cursor: str | None = None
+    ) -> Page[SalonSessionRow]:
+        """One page of :meth:`search_by_text` matches, newest first."""
+        return self._session_page(self._text_filter(query), page_size, cursor)
+
+    @staticmethod
+    def _text_filter(query: str) -> Any:
+        q = f"%{query}%"
+        return (
+            SalonSessionRow.title.ilike(q)
+            | SalonSessionRow.notes.ilike(q)
+            | func.array_to_string(SalonSessionRow.organ_tags, literal_column("' '")).ilike(q)
+        )
+
+    def _iter_sessions_where(self, criterion: Any, batch_size: int) -> Iterator[SalonSessionRow]:
+        stmt = (
+            select(SalonSessionRow)
+            .where(criterion)
+            .order_by(*_SESSION_ORDER)
+            .execution_options(yield_per=batch_size)
+        )
+        with self._session() as s:
+            yield from s.scalars(stmt)
+
+    def _session_page(
+        self, criterion: Any | None, page_size: int, cursor: str | None
+    ) -> Page[SalonSessionRow]:
+        """Keyset page over sessions, newest first, undated sessions last."""
+        stmt = self._session_page_stmt(criterion, page_size, cursor)
+        with self._session() as s:
+            rows = list(s.scalars(stmt))
+        return self._session_page_result(rows, page_size)
+
+    @staticmethod
+    def _session_page_stmt(criterion: Any | None, page_size: int, cursor: str | None) -> Any:
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        stmt = select(SalonSessionRow)
+        if criterion is not None:
+            stmt = stmt.where(criterion)
+        if cursor is not None:
+            date, last_id = decode_cursor(cursor, "sessions")
+            if date is None:
+                # past the dated sessions: only undated ones with smaller ids remain
+                after = SalonSessionRow.date.is_(None) & (SalonSessionRow.id < last_id)
+            else:
+                after = or_(
+                    tuple_(SalonSessionRow.date, SalonSessionRow.id)
+                    < tuple_(datetime.fromisoformat(date), last_id),
+                    SalonSessionRow.date.is_(None),
+                )
+            stmt = stmt.where(after)
+        return stmt.order_by(*_SESSION_ORDER).limit(page_size + 1)
+
+    @staticmethod
+    def _session_page_result(rows: list[SalonSessionRow], page_size: int) -> Page[SalonSessionRow]:
+        return _page(
+            rows,
+            page_size,
+            "sessions",
+            lambda r: (r.date.isoformat() if r.date is not None else None, r.id),
+        )
+
+    def search_fulltext(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> list[tuple[SalonSessionRow, float]]:
+        """Ranked full-text search over session titles, notes, and transcript text.
+
+        Uses ``plainto_tsquery`` against the GIN expression indexes from
+        ``schema.MIGRATIONS``. A session's score is its own ``ts_rank`` (title
+        weighted above notes) plus the best-ranking segment in its
+        transcript. Returns ``(session, rank)`` pairs, best first.
+        """
+        ranked = self._fulltext_ranks(query)
+        stmt = (
+            select(SalonSessionRow, ranked.c.rank)
+            .join(ranked, ranked.c.session_id == SalonSessionRow.id)
+            .order_by(ranked.c.rank.desc(), SalonSessionRow.id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        with self._session() as s:
+            return [(row, float(rank)) for row, rank in s.execute(stmt)]
+
+    def search_fulltext_page(
+        self, query: str, page_size: int = 20, cursor: str | None = None
+    ) -> Page[tuple[SalonSessionRow, float]]:
+        """One page of :meth:`search_fulltext` results, keyed on (rank, id) descending.
+
+        Unlike ``offset``, later pages cost the same as the first.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        ranked = self._fulltext_ranks(query)
+        stmt = select(SalonSessionRow, ranked.c.rank).join(
+            ranked, ranked.c.session_id == SalonSessionRow.id
+        )
+        if cursor is not None:
+            rank, last_id = decode_cursor(cursor, "fulltext")
+            stmt = stmt.where(tuple_(ranked.c.rank, SalonSessionRow.id) < tuple_(rank, last_id))
+        stmt = stmt.order_by(ranked.c.rank.desc(), SalonSessionRow.id.desc()).limit(page_size + 1)
+        with self._session() as s:
+            rows = [(row, float(rank)) for row, rank in s.execute(stmt)]
+        return _page(rows, page_size, "fulltext", lambda r: (r[1], r[0].id))
+
+    @staticmethod
+    def _fulltext_ranks(query: str) -> Any:
+        """Subquery of (session_id, rank): session rank plus best segment rank."""
+        tsq = func.plainto_tsquery(literal_column(f"'{FTS_CONFIG}'"), query)
+        session_doc = literal_column(session_tsvector(f"{SESSIONS}."))
+        segment_doc = literal_column(segment_tsvector(f"{SEGMENTS}."))
+        session_hits = select(
+            SalonSessionRow.id.label("session_id"),
+            _ts_rank(session_doc, tsq).label("rank"),
+        ).where(session_doc.op("@@")(tsq))
+        segment_hits = (
+            select(
+                SegmentRow.session_id.label("session_id"),
+                func.max(_ts_rank(segment_doc, tsq)).label("rank"),
             )
-            return list(s.scalars(stmt))
+            .where(segment_doc.op("@@")(tsq))
+            .group_by(SegmentRow.session_id)
+        )
+        hits = union_all(session_hits, segment_hits).subquery()
+        return (
+            select(hits.c.session_id, func.sum(hits.c.rank).label("rank"))
+            .group_by(hits.c.session_id)
+            .subquery()
+        )
 
-    def list_sessions(self, limit: int = 20) -> list[SalonSessionRow]:
-        """Return the most recent sessions, ordered by date descending."""
-        with Session(self._engine) as s:
-            stmt = (
-                select(SalonSessionRow)
-                .order_by(SalonSessionRow.date.desc())
-                .limit(limit)
+    def search_transcripts(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+        session_id: int | None = None,
+    ) -> list[TranscriptHit]:
+        """Find transcript segments matching ``query`` across the archive, best first.
+
+        Matches come from the segment GIN index; ``ts_headline`` snippets are
+        only computed for the requested page. ``session_id`` restricts the
+        search to one session.
+        """
+        return self._transcript_hits(query, limit, session_id, offset=offset)
+
+    def search_transcripts_page(
+        self,
+        query: str,
+        page_size: int = 20,
+        cursor: str | None = None,
+        session_id: int | None = None,
+    ) -> Page[TranscriptHit]:
+        """One page of :meth:`search_transcripts` results, keyed on (rank desc, segment id)."""
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        after = tuple(decode_cursor(cursor, "transcripts")) if cursor is not None else None
+        hits = self._transcript_hits(query, page_size + 1, session_id, after=after)
+        return _page(hits, page_size, "transcripts", lambda h: (h.rank, h.segment_id))
+
+    def _transcript_hits(
+        self,
+        query: str,
+        limit: int,
+        session_id: int | None,
+        offset: int = 0,
+        after: tuple[float, int] | None = None,
+    ) -> list[TranscriptHit]:
+        tsq = func.plainto_tsquery(literal_column(f"'{FTS_CONFIG}'"), query)
+        segment_doc = literal_column(segment_tsvector(f"{SEGMENTS}."))
+        rank = _ts_rank(segment_doc, tsq)
+        page = select(
+            SegmentRow.id,
+            SegmentRow.session_id,
+            SegmentRow.speaker,
+            SegmentRow.start_seconds,
+            SegmentRow.end_seconds,
+            SegmentRow.text,
+            rank.label("rank"),
+        ).where(segment_doc.op("@@")(tsq))
+        if session_id is not None:
+            page = page.where(SegmentRow.session_id == session_id)
+        if after is not None:
+            last_rank, last_id = after
+            page = page.where(
+                (rank < last_rank) | ((rank == last_rank) & (SegmentRow.id > last_id))
             )
-            return list(s.scalars(stmt))
+        page = (
+            page.order_by(literal_column("rank").desc(), SegmentRow.id)
+            .limit(limit)
+            .offset(offset)
+            .subquery()
+        )
+        stmt = (
+            select(
+                page.c.session_id,
+                SalonSessionRow.title,
+                page.c.speaker,
+                page.c.start_seconds,
+                page.c.end_seconds,
+                self._headline(page.c.text, tsq),
+                page.c.rank,
+                page.c.id,
+            )
+            .join(SalonSessionRow, SalonSessionRow.id == page.c.session_id)
+            .order_by(page.c.rank.desc(), page.c.id)
+        )
+        with self._session() as s:
+            return [TranscriptHit(*row) for row in s.execute(stmt)]
+
+    def iter_transcript_hits(
+        self,
+        query: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[TranscriptHit]:
+        """Stream every matching segment in archive order (session, then time).
 
-    def get_segments(self, session_id: int) -> list[SegmentRow]:
-        """Return transcript segments for a session, ordered by start time."""
-        with Session(self._engine) as s:
-            stmt = (
-                select(SegmentRow)
-                .where(SegmentRow.session_id == session_id)
-                .order_by(SegmentRow.start_seconds)
+        Rows are fetched through a server-side cursor ``batch_size`` at a
+        time, so the first hits arrive before the full result is known.
+        """
+        tsq = func.plainto_tsquery(literal_column(f"'{FTS_CONFIG}'"), query)
+        segment_doc = literal_column(segment_tsvector(f"{SEGMENTS}."))
+        stmt = (
+            select(
+                SegmentRow.session_id,
+                SalonSessionRow.title,
+                SegmentRow.speaker,
+                SegmentRow.start_seconds,
+                SegmentRow.end_seconds,
+                self._headline(SegmentRow.text, tsq),
+                _ts_rank(segment_doc, tsq),
+                SegmentRow.id,
             )
+            .join(SalonSessionRow, SalonSessionRow.id == SegmentRow.session_id)
+            .where(segment_doc.op("@@")(tsq))
+            .order_by(SegmentRow.session_id, SegmentRow.start_seconds)
+            .execution_options(yield_per=batch_size)
+        )
+        with self._session() as s:
+            for row in s.execute(stmt):
+                yield TranscriptHit(*row)
+
+    @staticmethod
+    def _headline(document: Any, tsq: Any) -> Any:
+        return func.ts_headline(literal_column(f"'{FTS_CONFIG}'"), document, tsq, HEADLINE_OPTIONS)
+
+    def list_sessions(self, limit: int = 20) -> list[SalonSessionRow]:
+        """Return the most recent sessions, ordered by date descending."""
+        return self.list_sessions_page(limit).items
+
+    def list_sessions_page(
+        self, page_size: int = 20, cursor: str | None = None
+    ) -> Page[SalonSessionRow]:
+        """One page of sessions, newest first; pass ``next_cursor`` back for the next."""
+        return self._session_page(None, page_size, cursor)
+
+    def iter_sessions(self, batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[SalonSessionRow]:
+        """Stream every session in id order through a server-side cursor."""
+        stmt = (
+            select(SalonSessionRow)
+            .order_by(SalonSessionRow.id)
+            .execution_options(yield_per=batch_size)
+        )
+        with self._session() as s:
+            yield from s.scalars(stmt)
+
+    def get_segments(
+        self,
+        session_id: int,
+        *,
+        from_seconds: float | None = None,
+        to_seconds: float | None = None,
+        speaker: str | None = None,
+    ) -> list[SegmentRow]:
+        """Return transcript segments for a session, ordered by start time.
+
+        ``from_seconds``/``to_seconds`` keep only segments overlapping that
+        time range and ``speaker`` only that speaker's turns; see
+        :func:`segments_query`.
+        """
+        with self._session() as s:
+            stmt = segments_query(session_id, from_seconds, to_seconds, speaker)
             return list(s.scalars(stmt))
 
+    def iter_segments(
+        self,
+        session_id: int,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        *,
+        from_seconds: float | None = None,
+        to_seconds: float | None = None,
+        speaker: str | None = None,
+    ) -> Iterator[SegmentRow]:
+        """Stream a session's segments in start order through a server-side cursor.
+
+        Rows are fetched ``batch_size`` at a time, so memory use does not
+        grow with transcript length. Filters are as for :meth:`get_segments`.
+        """
+        stmt = segments_query(session_id, from_seconds, to_seconds, speaker).execution_options(
+            yield_per=batch_size
+        )
+        with self._session() as s:
+            yield from s.scalars(stmt)
+
     # ── Taxonomy ──────────────────────────────────────────────────────
 
     def add_taxonomy_node(
@@ -127,7 +911,7 @@ def add_taxonomy_node(
         organ_id: int | None = None,
     ) -> int:
         """Insert a taxonomy node. Returns the new node id."""
-        with Session(self._engine) as s:
+        with self._session() as s:
             node = TaxonomyNodeRow(
                 slug=slug,
                 label=label,
@@ -136,34 +920,320 @@ def add_taxonomy_node(
                 organ_id=organ_id,
             )
             s.add(node)
-            s.commit()
+            depth = self._node_depth(s, parent_id)
+            self._bump_stats(s, ArchiveStats(taxonomy_nodes=1, taxonomy_depth=depth))
+            self._commit(s)
+            with _engines_lock:
+                _taxonomy_versions[self._engine] = self.taxonomy_version + 1
             return node.id
 
+    @staticmethod
+    def _node_depth(s: Session, parent_id: int | None) -> int:
+        """Depth of a node under ``parent_id``, counting a root as depth 1."""
+        if parent_id is None:
+            return 1
+        up = (
+            select(TaxonomyNodeRow.id, TaxonomyNodeRow.parent_id)
+            .where(TaxonomyNodeRow.id == parent_id)
+            .cte("taxonomy_ancestors", recursive=True)
+        )
+        up = up.union_all(
+            select(TaxonomyNodeRow.id, TaxonomyNodeRow.parent_id).join(
+                up, TaxonomyNodeRow.id == up.c.parent_id
+            )
+        )
+        return s.scalar(select(func.count()).select_from(up)) + 1
+
+    @property
+    def taxonomy_version(self) -> int:
+        """Counter bumped by each taxonomy write made in this process."""
+        return _taxonomy_versions.get(self._engine, 0)
+
+    def get_taxonomy_nodes(self) -> list[TaxonomyNodeRow]:
+        """Return every taxonomy node, ordered by id."""
+        with self._session() as s:
+            return list(s.scalars(select(TaxonomyNodeRow).order_by(TaxonomyNodeRow.id)))
+
     def get_taxonomy_roots(self) -> list[TaxonomyNodeRow]:
         """Return all root-level taxonomy nodes (parent_id IS NULL)."""
-        with Session(self._engine) as s:
-            stmt = select(TaxonomyNodeRow).where(
-                TaxonomyNodeRow.parent_id.is_(None)
-            )
+        with self._session() as s:
+            stmt = select(TaxonomyNodeRow).where(TaxonomyNodeRow.parent_id.is_(None))
             return list(s.scalars(stmt))
 
     def search_taxonomy(self, query: str) -> list[TaxonomyNodeRow]:
         """Search taxonomy by label or description (case-insensitive ILIKE)."""
-        with Session(self._engine) as s:
+        with self._session() as s:
             q = f"%{query}%"
             stmt = select(TaxonomyNodeRow).where(
                 TaxonomyNodeRow.label.ilike(q) | TaxonomyNodeRow.description.ilike(q)
             )
             return list(s.scalars(stmt))
 
-    # ── Counts ────────────────────────────────────────────────────────
+    # ── Fuzzy search ──────────────────────────────────────────────────
+
+    def fuzzy_search_sessions(
+        self, query: str, threshold: float = 0.3, limit: int = 20
+    ) -> list[tuple[SalonSessionRow, float]]:
+        """Sessions whose title resembles ``query`` (typos allowed), most similar first.
+
+        Uses ``pg_trgm`` word similarity, served by the trigram index from
+        ``schema.MIGRATIONS``. Returns ``(session, similarity)`` pairs.
+        """
+        return self._fuzzy(select(SalonSessionRow), SalonSessionRow.title, query, threshold, limit)
+
+    def fuzzy_search_taxonomy(
+        self, query: str, threshold: float = 0.3, limit: int = 20
+    ) -> list[tuple[TaxonomyNodeRow, float]]:
+        """Taxonomy nodes whose label resembles ``query``, most similar first."""
+        return self._fuzzy(select(TaxonomyNodeRow), TaxonomyNodeRow.label, query, threshold, limit)
+
+    def fuzzy_search_speakers(
+        self, query: str, threshold: float = 0.3, limit: int = 20
+    ) -> list[tuple[str, float]]:
+        """Distinct transcript speaker names resembling ``query``, most similar first."""
+        stmt = select(SegmentRow.speaker).group_by(SegmentRow.speaker)
+        return self._fuzzy(stmt, SegmentRow.speaker, query, threshold, limit)
+
+    def _fuzzy(
+        self, stmt: Any, column: Any, query: str, threshold: float, limit: int
+    ) -> list[tuple[Any, float]]:
+        """Add a ``query <% column`` filter and similarity ordering to ``stmt``.
+
+        ``<%`` is the indexable form of ``word_similarity >= threshold``;
+        the threshold is set for the current transaction only.
+        """
+        if not 0.0 <= threshold <= 1.0:
+            raise ValueError("threshold must be between 0 and 1")
+        score = func.word_similarity(query, column)
+        stmt = (
+            stmt.add_columns(score)
+            .where(literal(query).op("<%")(column))
+            .order_by(score.desc(), column)
+            .limit(limit)
+        )
+        with self._session() as s:
+            s.execute(
+                select(func.set_config("pg_trgm.word_similarity_threshold", str(threshold), True))
+            )
+            return [(row[0], float(row[1])) for row in s.execute(stmt)]
+
+    # ── Ingest runs ───────────────────────────────────────────────────
+
+    def get_ingest_run(self, session_key: str) -> IngestRun | None:
+        """The checkpoint for an ingest key, or None if it was never ingested."""
+        with self._session() as s:
+            row = s.execute(
+                select(ingest_runs_table).where(ingest_runs_table.c.session_key == session_key)
+            ).first()
+        if row is None:
+            return None
+        return IngestRun(row.session_key, row.session_id, row.status, row.segments_written)
+
+    def begin_ingest_run(self, session_key: str, session: dict[str, Any]) -> IngestRun:
+        """Return the checkpoint for ``session_key``, creating its session on first use.
+
+        The session row (without segments) and the checkpoint are inserted
+        under a savepoint, the checkpoint with ``ON CONFLICT DO NOTHING``: if
+        a concurrent ingest of the same key got there first, the savepoint
+        (and the new session row) is rolled back and that run is returned,
+        so a key maps to exactly one session however often it is started.
+        """
+        with self.transaction() as repo, repo._session() as s:
+            run = repo.get_ingest_run(session_key)
+            if run is not None:
+                return run
+            savepoint = s.begin_nested()
+            session_id = repo.add_sessions_bulk([{**session, "segments": []}])[0]
+            created = s.execute(
+                _insert_ignoring_conflicts(s, ingest_runs_table)
+                .values(
+                    session_key=session_key,
+                    session_id=session_id,
+                    status=INGEST_RUNNING,
+                    segments_written=0,
+                    updated_at=time.time(),
+                )
+                .returning(ingest_runs_table.c.session_key)
+            ).first()
+            if created is None:
+                savepoint.rollback()
+                run = repo.get_ingest_run(session_key)
+                if run is None:
+                    raise RuntimeError(f"ingest run {session_key!r} conflicted but is missing")
+                return run
+            savepoint.commit()
+            return IngestRun(session_key, session_id)
+
+    def append_ingest_segments(
+        self, session_key: str, session_id: int, segments: Iterable[dict[str, Any]]
+    ) -> int:
+        """Insert segments and advance the key's checkpoint in the same transaction."""
+        delta = ArchiveStats()
+        with self._session() as s:
+            count = self._insert_segments(s, session_id, segments, DEFAULT_BATCH_SIZE, delta)
+            s.execute(
+                update(ingest_runs_table)
+                .where(ingest_runs_table.c.session_key == session_key)
+                .values(
+                    segments_written=ingest_runs_table.c.segments_written + count,
+                    updated_at=time.time(),
+                )
+            )
+            self._bump_stats(s, delta)
+            self._commit(s)
+        return count
+
+    def finish_ingest_run(self, session_key: str) -> None:
+        """Mark an ingest key completed; later ingests of it are no-ops."""
+        with self._session() as s:
+            s.execute(
+                update(ingest_runs_table)
+                .where(ingest_runs_table.c.session_key == session_key)
+                .values(status=INGEST_COMPLETED, updated_at=time.time())
+            )
+            self._commit(s)
+
+    # ── Counts and statistics ─────────────────────────────────────────
 
     def count_sessions(self) -> int:
         """Return the total number of salon sessions."""
-        with Session(self._engine) as s:
-            return s.query(SalonSessionRow).count()
+        with self._session() as s:
+            return s.scalar(select(func.count()).select_from(SalonSessionRow))
 
     def count_taxonomy_nodes(self) -> int:
         """Return the total number of taxonomy nodes."""
-        with Session(self._engine) as s:
-            return s.query(TaxonomyNodeRow).count()
+        with self._session() as s:
+            return s.scalar(select(func.count()).select_from(TaxonomyNodeRow))
+
+    def compute_stats(self) -> ArchiveStats:
+        """Aggregate the whole archive with set-based SQL (one pass per grouping).
+
+        Months are bucketed in UTC, as :func:`~.stats.session_month` does.
+        """
+        with self._session() as s:
+            return self._compute_stats(s)
+
+    @classmethod
+    def _compute_stats(cls, s: Session) -> ArchiveStats:
+        stats = ArchiveStats()
+        for name, stmt in cls._stats_statements().items():
+            cls._fill_stats(stats, name, s.execute(stmt).all())
+        return stats
+
+    @classmethod
+    def _stats_statements(cls) -> dict[str, Any]:
+        """The independent aggregate queries behind :meth:`compute_stats`, by figure."""
+        length = SegmentRow.end_seconds - SegmentRow.start_seconds
+        tags = select(func.unnest(SalonSessionRow.organ_tags).label("tag")).subquery()
+        utc = func.timezone(literal_column("'UTC'"), SalonSessionRow.date)
+        month = func.to_char(utc, literal_column("'YYYY-MM'")).label("month")
+        return {
+            "sessions": select(func.count()).select_from(SalonSessionRow),
+            "taxonomy_nodes": select(func.count()).select_from(TaxonomyNodeRow),
+            "segments": select(func.count(), func.coalesce(func.sum(length), 0.0)),
+            "taxonomy_depth": cls._taxonomy_depth(),
+            "by_format": select(SalonSessionRow.format, func.count()).group_by(
+                SalonSessionRow.format
+            ),
+            "by_month": select(month, func.count()).group_by(month),
+            "by_tag": select(tags.c.tag, func.count()).group_by(tags.c.tag),
+            "speaker_seconds": select(SegmentRow.speaker, func.sum(length)).group_by(
+                SegmentRow.speaker
+            ),
+        }
+
+    @staticmethod
+    def _fill_stats(stats: ArchiveStats, name: str, rows: list[Any]) -> None:
+        """Store the result rows of one :meth:`_stats_statements` query."""
+        if name in ("sessions", "taxonomy_nodes"):
+            setattr(stats, name, rows[0][0])
+        elif name == "taxonomy_depth":
+            stats.taxonomy_depth = rows[0][0] or 0
+        elif name == "segments":
+            stats.segments, stats.transcript_seconds = rows[0][0], float(rows[0][1])
+        elif name == "speaker_seconds":
+            for key, total in rows:
+                stats.speaker_seconds[key] = float(total or 0.0)
+        else:
+            counter = getattr(stats, name)
+            for key, n in rows:
+                counter[key or "undated"] = n
+
+    @staticmethod
+    def _taxonomy_depth() -> Any:
+        """``SELECT max(depth)`` over a recursive walk down from the roots."""
+        walk = (
+            select(TaxonomyNodeRow.id, literal_column("1").label("depth"))
+            .where(TaxonomyNodeRow.parent_id.is_(None))
+            .cte("taxonomy_walk", recursive=True)
+        )
+        walk = walk.union_all(
+            select(TaxonomyNodeRow.id, (walk.c.depth + 1).label("depth")).join(
+                walk, TaxonomyNodeRow.parent_id == walk.c.id
+            )
+        )
+        return select(func.max(walk.c.depth))
+
+    def refresh_stats(self) -> ArchiveStats:
+        """Recompute every figure and replace the ``salon_stats`` summary table.
+
+        Runs in one transaction. On Postgres it first locks the table in
+        SHARE ROW EXCLUSIVE mode, which conflicts with the row lock taken by
+        :meth:`_bump_stats`: writers that already added their delta commit
+        before the figures are computed, and later ones wait for the new
+        figures, so no insert is lost or counted twice.
+        """
+        with self._session() as s:
+            if s.get_bind().dialect.name == "postgresql":
+                s.execute(text(f"LOCK TABLE {STATS} IN SHARE ROW EXCLUSIVE MODE"))
+            stats = self._compute_stats(s)
+            stats.refreshed_at = time.time()
+            rows = [{"dimension": d, "key": k, "value": v} for d, k, v in stats.to_rows()]
+            s.execute(delete(stats_table))
+            s.execute(insert(stats_table), rows)
+            self._commit(s)
+        return stats
+
+    def cached_stats(self) -> ArchiveStats | None:
+        """Read figures from the summary table; None if it has never been refreshed."""
+        with self._session() as s:
+            rows = s.execute(
+                select(stats_table.c.dimension, stats_table.c.key, stats_table.c.value)
+            ).all()
+        stats = ArchiveStats.from_rows(rows)
+        return stats if stats.refreshed_at is not None else None
+
+    @staticmethod
+    def _bump_stats(s: Session, delta: ArchiveStats) -> None:
+        """Add ``delta`` to the summary table in the caller's transaction.
+
+        ``taxonomy_depth`` is a maximum, not a sum: the delta carries the
+        depth of the added node and the stored figure keeps the larger one.
+        Skipped until the table exists and has had a full refresh, so the
+        cached figures never describe only part of the archive. A no-op on
+        databases other than Postgres.
+        """
+        rows = delta.to_rows()
+        if not rows or s.get_bind().dialect.name != "postgresql":
+            return
+        if not s.scalar(select(func.to_regclass(STATS).isnot(None))):
+            return
+        refreshed = select(stats_table.c.value).where(
+            stats_table.c.dimension == "meta", stats_table.c.key == "refreshed_at"
+        )
+        if s.scalar(refreshed) is None:
+            return
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+        stmt = pg_insert(stats_table)
+        is_depth = (stats_table.c.dimension == "total") & (stats_table.c.key == "taxonomy_depth")
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[stats_table.c.dimension, stats_table.c.key],
+            set_={
+                "value": case(
+                    (is_depth, func.greatest(stats_table.c.value, stmt.excluded.value)),
+                    else_=stats_table.c.value + stmt.excluded.value,
+                )
+            },
+        )
+        s.execute(stmt, [{"dimension": d, "key": k, "value": v} for d, k, v in rows])
@@ -0,0 +1,170 @@
+"""Supplementary indexes and tables for the salon archive.
+
+The ORM models (and their base DDL) live in koinonia-db. This module holds
+the additional indexes and side tables that salon-archive's query paths
+depend on, as idempotent migrations that can be re-applied on every deploy
+via ``salon migrate``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from koinonia_db.models.salon import SalonSessionRow, TaxonomyNodeRow
+from koinonia_db.models.salon import Segment as SegmentRow
+from sqlalchemy import Column, Engine, Float, Integer, MetaData, String, Table, text
+
+SESSIONS = SalonSessionRow.__tablename__
+SEGMENTS = SegmentRow.__tablename__
+TAXONOMY = TaxonomyNodeRow.__tablename__
+STATS = "salon_stats"
+INGEST_RUNS = "salon_ingest_runs"
+
+# Text search configuration used by both the indexes and the queries.
+# The two must agree literally for Postgres to match the expression index.
+FTS_CONFIG = "english"
+
+
+def session_tsvector(qualifier: str = "") -> str:
+    """SQL for the weighted session document: title (A) and notes (B)."""
+    return (
+        f"(setweight(to_tsvector('{FTS_CONFIG}', coalesce({qualifier}title, '')), 'A')"
+        f" || setweight(to_tsvector('{FTS_CONFIG}', coalesce({qualifier}notes, '')), 'B'))"
+    )
+
+
+def segment_tsvector(qualifier: str = "") -> str:
+    """SQL for a transcript segment document."""
+    return f"to_tsvector('{FTS_CONFIG}', coalesce({qualifier}text, ''))"
+
+
+# Side tables owned by salon-archive, for Core queries
+metadata = MetaData()
+
+stats_table = Table(
+    STATS,
+    metadata,
+    Column("dimension", String(32), primary_key=True),
+    Column("key", String(255), primary_key=True),
+    Column("value", Float, nullable=False),
+)
+
+ingest_runs_table = Table(
+    INGEST_RUNS,
+    metadata,
+    Column("session_key", String(255), primary_key=True),
+    Column("session_id", Integer, nullable=False),
+    Column("status", String(16), nullable=False),
+    Column("segments_written", Integer, nullable=False, default=0),
+    Column("updated_at", Float, nullable=False),
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    """A named group of idempotent DDL statements."""
+
+    name: str
+    statements: tuple[str, ...]
+
+
+MIGRATIONS: list[Migration] = [
+    Migration(
+        "001_fulltext_search",
+        (
+            (
+                f"CREATE INDEX IF NOT EXISTS ix_{SESSIONS}_fts "
+                f"ON {SESSIONS} USING gin ({session_tsvector()})"
+            ),
+            (
+                f"CREATE INDEX IF NOT EXISTS ix_{SEGMENTS}_fts "
+                f"ON {SEGMENTS} USING gin ({segment_tsvector()})"
+            ),
+        ),
+    ),
+    Migration(
+        "002_archive_stats",
+        (
+            (
+                f"CREATE TABLE IF NOT EXISTS {STATS} ("
+                "dimension varchar(32) NOT NULL, "
+                "key varchar(255) NOT NULL, "
+                "value double precision NOT NULL, "
+                "PRIMARY KEY (dimension, key))"
+            ),
+        ),
+    ),
+    Migration(
+        "003_organ_tags_gin",
+        (
+            (
+                f"CREATE INDEX IF NOT EXISTS ix_{SESSIONS}_organ_tags "
+                f"ON {SESSIONS} USING gin (organ_tags)"
+            ),
+        ),
+    ),
+    Migration(
+        "004_trigram_search",
+        (
+            "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+            (
+                f"CREATE INDEX IF NOT EXISTS ix_{SESSIONS}_title_trgm "
+                f"ON {SESSIONS} USING gin (title gin_trgm_ops)"
+            ),
+            (
+                f"CREATE INDEX IF NOT EXISTS ix_{TAXONOMY}_label_trgm "
+                f"ON {TAXONOMY} USING gin (label gin_trgm_ops)"
+            ),
+            (
+                f"CREATE INDEX IF NOT EXISTS ix_{SEGMENTS}_speaker_trgm "
+                f"ON {SEGMENTS} USING gin (speaker gin_trgm_ops)"
+            ),
+        ),
+    ),
+    Migration(
+        "005_ingest_runs",
+        (
+            (
+                f"CREATE TABLE IF NOT EXISTS {INGEST_RUNS} ("
+                "session_key varchar(255) PRIMARY KEY, "
+                f"session_id integer NOT NULL REFERENCES {SESSIONS} (id) ON DELETE CASCADE, "
+                "status varchar(16) NOT NULL, "
+                "segments_written integer NOT NULL DEFAULT 0, "
+                "updated_at double precision NOT NULL)"
+            ),
+        ),
+    ),
+    Migration(
+        "006_segment_seek",
+        (
+            (
+                f"CREATE INDEX IF NOT EXISTS ix_{SEGMENTS}_session_start "
+                f"ON {SEGMENTS} (session_id, start_seconds, end_seconds)"
+            ),
+            (
+                f"CREATE INDEX IF NOT EXISTS ix_{SEGMENTS}_session_speaker "
+                f"ON {SEGMENTS} (session_id, speaker, start_seconds)"
+            ),
+        ),
+    ),
+    Migration(
+        "007_sessions_date_keyset",
+        (
+            (
+                f"CREATE INDEX IF NOT EXISTS ix_{SESSIONS}_date_id "
+                f"ON {SESSIONS} (date DESC NULLS LAST, id DESC)"
+            ),
+        ),
+    ),
+]
+
+
+def apply_migrations(engine: Engine) -> list[str]:
+    """Apply every migration in order inside one transaction. Returns their names."""
+    applied: list[str] = []
+    with engine.begin() as conn:
+        for migration in MIGRATIONS:
+            for statement in migration.statements:
+                conn.execute(text(statement))
+            applied.append(migration.name)
+    return applied
@@ -0,0 +1,325 @@
+"""On-disk inverted index for searching the archive without a database.
+
+Built from seed JSON or exported session dicts, the index is two files in
+a directory:
+
+  index.json    — document table, BM25 statistics, and term dictionary
+                  (term -> [offset, length, document frequency])
+  postings.bin  — concatenated postings lists, memory-mapped at query time
+
+Each postings list is a run of unsigned LEB128 varints: for every document,
+the doc-id delta, the term frequency, then that many position deltas.
+Positions make phrase queries possible; tags are indexed as ``tag:<slug>``
+terms in the same dictionary.
+
+Query syntax: bare words are OR-ed and BM25-ranked, ``"quoted phrases"``
+must appear verbatim, and ``tag:<slug>`` restricts to sessions carrying
+that organ tag.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import mmap
+import os
+import re
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Self
+
+from .fuzzy import TrigramIndex
+
+INDEX_VERSION = 1
+INDEX_FILE = "index.json"
+POSTINGS_FILE = "postings.bin"
+TAG_PREFIX = "tag:"
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Position gap between fields so phrases cannot span title/notes/segments
+FIELD_GAP = 16
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_QUERY_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase ``text`` and split it into alphanumeric tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+# ── Varint codec ──────────────────────────────────────────────────────
+
+
+def _encode_varint(value: int, out: bytearray) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _decode_varint(buf: bytes | mmap.mmap, pos: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+# ── Build ─────────────────────────────────────────────────────────────
+
+
+def _session_fields(session: dict[str, Any]) -> list[str]:
+    fields = [session.get("title") or "", session.get("notes") or ""]
+    fields.extend(seg.get("text", "") for seg in session.get("segments", []))
+    return fields
+
+
+def build_index(sessions: Iterable[dict[str, Any]], out_dir: Path) -> Path:
+    """Build an index for ``sessions`` in ``out_dir`` and return the directory."""
+    postings: dict[str, dict[int, list[int]]] = defaultdict(dict)
+    docs: list[dict[str, Any]] = []
+    for doc_id, session in enumerate(sessions):
+        position = length = 0
+        for field_text in _session_fields(session):
+            for token in tokenize(field_text):
+                postings[token].setdefault(doc_id, []).append(position)
+                position += 1
+                length += 1
+            position += FIELD_GAP
+        for tag in session.get("organ_tags", []):
+            postings[TAG_PREFIX + tag.lower()].setdefault(doc_id, []).append(0)
+        docs.append(
+            {
+                "session_id": session.get("id"),
+                "title": session.get("title", ""),
+                "date": session.get("date"),
+                "organ_tags": session.get("organ_tags", []),
+                "length": length,
+            }
+        )
+
+    blob = bytearray()
+    terms: dict[str, list[int]] = {}
+    for term in sorted(postings):
+        start = len(blob)
+        prev_doc = 0
+        for doc_id, positions in sorted(postings[term].items()):
+            _encode_varint(doc_id - prev_doc, blob)
+            _encode_varint(len(positions), blob)
+            prev_pos = 0
+            for p in positions:
+                _encode_varint(p - prev_pos, blob)
+                prev_pos = p
+            prev_doc = doc_id
+        terms[term] = [start, len(blob) - start, len(postings[term])]
+
+    total_length = sum(d["length"] for d in docs)
+    meta = {
+        "version": INDEX_VERSION,
+        "doc_count": len(docs),
+        "avg_length": total_length / len(docs) if docs else 0.0,
+        "docs": docs,
+        "terms": terms,
+    }
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    tmp_postings = out_dir / (POSTINGS_FILE + ".tmp")
+    tmp_postings.write_bytes(bytes(blob))
+    tmp_meta = out_dir / (INDEX_FILE + ".tmp")
+    tmp_meta.write_text(json.dumps(meta, separators=(",", ":")))
+    os.replace(tmp_postings, out_dir / POSTINGS_FILE)
+    os.replace(tmp_meta, out_dir / INDEX_FILE)
+    return out_dir
+
+
+# ── Query ─────────────────────────────────────────────────────────────
+
+
+@dataclass
+class SearchHit:
+    """A session matching a local index query."""
+
+    session_id: int | None
+    title: str
+    date: str | None
+    organ_tags: list[str]
+    score: float
+
+
+@dataclass
+class ParsedQuery:
+    """A query split into free terms, phrases, and tag filters."""
+
+    terms: list[str]
+    phrases: list[list[str]]
+    tags: list[str]
+
+
+def parse_query(query: str) -> ParsedQuery:
+    """Parse ``query`` into bare terms, ``"phrases"``, and ``tag:`` filters."""
+    parsed = ParsedQuery(terms=[], phrases=[], tags=[])
+    for phrase, word in _QUERY_RE.findall(query):
+        if phrase:
+            tokens = tokenize(phrase)
+            if len(tokens) > 1:
+                parsed.phrases.append(tokens)
+            else:
+                parsed.terms.extend(tokens)
+        elif word.lower().startswith(TAG_PREFIX):
+            tag = word[len(TAG_PREFIX) :].lower()
+            if tag:
+                parsed.tags.append(tag)
+        else:
+            parsed.terms.extend(tokenize(word))
+    return parsed
+
+
+class LocalSearchIndex:
+    """Read-only view of an index directory with memory-mapped postings."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        meta = json.loads((self.path / INDEX_FILE).read_text())
+        if meta.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported index version: {meta.get('version')}")
+        self._docs: list[dict[str, Any]] = meta["docs"]
+        self._terms: dict[str, list[int]] = meta["terms"]
+        self._avg_length: float = meta["avg_length"] or 1.0
+        self._titles: TrigramIndex | None = None
+        # The map holds its own reference to the file, so it can be closed here
+        with open(self.path / POSTINGS_FILE, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            self._postings: bytes | mmap.mmap = (
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+            )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if isinstance(self._postings, mmap.mmap):
+            self._postings.close()
+
+    @property
+    def doc_count(self) -> int:
+        return len(self._docs)
+
+    def postings(self, term: str) -> dict[int, list[int]]:
+        """Decode the postings list for ``term`` as doc id -> positions."""
+        entry = self._terms.get(term)
+        if entry is None:
+            return {}
+        offset, length, _df = entry
+        buf, pos, end = self._postings, offset, offset + length
+        result: dict[int, list[int]] = {}
+        doc_id = 0
+        while pos < end:
+            delta, pos = _decode_varint(buf, pos)
+            doc_id += delta
+            tf, pos = _decode_varint(buf, pos)
+            positions: list[int] = []
+            p = 0
+            for _ in range(tf):
+                gap, pos = _decode_varint(buf, pos)
+                p += gap
+                positions.append(p)
+            result[doc_id] = positions
+        return result
+
+    def search(self, query: str, limit: int = 20) -> list[SearchHit]:
+        """Return up to ``limit`` sessions matching ``query``, best BM25 score first."""
+        parsed = parse_query(query)
+        cache: dict[str, dict[int, list[int]]] = {}
+
+        def lookup(term: str) -> dict[int, list[int]]:
+            if term not in cache:
+                cache[term] = self.postings(term)
+            return cache[term]
+
+        # Filters: every tag and every phrase must match
+        candidates: set[int] | None = None
+        for tag in parsed.tags:
+            docs = set(lookup(TAG_PREFIX + tag))
+            candidates = docs if candidates is None else candidates & docs
+        for phrase in parsed.phrases:
+            docs = self._phrase_docs([lookup(t) for t in phrase])
+            candidates = docs if candidates is None else candidates & docs
+
+        # Bare terms: a document must contain at least one of them
+        bare = set(parsed.terms)
+        matched: set[int] = set()
+        scored_terms = parsed.terms + [t for phrase in parsed.phrases for t in phrase]
+        scores: dict[int, float] = defaultdict(float)
+        for term in dict.fromkeys(scored_terms):
+            plist = lookup(term)
+            if not plist:
+                continue
+            idf = math.log(1 + (self.doc_count - len(plist) + 0.5) / (len(plist) + 0.5))
+            for doc_id, positions in plist.items():
+                if candidates is not None and doc_id not in candidates:
+                    continue
+                tf = len(positions)
+                norm = 1 - B + B * self._docs[doc_id]["length"] / self._avg_length
+                scores[doc_id] += idf * tf * (K1 + 1) / (tf + K1 * norm)
+                if term in bare:
+                    matched.add(doc_id)
+
+        if bare:
+            scores = {doc_id: score for doc_id, score in scores.items() if doc_id in matched}
+        elif candidates is not None:
+            # Filters alone: every candidate is a hit, unscored
+            for doc_id in candidates:
+                scores.setdefault(doc_id, 0.0)
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        return [self._hit(doc_id, score) for doc_id, score in ranked]
+
+    def fuzzy_search(self, query: str, threshold: float = 0.3, limit: int = 20) -> list[SearchHit]:
+        """Sessions whose title resembles ``query`` (typos allowed); ``score`` is similarity.
+
+        The trigram index over titles is built on first use.
+        """
+        if self._titles is None:
+            self._titles = TrigramIndex(
+                (doc_id, doc["title"] or "") for doc_id, doc in enumerate(self._docs)
+            )
+        return [
+            self._hit(match.key, match.score)
+            for match in self._titles.search(query, threshold, limit)
+        ]
+
+    @staticmethod
+    def _phrase_docs(plists: list[dict[int, list[int]]]) -> set[int]:
+        if not plists or not all(plists):
+            return set()
+        docs = set(plists[0]).intersection(*plists[1:])
+        matched: set[int] = set()
+        for doc_id in docs:
+            later = [set(pl[doc_id]) for pl in plists[1:]]
+            for start in plists[0][doc_id]:
+                if all(start + i + 1 in positions for i, positions in enumerate(later)):
+                    matched.add(doc_id)
+                    break
+        return matched
+
+    def _hit(self, doc_id: int, score: float) -> SearchHit:
+        doc = self._docs[doc_id]
+        return SearchHit(
+            session_id=doc["session_id"],
+            title=doc["title"],
+            date=doc["date"],
+            organ_tags=doc["organ_tags"],
+            score=score,
+        )
@@ -0,0 +1,117 @@
+"""Archive statistics and their summary-table representation.
+
+``SalonRepository.compute_stats`` aggregates the archive in set-based SQL;
+``refresh_stats`` stores the result in the ``salon_stats`` summary table
+(one ``(dimension, key, value)`` row per figure) so dashboards read a few
+dozen rows instead of scanning sessions and segments. Inserts through the
+repository add their own contribution to the table as they commit.
+
+Dimensions:
+
+  total    sessions, segments, taxonomy_nodes, taxonomy_depth, transcript_seconds
+  format   sessions per format
+  month    sessions per ``YYYY-MM`` (UTC)
+  tag      sessions per organ tag
+  speaker  talk time in seconds per speaker
+  meta     refreshed_at (Unix time of the last full refresh)
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime
+from typing import Any
+
+TOTALS = ("sessions", "segments", "taxonomy_nodes", "taxonomy_depth", "transcript_seconds")
+
+
+def session_month(value: date | str | None) -> str:
+    """``YYYY-MM`` for a session date in UTC, as the month dimension keys it.
+
+    Aware datetimes (and ISO strings with an offset) are converted to UTC,
+    as ``compute_stats`` does in SQL; naive ones are taken to be UTC.
+    """
+    if value is None:
+        return "undated"
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return value[:7]
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        value = value.astimezone(UTC)
+    return value.strftime("%Y-%m")
+
+
+@dataclass
+class ArchiveStats:
+    """Aggregate figures for the archive (or a delta to add to them)."""
+
+    sessions: int = 0
+    segments: int = 0
+    taxonomy_nodes: int = 0
+    taxonomy_depth: int = 0
+    transcript_seconds: float = 0.0
+    by_format: Counter[str] = field(default_factory=Counter)
+    by_month: Counter[str] = field(default_factory=Counter)
+    by_tag: Counter[str] = field(default_factory=Counter)
+    speaker_seconds: Counter[str] = field(default_factory=Counter)
+    refreshed_at: float | None = None
+
+    @property
+    def transcript_hours(self) -> float:
+        return self.transcript_seconds / 3600
+
+    def add_session(self, session: dict[str, Any]) -> None:
+        """Count one session dict (not its segments) into these figures."""
+        self.sessions += 1
+        self.by_format[session["format"]] += 1
+        self.by_month[session_month(session.get("date"))] += 1
+        for tag in session.get("organ_tags") or []:
+            self.by_tag[tag] += 1
+
+    def add_segments(self, segments: Iterable[dict[str, Any]]) -> None:
+        """Count segment dicts (``speaker``, ``start_seconds``, ``end_seconds``)."""
+        for seg in segments:
+            length = seg["end_seconds"] - seg["start_seconds"]
+            self.segments += 1
+            self.transcript_seconds += length
+            self.speaker_seconds[seg["speaker"]] += length
+
+    def to_rows(self) -> list[tuple[str, str, float]]:
+        """Flatten to summary-table rows, omitting zero totals."""
+        rows = [
+            ("total", name, float(getattr(self, name))) for name in TOTALS if getattr(self, name)
+        ]
+        for dimension, counts in (
+            ("format", self.by_format),
+            ("month", self.by_month),
+            ("tag", self.by_tag),
+            ("speaker", self.speaker_seconds),
+        ):
+            rows.extend((dimension, key, float(value)) for key, value in counts.items())
+        if self.refreshed_at is not None:
+            rows.append(("meta", "refreshed_at", self.refreshed_at))
+        return rows
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple[str, str, float]]) -> ArchiveStats:
+        """Rebuild from summary-table rows."""
+        stats = cls()
+        counters = {
+            "format": stats.by_format,
+            "month": stats.by_month,
+            "tag": stats.by_tag,
+        }
+        for dimension, key, value in rows:
+            if dimension == "total" and key in TOTALS:
+                setattr(stats, key, value if key == "transcript_seconds" else int(value))
+            elif dimension in counters:
+                counters[dimension][key] = int(value)
+            elif dimension == "speaker":
+                stats.speaker_seconds[key] = value
+            elif dimension == "meta" and key == "refreshed_at":
+                stats.refreshed_at = value
+        return stats
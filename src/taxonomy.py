@@ -0,0 +1,194 @@
+"""In-memory taxonomy tree with constant-time lookups.
+
+The taxonomy is small and read far more often than it is written, so
+:class:`TaxonomyTree` loads every node once and indexes it: id and slug
+maps, child lists, the ancestor path of each node, and an Euler-tour
+interval ``[enter, exit)`` over a preorder walk. A node's subtree is then
+a contiguous slice of the preorder list, and ``a`` is a descendant of
+``b`` exactly when ``a.enter`` falls inside ``b``'s interval.
+
+:class:`TaxonomyService` holds a tree for a repository and reloads it
+after taxonomy writes made in this process (or after ``ttl`` seconds,
+for writes made elsewhere).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .repository import SalonRepository
+
+
+@dataclass(slots=True)
+class TaxonomyNode:
+    """A detached taxonomy node with its position in the tree."""
+
+    id: int
+    slug: str
+    label: str
+    parent_id: int | None = None
+    description: str = ""
+    organ_id: int | None = None
+    children: list[int] = field(default_factory=list)
+    ancestors: tuple[int, ...] = ()
+    enter: int = 0
+    exit: int = 0
+
+    @property
+    def depth(self) -> int:
+        """1 for a root, 2 for its children, and so on."""
+        return len(self.ancestors) + 1
+
+
+class TaxonomyTree:
+    """Indexed, read-only snapshot of the taxonomy."""
+
+    def __init__(self, nodes: Iterable[TaxonomyNode]) -> None:
+        self._by_id: dict[int, TaxonomyNode] = {}
+        self._by_slug: dict[str, TaxonomyNode] = {}
+        for node in nodes:
+            self._by_id[node.id] = node
+            self._by_slug[node.slug] = node
+        self.roots: list[int] = []
+        for node in self._by_id.values():
+            node.children.clear()
+        for node in self._by_id.values():
+            parent = self._by_id.get(node.parent_id) if node.parent_id is not None else None
+            if parent is None:
+                self.roots.append(node.id)
+            else:
+                parent.children.append(node.id)
+        self._preorder: list[int] = []
+        self._index()
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Any]) -> TaxonomyTree:
+        """Build from ``TaxonomyNodeRow``-like objects (or anything with the same attributes)."""
+        return cls(
+            TaxonomyNode(
+                id=row.id,
+                slug=row.slug,
+                label=row.label,
+                parent_id=row.parent_id,
+                description=row.description or "",
+                organ_id=row.organ_id,
+            )
+            for row in rows
+        )
+
+    def _index(self) -> None:
+        """Assign ancestor paths and Euler-tour intervals with an explicit stack."""
+        for root in self.roots:
+            stack: list[tuple[int, bool]] = [(root, False)]
+            while stack:
+                node_id, done = stack.pop()
+                node = self._by_id[node_id]
+                if done:
+                    node.exit = len(self._preorder)
+                    continue
+                node.enter = len(self._preorder)
+                self._preorder.append(node_id)
+                if node.parent_id is not None and node.parent_id in self._by_id:
+                    parent = self._by_id[node.parent_id]
+                    node.ancestors = parent.ancestors + (parent.id,)
+                stack.append((node_id, True))
+                stack.extend((child, False) for child in reversed(node.children))
+        if len(self._preorder) != len(self._by_id):
+            raise ValueError("Taxonomy contains a parent cycle")
+
+    # ── Lookups ───────────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, key: int | str) -> bool:
+        return key in (self._by_slug if isinstance(key, str) else self._by_id)
+
+    def get(self, node_id: int) -> TaxonomyNode | None:
+        return self._by_id.get(node_id)
+
+    def by_slug(self, slug: str) -> TaxonomyNode | None:
+        return self._by_slug.get(slug)
+
+    def _node(self, key: int | str) -> TaxonomyNode:
+        node = self._by_slug.get(key) if isinstance(key, str) else self._by_id.get(key)
+        if node is None:
+            raise KeyError(key)
+        return node
+
+    def children(self, key: int | str) -> list[TaxonomyNode]:
+        """Direct children of a node, in load order."""
+        return [self._by_id[c] for c in self._node(key).children]
+
+    def ancestors(self, key: int | str) -> list[TaxonomyNode]:
+        """Path from the root down to (not including) the node."""
+        return [self._by_id[a] for a in self._node(key).ancestors]
+
+    def subtree(self, key: int | str) -> list[TaxonomyNode]:
+        """The node and all its descendants, in preorder."""
+        node = self._node(key)
+        return [self._by_id[i] for i in self._preorder[node.enter : node.exit]]
+
+    def is_descendant(self, key: int | str, of: int | str) -> bool:
+        """True if ``key`` is ``of`` or lies beneath it."""
+        node, ancestor = self._node(key), self._node(of)
+        return ancestor.enter <= node.enter < ancestor.exit
+
+    def expand_slugs(self, slugs: Iterable[str]) -> list[str]:
+        """Slugs plus the slugs of all their descendants, without duplicates.
+
+        Unknown slugs are passed through unchanged so free-form tags still match.
+        """
+        expanded: dict[str, None] = {}
+        for slug in slugs:
+            node = self._by_slug.get(slug)
+            if node is None:
+                expanded[slug] = None
+            else:
+                expanded.update(dict.fromkeys(n.slug for n in self.subtree(node.id)))
+        return list(expanded)
+
+
+class TaxonomyService:
+    """Lazily loaded, shared taxonomy tree for one repository.
+
+    The tree reloads on the next access after a write through any
+    repository in this process, after :meth:`invalidate`, or once it is
+    older than ``ttl`` seconds (None to never expire).
+    """
+
+    def __init__(self, repo: SalonRepository, ttl: float | None = None) -> None:
+        self.repo = repo
+        self.ttl = ttl
+        self._tree: TaxonomyTree | None = None
+        self._version = -1
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def tree(self) -> TaxonomyTree:
+        """The current tree, reloading it if stale."""
+        with self._lock:
+            version = self.repo.taxonomy_version
+            expired = self.ttl is not None and time.monotonic() - self._loaded_at > self.ttl
+            if self._tree is None or version != self._version or expired:
+                self._tree = TaxonomyTree.from_rows(self.repo.get_taxonomy_nodes())
+                self._version = version
+                self._loaded_at = time.monotonic()
+            return self._tree
+
+    def invalidate(self) -> None:
+        """Drop the cached tree; the next access reloads it."""
+        with self._lock:
+            self._tree = None
+
+    def add_node(
+        self, slug: str, label: str, parent: int | str | None = None, **fields: Any
+    ) -> int:
+        """Insert a node under ``parent`` (id or slug) and return its id."""
+        parent_id = self.tree()._node(parent).id if isinstance(parent, str) else parent
+        return self.repo.add_taxonomy_node(slug, label, parent_id=parent_id, **fields)
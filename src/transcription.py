@@ -6,11 +6,31 @@
 
 from __future__ import annotations
 
+import json
+import wave
 from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from dataclasses import dataclass, field
 from datetime import timedelta
 from enum import Enum
-from typing import Any
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, overload
+
+if TYPE_CHECKING:
+    from .transcription_cache import TranscriptionCache
+
+AUDIO_EXTENSIONS = (".wav", ".mp3", ".m4a", ".flac", ".ogg")
 
 
 class TranscriptionStatus(Enum):
@@ -20,9 +40,10 @@ class TranscriptionStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(slots=True)
 class Segment:
     """A time-aligned segment of transcribed speech."""
+
     speaker: str
     text: str
     start_time: timedelta
@@ -42,28 +63,364 @@ def to_dict(self) -> dict[str, Any]:
             "confidence": self.confidence,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Segment:
+        return cls(
+            speaker=data["speaker"],
+            text=data["text"],
+            start_time=timedelta(seconds=data["start_seconds"]),
+            end_time=timedelta(seconds=data["end_seconds"]),
+            confidence=data.get("confidence", 0.0),
+        )
+
+
+class _IntervalTree:
+    """Implicit augmented binary tree over intervals in start order.
+
+    Position ``i`` of the start-sorted arrays is a tree node whose level
+    is the number of trailing one bits in ``i``; each node records the
+    largest end time in its subtree, so an overlap query skips every
+    subtree that ends before the query begins (the cgranges layout). No
+    pointers are stored: the tree is three flat arrays.
+    """
+
+    __slots__ = ("ends", "max_ends", "root_level", "starts")
+
+    def __init__(self, starts: Sequence[float], ends: Sequence[float]) -> None:
+        n = len(starts)
+        self.starts = starts
+        self.ends = ends
+        max_ends = array("d", ends)
+        # suffix[i]: largest end at or after position i, for right subtrees cut off at n
+        suffix = array("d", ends)
+        for i in range(n - 2, -1, -1):
+            suffix[i] = max(suffix[i], suffix[i + 1])
+        level = 1
+        while 1 << level <= n:
+            half = 1 << (level - 1)
+            for i in range((1 << level) - 1, n, 1 << (level + 1)):
+                if i + half < n:
+                    right = max_ends[i + half]
+                else:
+                    right = suffix[i + 1] if i + 1 < n else ends[i]
+                max_ends[i] = max(ends[i], max_ends[i - half], right)
+            level += 1
+        self.max_ends = max_ends
+        self.root_level = level - 1
+
+    def overlapping(self, start: float, end: float) -> Iterator[int]:
+        """Positions of intervals that start before ``end`` and end after ``start``, in order."""
+        starts, ends, max_ends = self.starts, self.ends, self.max_ends
+        n = len(starts)
+        if n == 0:
+            return
+        stack = [((1 << self.root_level) - 1, self.root_level, False)]
+        while stack:
+            x, level, left_done = stack.pop()
+            if level <= 2:
+                # small subtree: scan its positions directly
+                first = x >> level << level
+                for i in range(first, min(first + (1 << (level + 1)) - 1, n)):
+                    if starts[i] >= end:
+                        break
+                    if ends[i] > start:
+                        yield i
+            elif not left_done:
+                stack.append((x, level, True))
+                left = x - (1 << (level - 1))
+                if left >= n or max_ends[left] > start:
+                    stack.append((left, level - 1, False))
+            elif x < n and starts[x] < end:
+                if ends[x] > start:
+                    yield x
+                stack.append((x + (1 << (level - 1)), level - 1, False))
+
+
+class SegmentStore(Sequence[Segment]):
+    """Columnar, append-only storage for a transcript's segments.
+
+    Start/end times and confidences live in float64 arrays, speakers are
+    interned to small integer ids, and text is kept in a few large chunks
+    indexed by offsets, instead of one object (plus two timedeltas) per
+    segment. New text is sealed into a chunk on the next read, and chunks
+    merge like a binary counter, so appends and reads stay amortized cheap
+    however they interleave.
+    Indexing materializes a :class:`Segment` row on demand; mutating that
+    row does not write back. Aggregates are maintained as segments are
+    appended, time-range lookups bisect the start column, and overlap and
+    per-speaker lookups use indexes built on first use after a write.
+    """
+
+    __slots__ = (
+        "_chunk_starts",
+        "_chunks",
+        "_confidence",
+        "_ends",
+        "_full_text",
+        "_intervals",
+        "_max_end",
+        "_order",
+        "_pending_text",
+        "_sorted",
+        "_sorted_starts",
+        "_speaker_ids",
+        "_speaker_index",
+        "_speaker_rows",
+        "_speakers",
+        "_starts",
+        "_text_offsets",
+    )
+
+    def __init__(self, segments: Iterable[Segment] = ()) -> None:
+        self._starts = array("d")
+        self._ends = array("d")
+        self._confidence = array("d")
+        self._speaker_ids = array("I")
+        self._speakers: list[str] = []
+        self._speaker_index: dict[str, int] = {}
+        self._chunks: list[str] = []
+        self._chunk_starts = array("Q")
+        self._pending_text: list[str] = []
+        self._text_offsets = array("Q", [0])
+        self._max_end = 0.0
+        self._full_text: str | None = None
+        self._sorted = True
+        self._order: array | None = None
+        self._sorted_starts: array | None = None
+        self._intervals: _IntervalTree | None = None
+        self._speaker_rows: dict[int, array] | None = None
+        self.extend(segments)
+
+    # ── Writes ────────────────────────────────────────────────────────
+
+    def append(self, seg: Segment) -> None:
+        start = seg.start_time.total_seconds()
+        end = seg.end_time.total_seconds()
+        if self._starts and start < self._starts[-1]:
+            self._sorted = False
+        self._order = None
+        self._intervals = None
+        self._speaker_rows = None
+        self._starts.append(start)
+        self._ends.append(end)
+        self._confidence.append(seg.confidence)
+        sid = self._speaker_index.get(seg.speaker)
+        if sid is None:
+            sid = self._speaker_index[seg.speaker] = len(self._speakers)
+            self._speakers.append(seg.speaker)
+        self._speaker_ids.append(sid)
+        self._pending_text.append(seg.text)
+        self._text_offsets.append(self._text_offsets[-1] + len(seg.text))
+        self._max_end = max(self._max_end, end)
+        self._full_text = None
+
+    def extend(self, segments: Iterable[Segment]) -> None:
+        for seg in segments:
+            self.append(seg)
+
+    # ── Sequence protocol ─────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    @overload
+    def __getitem__(self, index: int) -> Segment: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Segment]: ...
+
+    def __getitem__(self, index: int | slice) -> Segment | list[Segment]:
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(len(self)))]
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("segment index out of range")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[Segment]:
+        return (self._row(i) for i in range(len(self)))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"SegmentStore({len(self)} segments, {len(self._speakers)} speakers)"
+
+    def __getstate__(self) -> dict[str, Any]:
+        self._compact()
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def _compact(self) -> None:
+        """Seal pending text into a chunk, merging it into smaller predecessors.
+
+        A chunk only absorbs the chunks before it that are no longer than
+        itself, so each character is copied O(log n) times overall and at
+        most O(log n) chunks exist. Whole rows are sealed together, so no
+        row's text straddles two chunks.
+        """
+        if not self._pending_text:
+            return
+        chunk = "".join(self._pending_text)
+        self._pending_text.clear()
+        if not chunk:
+            return
+        start = self._text_offsets[-1] - len(chunk)
+        while self._chunks and len(self._chunks[-1]) <= len(chunk):
+            chunk = self._chunks.pop() + chunk
+            start = self._chunk_starts.pop()
+        self._chunks.append(chunk)
+        self._chunk_starts.append(start)
+
+    def _text_of(self, i: int) -> str:
+        lo, hi = self._text_offsets[i], self._text_offsets[i + 1]
+        if lo == hi:
+            return ""
+        self._compact()
+        k = bisect_right(self._chunk_starts, lo) - 1
+        base = self._chunk_starts[k]
+        return self._chunks[k][lo - base : hi - base]
+
+    def _row(self, i: int) -> Segment:
+        return Segment(
+            speaker=self._speakers[self._speaker_ids[i]],
+            text=self._text_of(i),
+            start_time=timedelta(seconds=self._starts[i]),
+            end_time=timedelta(seconds=self._ends[i]),
+            confidence=self._confidence[i],
+        )
+
+    # ── Aggregates ────────────────────────────────────────────────────
+
+    @property
+    def speakers(self) -> list[str]:
+        """Distinct speakers in order of first appearance."""
+        return list(self._speakers)
+
+    @property
+    def max_end_seconds(self) -> float:
+        return self._max_end
+
+    @property
+    def full_text(self) -> str:
+        if self._full_text is None:
+            self._full_text = " ".join(self.texts())
+        return self._full_text
+
+    def columns(self) -> tuple[array, array, array, array]:
+        """The start, end, confidence and speaker-id columns (shared; do not mutate).
+
+        Each supports the buffer protocol, so NumPy can view it without
+        copying; speaker ids index into :attr:`speakers`.
+        """
+        return self._starts, self._ends, self._confidence, self._speaker_ids
+
+    def texts(self) -> list[str]:
+        """Each segment's text, in storage order."""
+        return [self._text_of(i) for i in range(len(self))]
+
+    def by_speaker(self, speaker: str) -> list[Segment]:
+        """All segments spoken by ``speaker``, in storage order."""
+        return [self._row(i) for i in self._rows_of(speaker)]
+
+    def _rows_of(self, speaker: str) -> Sequence[int]:
+        sid = self._speaker_index.get(speaker)
+        if sid is None:
+            return ()
+        if self._speaker_rows is None:
+            rows: dict[int, array] = {}
+            for i, s in enumerate(self._speaker_ids):
+                rows.setdefault(s, array("L")).append(i)
+            self._speaker_rows = rows
+        return self._speaker_rows.get(sid, ())
+
+    # ── Time-range lookup ─────────────────────────────────────────────
+
+    def _start_order(self) -> tuple[Sequence[float], Sequence[int] | None]:
+        """Start column in sorted order, plus the permutation if appends were out of order."""
+        if self._sorted:
+            return self._starts, None
+        if self._order is None or self._sorted_starts is None:
+            self._order = array("L", sorted(range(len(self)), key=self._starts.__getitem__))
+            self._sorted_starts = array("d", (self._starts[i] for i in self._order))
+        return self._sorted_starts, self._order
+
+    def starting_between(self, start: float, end: float) -> list[Segment]:
+        """Segments whose start time falls in ``[start, end)`` seconds, in time order.
+
+        O(log n + k) for the usual case of segments appended in time order.
+        """
+        starts, order = self._start_order()
+        lo = bisect_left(starts, start)
+        hi = bisect_left(starts, end, lo=lo)
+        indices = range(lo, hi) if order is None else (order[i] for i in range(lo, hi))
+        return [self._row(i) for i in indices]
+
+    def overlapping(self, start: float, end: float, speaker: str | None = None) -> list[Segment]:
+        """Segments that overlap ``[start, end)`` seconds, in start order.
+
+        A segment overlaps if it starts before ``end`` and ends after
+        ``start``, so a turn already under way at ``start`` is included.
+        O(log n + k) through an interval tree over the start-sorted
+        columns; ``speaker`` keeps only that speaker's segments.
+        """
+        starts, order = self._start_order()
+        if self._intervals is None:
+            ends = self._ends if order is None else array("d", (self._ends[i] for i in order))
+            self._intervals = _IntervalTree(starts, ends)
+        positions = self._intervals.overlapping(start, end)
+        indices = positions if order is None else (order[p] for p in positions)
+        if speaker is not None:
+            sid = self._speaker_index.get(speaker)
+            ids = self._speaker_ids
+            indices = (i for i in indices if ids[i] == sid)
+        return [self._row(i) for i in indices]
+
 
 @dataclass
 class TranscriptionResult:
-    """Complete transcription output for a salon session."""
+    """Complete transcription output for a salon session.
+
+    ``segments`` is always a :class:`SegmentStore`; assigning a list of
+    segments converts it.
+    """
+
     session_id: str
-    segments: list[Segment] = field(default_factory=list)
+    segments: SegmentStore = field(default_factory=SegmentStore)
     status: TranscriptionStatus = TranscriptionStatus.PENDING
     language: str = "en"
+    audio_path: str | None = None
+    error: str | None = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "segments" and not isinstance(value, SegmentStore):
+            value = SegmentStore(value)
+        object.__setattr__(self, name, value)
 
     @property
     def full_text(self) -> str:
-        return " ".join(seg.text for seg in self.segments)
+        return self.segments.full_text
 
     @property
     def speaker_list(self) -> list[str]:
-        return list(dict.fromkeys(seg.speaker for seg in self.segments))
+        return self.segments.speakers
 
     @property
     def total_duration(self) -> timedelta:
-        if not self.segments:
-            return timedelta(0)
-        return max(seg.end_time for seg in self.segments)
+        return timedelta(seconds=self.segments.max_end_seconds)
+
+    def segments_between(
+        self, start_seconds: float, end_seconds: float, speaker: str | None = None
+    ) -> list[Segment]:
+        """Segments overlapping ``[start_seconds, end_seconds)``, optionally for one speaker."""
+        return self.segments.overlapping(start_seconds, end_seconds, speaker)
 
 
 # ── Backends ──────────────────────────────────────────────────────────
@@ -72,11 +429,27 @@ def total_duration(self) -> timedelta:
 class TranscriptionBackend(ABC):
     """Abstract base for transcription backends."""
 
+    # Bump when a backend's output changes so cached transcripts are not reused
+    version: str = "1"
+
+    def cache_identity(self) -> str:
+        """Identify this backend and any settings that affect its output."""
+        cls = type(self)
+        return f"{cls.__module__}.{cls.__qualname__}"
+
     @abstractmethod
     def transcribe(self, audio_path: str) -> list[Segment]:
         """Convert an audio file to a list of time-aligned segments."""
         ...
 
+    def stream(self, audio_path: str) -> Iterator[Segment]:
+        """Yield segments as they become available.
+
+        The default waits for :meth:`transcribe`; chunked backends override
+        this to produce segments while the file is still being read.
+        """
+        yield from self.transcribe(audio_path)
+
 
 class MockBackend(TranscriptionBackend):
     """Returns deterministic mock segments for testing and development."""
@@ -88,13 +461,15 @@ def transcribe(self, audio_path: str) -> list[Segment]:
         for i in range(6):
             speaker = speakers[i % len(speakers)]
             duration = 15 + (i * 5)  # varying segment lengths
-            segments.append(Segment(
-                speaker=speaker,
-                text=f"Segment {i+1} from {speaker} discussing {audio_path}",
-                start_time=timedelta(seconds=offset),
-                end_time=timedelta(seconds=offset + duration),
-                confidence=0.90 + (i % 3) * 0.03,
-            ))
+            segments.append(
+                Segment(
+                    speaker=speaker,
+                    text=f"Segment {i + 1} from {speaker} discussing {audio_path}",
+                    start_time=timedelta(seconds=offset),
+                    end_time=timedelta(seconds=offset + duration),
+                    confidence=0.90 + (i % 3) * 0.03,
+                )
+            )
             offset += duration
         return segments
 
@@ -106,6 +481,213 @@ def transcribe(self, audio_path: str) -> list[Segment]:
         raise NotImplementedError("Whisper integration not yet configured")
 
 
+# ── Chunked streaming ─────────────────────────────────────────────────
+
+
+@dataclass
+class AudioChunk:
+    """A window of PCM audio read from a longer recording.
+
+    Times are absolute offsets into the recording. ``overlap_before`` and
+    ``overlap_after`` give the seconds shared with the neighbouring chunks.
+    """
+
+    index: int
+    start_seconds: float
+    end_seconds: float
+    frames: bytes
+    sample_rate: int
+    channels: int
+    sample_width: int
+    overlap_before: float = 0.0
+    overlap_after: float = 0.0
+
+
+def iter_wav_chunks(
+    audio_path: str,
+    chunk_seconds: float = 30.0,
+    overlap_seconds: float = 2.0,
+) -> Iterator[AudioChunk]:
+    """Read a WAV file as fixed-size overlapping chunks.
+
+    Only one chunk (plus the carried-over overlap) is held in memory at a
+    time, regardless of recording length.
+    """
+    if overlap_seconds < 0 or overlap_seconds >= chunk_seconds:
+        raise ValueError("overlap_seconds must be >= 0 and smaller than chunk_seconds")
+    with wave.open(audio_path, "rb") as wav:
+        rate = wav.getframerate()
+        channels = wav.getnchannels()
+        width = wav.getsampwidth()
+        total = wav.getnframes()
+        frame_size = channels * width
+        chunk_frames = max(int(chunk_seconds * rate), 1)
+        overlap_frames = int(overlap_seconds * rate)
+
+        carry = b""
+        start_frame = 0
+        index = 0
+        while start_frame < total:
+            carried = len(carry) // frame_size
+            frames = carry + wav.readframes(chunk_frames - carried)
+            count = len(frames) // frame_size
+            if count <= carried:
+                break
+            last = start_frame + count >= total
+            yield AudioChunk(
+                index=index,
+                start_seconds=start_frame / rate,
+                end_seconds=(start_frame + count) / rate,
+                frames=frames,
+                sample_rate=rate,
+                channels=channels,
+                sample_width=width,
+                overlap_before=carried / rate,
+                overlap_after=0.0 if last else overlap_frames / rate,
+            )
+            if last:
+                break
+            carry = frames[len(frames) - overlap_frames * frame_size :] if overlap_frames else b""
+            start_frame += count - overlap_frames
+            index += 1
+
+
+def _shift(seg: Segment, offset: float) -> Segment:
+    delta = timedelta(seconds=offset)
+    return Segment(
+        speaker=seg.speaker,
+        text=seg.text,
+        start_time=seg.start_time + delta,
+        end_time=seg.end_time + delta,
+        confidence=seg.confidence,
+    )
+
+
+def _is_duplicate(prev: Segment, seg: Segment) -> bool:
+    """True if ``seg`` re-transcribes ``prev`` across a chunk boundary."""
+    overlap = min(prev.end_time, seg.end_time) - max(prev.start_time, seg.start_time)
+    shorter = min(prev.duration, seg.duration)
+    return prev.speaker == seg.speaker and shorter > timedelta(0) and overlap > shorter / 2
+
+
+def stitch_segments(
+    chunk_segments: Iterable[tuple[AudioChunk, list[Segment]]],
+) -> Iterator[Segment]:
+    """Merge per-chunk segments (timed relative to their chunk) into one stream.
+
+    Each overlap region is split at its midpoint: a segment is kept only by
+    the chunk that owns its midpoint. Same-speaker segments that still
+    overlap the previously emitted one by more than half are dropped as
+    boundary duplicates.
+    """
+    prev: Segment | None = None
+    for chunk, segments in chunk_segments:
+        lower = chunk.start_seconds + chunk.overlap_before / 2
+        upper = chunk.end_seconds - chunk.overlap_after / 2
+        for rel in segments:
+            seg = _shift(rel, chunk.start_seconds)
+            mid = (seg.start_time + seg.end_time).total_seconds() / 2
+            if mid < lower or (chunk.overlap_after and mid >= upper):
+                continue
+            if prev is not None and _is_duplicate(prev, seg):
+                continue
+            prev = seg
+            yield seg
+
+
+class ChunkedTranscriptionBackend(TranscriptionBackend):
+    """Base for backends that transcribe a recording one chunk at a time.
+
+    Subclasses implement :meth:`transcribe_chunk`, returning segments timed
+    relative to the chunk start; reading, overlap, and stitching are
+    handled here.
+    """
+
+    def __init__(self, chunk_seconds: float = 30.0, overlap_seconds: float = 2.0) -> None:
+        self.chunk_seconds = chunk_seconds
+        self.overlap_seconds = overlap_seconds
+
+    def cache_identity(self) -> str:
+        return f"{super().cache_identity()}:{self.chunk_seconds}:{self.overlap_seconds}"
+
+    @abstractmethod
+    def transcribe_chunk(self, chunk: AudioChunk) -> list[Segment]:
+        """Transcribe one chunk; segment times are relative to ``chunk.start_seconds``."""
+        ...
+
+    def stream_chunks(self, chunks: Iterable[AudioChunk]) -> Iterator[Segment]:
+        """Transcribe ``chunks`` lazily and yield stitched, absolute-time segments."""
+        return stitch_segments((chunk, self.transcribe_chunk(chunk)) for chunk in chunks)
+
+    def stream(self, audio_path: str) -> Iterator[Segment]:
+        return self.stream_chunks(
+            iter_wav_chunks(audio_path, self.chunk_seconds, self.overlap_seconds)
+        )
+
+    def transcribe(self, audio_path: str) -> list[Segment]:
+        return list(self.stream(audio_path))
+
+
+# ── Batch helpers ─────────────────────────────────────────────────────
+
+
+def discover_audio(directory: str | Path) -> list[tuple[str, str]]:
+    """List audio files in ``directory`` as (session_id, path) pairs, keyed by file stem."""
+    paths = sorted(
+        p
+        for p in Path(directory).iterdir()
+        if p.is_file() and p.suffix.lower() in AUDIO_EXTENSIONS
+    )
+    return [(p.stem, str(p)) for p in paths]
+
+
+def load_manifest(path: str | Path) -> list[tuple[str, str]]:
+    """Read a JSON manifest: a list of ``{"session_id": ..., "audio_path": ...}`` objects."""
+    entries = json.loads(Path(path).read_text())
+    return [(str(e["session_id"]), str(e["audio_path"])) for e in entries]
+
+
+def _cached_transcribe(
+    backend: TranscriptionBackend,
+    language: str,
+    audio_path: str,
+    cache: TranscriptionCache | None,
+) -> list[Segment]:
+    """Return cached segments for the file if present, else transcribe and store them."""
+    key = cache.key(audio_path, backend, language) if cache is not None else None
+    if key is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+    segments = backend.transcribe(audio_path)
+    if key is not None:
+        cache.put(key, segments)
+    return segments
+
+
+def _transcribe_job(
+    backend: TranscriptionBackend,
+    language: str,
+    session_id: str,
+    audio_path: str,
+    cache: TranscriptionCache | None = None,
+) -> TranscriptionResult:
+    """Transcribe one file, capturing any failure on the result instead of raising."""
+    result = TranscriptionResult(
+        session_id=session_id,
+        status=TranscriptionStatus.PROCESSING,
+        language=language,
+        audio_path=audio_path,
+    )
+    try:
+        result.segments = _cached_transcribe(backend, language, audio_path, cache)
+        result.status = TranscriptionStatus.COMPLETED
+    except Exception as exc:  # noqa: BLE001 - any backend error is reported on the result
+        result.status = TranscriptionStatus.FAILED
+        result.error = f"{type(exc).__name__}: {exc}"
+    return result
+
+
 # ── Pipeline ──────────────────────────────────────────────────────────
 
 
@@ -116,9 +698,11 @@ def __init__(
         self,
         language: str = "en",
         backend: TranscriptionBackend | None = None,
+        cache: TranscriptionCache | None = None,
     ) -> None:
         self.language = language
         self.backend = backend or MockBackend()
+        self.cache = cache
         self._results: dict[str, TranscriptionResult] = {}
 
     def process_audio(self, session_id: str, audio_path: str) -> TranscriptionResult:
@@ -129,23 +713,136 @@ def process_audio(self, session_id: str, audio_path: str) -> TranscriptionResult
             audio_path: Path to the audio file.
 
         Returns:
-            TranscriptionResult with segments from the configured backend.
+            TranscriptionResult with segments from the configured backend,
+            or from the transcription cache when this audio was already
+            transcribed with the same backend and language.
         """
         result = TranscriptionResult(
             session_id=session_id,
             status=TranscriptionStatus.PROCESSING,
             language=self.language,
+            audio_path=audio_path,
         )
-        result.segments = self.backend.transcribe(audio_path)
+        result.segments = _cached_transcribe(self.backend, self.language, audio_path, self.cache)
         result.status = TranscriptionStatus.COMPLETED
         self._results[session_id] = result
         return result
 
+    def stream_audio(
+        self,
+        session_id: str,
+        audio_path: str,
+        retain: bool = True,
+    ) -> Iterator[Segment]:
+        """Transcribe incrementally, yielding each segment as the backend produces it.
+
+        The stored result is PROCESSING until the stream is exhausted, then
+        COMPLETED (or FAILED if the backend raises, which is re-raised).
+        With ``retain=False`` segments are not accumulated on the result, so
+        memory stays bounded for multi-hour recordings; in that mode a fresh
+        transcript is also not written to the cache.
+        """
+        result = TranscriptionResult(
+            session_id=session_id,
+            status=TranscriptionStatus.PROCESSING,
+            language=self.language,
+            audio_path=audio_path,
+        )
+        self._results[session_id] = result
+        key = (
+            self.cache.key(audio_path, self.backend, self.language)
+            if self.cache is not None
+            else None
+        )
+        cached = self.cache.get(key) if key is not None else None
+        try:
+            for seg in cached if cached is not None else self.backend.stream(audio_path):
+                if retain:
+                    result.segments.append(seg)
+                yield seg
+        except Exception as exc:
+            result.status = TranscriptionStatus.FAILED
+            result.error = f"{type(exc).__name__}: {exc}"
+            raise
+        result.status = TranscriptionStatus.COMPLETED
+        if key is not None and cached is None and retain:
+            self.cache.put(key, result.segments)
+
+    def process_many(
+        self,
+        jobs: Iterable[tuple[str, str]],
+        max_workers: int = 4,
+        executor: str = "thread",
+        on_result: Callable[[TranscriptionResult], None] | None = None,
+    ) -> list[TranscriptionResult]:
+        """Transcribe many (session_id, audio_path) jobs concurrently.
+
+        Args:
+            jobs: Pairs of session id and audio path.
+            max_workers: Upper bound on files transcribed at once; at most
+                twice this many jobs are queued on the pool at any time.
+            executor: ``"thread"`` for I/O-bound (remote) backends or
+                ``"process"`` for CPU-bound local ones. Process pools
+                require a picklable backend, and cache hit/miss counters
+                from worker processes are not merged back.
+            on_result: Called in the caller's thread as each file finishes.
+
+        Returns:
+            One TranscriptionResult per job, in input order. A file that
+            fails is marked FAILED with ``error`` set; the rest of the batch
+            carries on.
+        """
+        if executor not in ("thread", "process"):
+            raise ValueError(f"executor must be 'thread' or 'process', not {executor!r}")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        pool_cls: type[Executor] = (
+            ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+        )
+        job_list = list(jobs)
+        results: list[TranscriptionResult] = [
+            TranscriptionResult(session_id=sid, language=self.language, audio_path=path)
+            for sid, path in job_list
+        ]
+        for result in results:
+            self._results[result.session_id] = result
+
+        def finish(index: int, future: Future[TranscriptionResult]) -> None:
+            try:
+                result = future.result()
+            except Exception as exc:  # noqa: BLE001 - pool-level failure, e.g. a crashed worker
+                result = results[index]
+                result.status = TranscriptionStatus.FAILED
+                result.error = f"{type(exc).__name__}: {exc}"
+            results[index] = result
+            self._results[result.session_id] = result
+            if on_result is not None:
+                on_result(result)
+
+        pending: dict[Future[TranscriptionResult], int] = {}
+        with pool_cls(max_workers=max_workers) as pool:
+            for index, (sid, path) in enumerate(job_list):
+                if len(pending) >= max_workers * 2:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        finish(pending.pop(future), future)
+                results[index].status = TranscriptionStatus.PROCESSING
+                future = pool.submit(
+                    _transcribe_job, self.backend, self.language, sid, path, self.cache
+                )
+                pending[future] = index
+            for future in as_completed(list(pending)):
+                finish(pending.pop(future), future)
+        return results
+
     def get_result(self, session_id: str) -> TranscriptionResult | None:
         return self._results.get(session_id)
 
-    def extract_segments(self, result: TranscriptionResult, speaker: str | None = None) -> list[Segment]:
+    def extract_segments(
+        self, result: TranscriptionResult, speaker: str | None = None
+    ) -> list[Segment]:
         """Extract segments, optionally filtered by speaker."""
         if speaker:
-            return [s for s in result.segments if s.speaker == speaker]
+            return result.segments.by_speaker(speaker)
         return list(result.segments)
@@ -0,0 +1,153 @@
+"""Persistent, content-addressed cache of transcription output.
+
+Entries are keyed by the SHA-256 of the audio bytes together with the
+backend's identity and version and the transcription language, so renaming
+or re-ingesting a file after a metadata fix reuses the earlier transcript,
+while changing backend, backend settings, or language does not.
+
+Each entry is one JSON file under ``<directory>/<key[:2]>/<key>.json``.
+The cache is bounded by total size; reads refresh an entry's mtime and the
+least recently used entries are evicted first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .transcription import Segment, TranscriptionBackend
+
+CACHE_FORMAT = 1
+_HASH_BLOCK = 1 << 20
+
+
+@dataclass
+class CacheStats:
+    """Counters for one cache instance (per process)."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def hash_audio(audio_path: str | Path) -> str:
+    """Return the SHA-256 hex digest of a file, read in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(audio_path, "rb") as f:
+        while block := f.read(_HASH_BLOCK):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class TranscriptionCache:
+    """Size-bounded LRU cache of serialized segments on local disk."""
+
+    def __init__(self, directory: str | Path, max_bytes: int = 1 << 30) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    # ── Keys ──────────────────────────────────────────────────────────
+
+    @staticmethod
+    def key_for(audio_hash: str, backend: TranscriptionBackend, language: str) -> str:
+        """Combine audio hash, backend identity/version, and language into a cache key."""
+        parts = [CACHE_FORMAT, audio_hash, backend.cache_identity(), backend.version, language]
+        return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+    def key(self, audio_path: str, backend: TranscriptionBackend, language: str) -> str | None:
+        """Cache key for a file, or None if the file cannot be read."""
+        try:
+            return self.key_for(hash_audio(audio_path), backend, language)
+        except OSError:
+            return None
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    # ── Read / write ──────────────────────────────────────────────────
+
+    def get(self, key: str) -> list[Segment] | None:
+        """Return the cached segments for ``key``, or None on a miss."""
+        from .transcription import Segment
+
+        path = self._path(key)
+        try:
+            data = json.loads(path.read_text())
+            os.utime(path)
+        except (OSError, ValueError):
+            self._count("misses")
+            return None
+        self._count("hits")
+        return [Segment.from_dict(d) for d in data["segments"]]
+
+    def put(self, key: str, segments: Iterable[Segment]) -> None:
+        """Store segments under ``key`` atomically, then evict down to ``max_bytes``."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps({"segments": [seg.to_dict() for seg in segments]}))
+        os.replace(tmp, path)
+        self._count("stores")
+        self.evict()
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache fits. Returns the count removed."""
+        entries = []
+        total = 0
+        for path in self.directory.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        removed = 0
+        for _mtime, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        if removed:
+            self._count("evictions", removed)
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        for path in self.directory.glob("*/*.json"):
+            path.unlink(missing_ok=True)
+
+    def size_bytes(self) -> int:
+        """Total size of all entries on disk."""
+        return sum(p.stat().st_size for p in self.directory.glob("*/*.json"))
+
+    def _count(self, field: str, n: int = 1) -> None:
+        with self._lock:
+            setattr(self.stats, field, getattr(self.stats, field) + n)
@@ -0,0 +1,145 @@
+"""Tests for the asyncio repository.
+
+Runs against SQLite through aiosqlite, using only the tables that do not
+need Postgres types (taxonomy and segments). Live Postgres tests are
+skipped unless DATABASE_URL is set.
+"""
+
+import asyncio
+import os
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("greenlet")
+
+from koinonia_db.models.salon import Segment as SegmentRow
+from koinonia_db.models.salon import TaxonomyNodeRow
+
+from src.async_repository import (
+    AsyncSalonRepository,
+    _async_engines,
+    get_async_engine,
+)
+
+
+def _run(coro):
+    """Run ``coro`` in a fresh event loop, closing pooled connections before it ends."""
+
+    async def main():
+        try:
+            return await coro
+        finally:
+            for engine in list(_async_engines.values()):
+                await engine.dispose()
+
+    return asyncio.run(main())
+
+
+@pytest.fixture()
+def repo(tmp_path):
+    repo = AsyncSalonRepository(f"sqlite+aiosqlite:///{tmp_path}/archive.db", engine_options={})
+
+    async def create():
+        async with repo._engine.begin() as conn:
+            await conn.run_sync(
+                TaxonomyNodeRow.metadata.create_all,
+                tables=[TaxonomyNodeRow.__table__, SegmentRow.__table__],
+            )
+
+    _run(create())
+    return repo
+
+
+def _segments(n):
+    return [
+        {
+            "speaker": f"S{i % 2}",
+            "text": f"line {i}",
+            "start_seconds": float(n - i),
+            "end_seconds": float(n - i + 1),
+        }
+        for i in range(n)
+    ]
+
+
+class TestAsyncSalonRepository:
+    def test_shares_engine_per_url(self):
+        a = AsyncSalonRepository("postgresql+psycopg://localhost/test")
+        b = AsyncSalonRepository("postgresql+psycopg://localhost/test")
+        assert a._engine is b._engine
+        assert get_async_engine("postgresql+psycopg://localhost/test") is not a._engine
+
+    def test_methods_are_coroutines(self):
+        for name in ("get_session", "search_fulltext", "add_taxonomy_node", "count_sessions"):
+            assert asyncio.iscoroutinefunction(getattr(AsyncSalonRepository, name))
+
+    def test_taxonomy_round_trip(self, repo):
+        async def scenario():
+            root = await repo.add_taxonomy_node("poiesis", "Poiesis")
+            await repo.add_taxonomy_node("music", "Music", parent_id=root)
+            roots = await repo.get_taxonomy_roots()
+            count = await repo.count_taxonomy_nodes()
+            return [r.slug for r in roots], count
+
+        assert _run(scenario()) == (["poiesis"], 2)
+        assert repo.taxonomy_version == 2
+
+    def test_segments_are_ordered_and_streamed(self, repo):
+        async def scenario():
+            inserted = await repo.bulk_insert_segments(1, _segments(5), batch_size=2)
+            listed = [s.start_seconds for s in await repo.get_segments(1)]
+            streamed = [s.start_seconds async for s in repo.iter_segments(1, batch_size=2)]
+            return inserted, listed, streamed
+
+        inserted, listed, streamed = _run(scenario())
+        assert inserted == 5
+        assert listed == streamed == sorted(listed)
+
+    def test_segments_filter_by_time_range_and_speaker(self, repo):
+        async def scenario():
+            await repo.bulk_insert_segments(1, _segments(6))
+            window = await repo.get_segments(1, from_seconds=2.5, to_seconds=4)
+            turns = [s.start_seconds for s in await repo.get_segments(1, speaker="S0")]
+            streamed = [
+                s.start_seconds async for s in repo.iter_segments(1, to_seconds=4, speaker="S1")
+            ]
+            return [s.start_seconds for s in window], turns, streamed
+
+        assert _run(scenario()) == ([2.0, 3.0], [2.0, 4.0, 6.0], [1.0, 3.0])
+
+    def test_concurrent_reads(self, repo):
+        async def scenario():
+            await repo.bulk_insert_segments(1, _segments(3))
+            await repo.bulk_insert_segments(2, _segments(4))
+            return await asyncio.gather(
+                repo.get_segments(1), repo.get_segments(2), repo.count_taxonomy_nodes()
+            )
+
+        one, two, nodes = _run(scenario())
+        assert (len(one), len(two), nodes) == (3, 4, 0)
+
+    def test_transaction_rolls_back(self, repo):
+        async def scenario():
+            with pytest.raises(RuntimeError):
+                async with repo.transaction() as tx:
+                    await tx.add_taxonomy_node("a", "A")
+                    await tx.bulk_insert_segments(1, _segments(2))
+                    raise RuntimeError("abort")
+            return await repo.count_taxonomy_nodes(), await repo.get_segments(1)
+
+        assert _run(scenario()) == (0, [])
+
+
+@pytest.mark.skipif(
+    not os.environ.get("DATABASE_URL"),
+    reason="DATABASE_URL not set — skipping live DB tests",
+)
+def test_live_stats_match_counts():
+    async def scenario():
+        repo = AsyncSalonRepository(os.environ["DATABASE_URL"])
+        stats, sessions = await asyncio.gather(repo.compute_stats(), repo.count_sessions())
+        return stats, sessions
+
+    stats, sessions = _run(scenario())
+    assert stats.sessions == sessions
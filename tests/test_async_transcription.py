@@ -0,0 +1,197 @@
+"""Tests for the async transcription pipeline, using a local stand-in HTTP server."""
+
+import asyncio
+import json
+import threading
+import time
+import wave
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.async_transcription import (
+    AsyncTranscriptionPipeline,
+    HTTPTranscriptionBackend,
+    RateLimiter,
+    RetryPolicy,
+    SyncBackendAdapter,
+    TransientBackendError,
+)
+from src.transcription import MockBackend, TranscriptionStatus
+
+NO_WAIT = RetryPolicy(attempts=3, base_delay=0.0)
+
+
+def _write_wav(path, seconds: float, rate: int = 8000) -> str:
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(b"\x00\x00" * int(seconds * rate))
+    return str(path)
+
+
+class StandInServer:
+    """Transcription API stand-in: one segment per chunk, tracking concurrency."""
+
+    def __init__(self, fail_first: int = 0, status: int = 503, delay: float = 0.05):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+        self.requests = 0
+        self.fail_first = fail_first
+        self.status = status
+        self.delay = delay
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                with server.lock:
+                    server.requests += 1
+                    failing = server.requests <= server.fail_first
+                    server.in_flight += 1
+                    server.peak = max(server.peak, server.in_flight)
+                time.sleep(server.delay)
+                with server.lock:
+                    server.in_flight -= 1
+                if failing:
+                    self.send_response(server.status)
+                    self.end_headers()
+                    return
+                assert body[:4] == b"RIFF"
+                index = int(self.headers["X-Chunk-Index"])
+                payload = {
+                    "segments": [
+                        {
+                            "speaker": "Speaker 1",
+                            "text": f"chunk {index}",
+                            "start_seconds": 0.0,
+                            "end_seconds": 0.5,
+                            "confidence": 0.9,
+                        }
+                    ]
+                }
+                data = json.dumps(payload).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/transcribe"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class TestHTTPBackend:
+    def test_chunks_run_concurrently_within_limit(self, tmp_path):
+        audio = _write_wav(tmp_path / "a.wav", 10)
+        with StandInServer() as server:
+            pipeline = AsyncTranscriptionPipeline(
+                HTTPTranscriptionBackend(server.url),
+                max_concurrency=3,
+                chunk_seconds=1.0,
+                overlap_seconds=0.0,
+            )
+            result = pipeline.run("S1", audio)
+        assert result.status == TranscriptionStatus.COMPLETED
+        assert [s.text for s in result.segments] == [f"chunk {i}" for i in range(10)]
+        assert result.segments[4].start_time.total_seconds() == 4.0
+        assert 1 < server.peak <= 3
+
+    def test_transient_errors_are_retried(self, tmp_path):
+        audio = _write_wav(tmp_path / "a.wav", 2)
+        with StandInServer(fail_first=2) as server:
+            pipeline = AsyncTranscriptionPipeline(
+                HTTPTranscriptionBackend(server.url),
+                max_concurrency=1,
+                retry=NO_WAIT,
+                chunk_seconds=1.0,
+                overlap_seconds=0.0,
+            )
+            result = pipeline.run("S1", audio)
+        assert len(result.segments) == 2
+        assert server.requests == 4
+
+    def test_gives_up_after_attempts(self, tmp_path):
+        audio = _write_wav(tmp_path / "a.wav", 1)
+        with StandInServer(fail_first=10) as server:
+            pipeline = AsyncTranscriptionPipeline(
+                HTTPTranscriptionBackend(server.url),
+                retry=NO_WAIT,
+                chunk_seconds=1.0,
+                overlap_seconds=0.0,
+            )
+            with pytest.raises(TransientBackendError):
+                pipeline.run("S1", audio)
+        assert server.requests == 3
+
+    def test_client_errors_are_not_retried(self, tmp_path):
+        audio = _write_wav(tmp_path / "a.wav", 1)
+        with StandInServer(fail_first=10, status=400) as server:
+            pipeline = AsyncTranscriptionPipeline(
+                HTTPTranscriptionBackend(server.url),
+                retry=NO_WAIT,
+                chunk_seconds=1.0,
+                overlap_seconds=0.0,
+            )
+            with pytest.raises(RuntimeError, match="HTTP 400"):
+                pipeline.run("S1", audio)
+        assert server.requests == 1
+
+    def test_process_many_isolates_failures(self, tmp_path):
+        good = _write_wav(tmp_path / "good.wav", 1)
+        with StandInServer() as server:
+            pipeline = AsyncTranscriptionPipeline(
+                HTTPTranscriptionBackend(server.url), chunk_seconds=1.0, overlap_seconds=0.0
+            )
+            results = asyncio.run(
+                pipeline.process_many([("S1", good), ("S2", str(tmp_path / "missing.wav"))])
+            )
+        assert results[0].status == TranscriptionStatus.COMPLETED
+        assert results[1].status == TranscriptionStatus.FAILED
+        assert results[1].error
+
+
+class TestSyncAdapter:
+    def test_mock_backend_through_async_pipeline(self):
+        result = AsyncTranscriptionPipeline(MockBackend()).run("S1", "/audio/x.wav")
+        assert result.status == TranscriptionStatus.COMPLETED
+        assert len(result.segments) == 6
+
+    def test_adapter_preserves_identity(self):
+        adapter = SyncBackendAdapter(MockBackend())
+        assert adapter.cache_identity() == MockBackend().cache_identity()
+        assert adapter.supports_chunks is False
+
+
+class TestFlowControl:
+    def test_rate_limiter_spaces_requests(self):
+        async def run():
+            limiter = RateLimiter(rate=50)
+            start = time.monotonic()
+            for _ in range(5):
+                await limiter.acquire()
+            return time.monotonic() - start
+
+        assert asyncio.run(run()) >= 0.075
+
+    def test_retry_delay_is_capped(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=3.0)
+        assert [policy.delay(i) for i in range(4)] == [1.0, 2.0, 3.0, 3.0]
+
+    def test_rejects_zero_concurrency(self):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            AsyncTranscriptionPipeline(MockBackend(), max_concurrency=0)
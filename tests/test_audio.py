@@ -0,0 +1,171 @@
+"""Tests for memory-mapped WAV decoding and voice-activity detection."""
+
+import wave
+from datetime import timedelta
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.audio import (
+    VADConfig,
+    VoiceActivityBackend,
+    detect_speech,
+    frame_levels,
+    iter_speech_chunks,
+    read_wav,
+)
+from src.transcription import (
+    AudioChunk,
+    ChunkedTranscriptionBackend,
+    Segment,
+    TranscriptionBackend,
+)
+
+RATE = 8000
+# 200-sample frames tile whole seconds exactly, so region edges land on them
+UNPADDED = VADConfig(frame_seconds=0.025, padding_seconds=0)
+
+
+def _write_wav(path, speech, seconds=10.0, channels=1, rate=RATE) -> str:
+    """A tone during each (start, end) span of ``speech``, silence elsewhere."""
+    t = np.arange(int(seconds * rate)) / rate
+    x = np.zeros_like(t)
+    for start, end in speech:
+        mask = (t >= start) & (t < end)
+        x[mask] = 0.3 * np.sin(2 * np.pi * 220 * t[mask])
+    pcm = (x * 32767).astype("<i2")
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(np.repeat(pcm, channels).tobytes())
+    return str(path)
+
+
+class TestReadWav:
+    def test_maps_samples_without_copying(self, tmp_path):
+        audio = read_wav(_write_wav(tmp_path / "a.wav", [(1, 2)], seconds=3, channels=2))
+        assert isinstance(audio.samples, np.memmap)
+        assert audio.samples.shape == (3 * RATE, 2)
+        assert audio.duration == 3.0
+        assert audio.samples[:RATE].max() == 0
+
+    def test_pcm_bytes_match_file_frames(self, tmp_path):
+        path = _write_wav(tmp_path / "a.wav", [(0, 1)], seconds=1)
+        with wave.open(path, "rb") as wav:
+            frames = wav.readframes(100)
+        assert read_wav(path).pcm_bytes(0, 100) == frames
+
+    def test_rejects_non_wav(self, tmp_path):
+        path = tmp_path / "a.wav"
+        path.write_bytes(b"ID3" + b"\x00" * 20)
+        with pytest.raises(ValueError, match="RIFF"):
+            read_wav(path)
+
+
+class TestDetectSpeech:
+    def test_levels_separate_tone_from_silence(self, tmp_path):
+        audio = read_wav(_write_wav(tmp_path / "a.wav", [(0, 1)], seconds=2))
+        levels = frame_levels(audio, 0.05)
+        assert len(levels) == 40
+        assert levels[:20].min() > -15
+        assert levels[20:].max() < -100
+
+    def test_finds_padded_regions(self, tmp_path):
+        audio = read_wav(_write_wav(tmp_path / "a.wav", [(1, 3), (6, 8)]))
+        regions = detect_speech(audio)
+        assert [(round(r.start_seconds, 1), round(r.end_seconds, 1)) for r in regions] == [
+            (0.8, 3.2),
+            (5.8, 8.2),
+        ]
+
+    def test_bridges_short_gaps_and_drops_blips(self, tmp_path):
+        path = _write_wav(tmp_path / "a.wav", [(1, 3), (3.3, 4), (7, 7.1)])
+        regions = detect_speech(read_wav(path), VADConfig(padding_seconds=0))
+        assert [(round(r.start_seconds, 1), round(r.end_seconds, 1)) for r in regions] == [
+            (1.0, 4.0)
+        ]
+
+    def test_silence_has_no_speech(self, tmp_path):
+        assert detect_speech(read_wav(_write_wav(tmp_path / "a.wav", []))) == []
+
+    def test_chunks_stay_inside_regions(self, tmp_path):
+        audio = read_wav(_write_wav(tmp_path / "a.wav", [(1, 6)]))
+        regions = detect_speech(audio, UNPADDED)
+        chunks = list(iter_speech_chunks(audio, regions, chunk_seconds=2, overlap_seconds=0.5))
+        assert chunks[0].start_seconds == 1.0
+        assert chunks[0].overlap_before == 0.0
+        assert chunks[-1].end_seconds == 6.0
+        assert chunks[-1].overlap_after == 0.0
+        assert [c.index for c in chunks] == list(range(len(chunks)))
+        assert all(len(c.frames) == (c.end_seconds - c.start_seconds) * RATE * 2 for c in chunks)
+
+
+class RecordingBackend(TranscriptionBackend):
+    """One segment spanning each file it is given, which it keeps the length of."""
+
+    def __init__(self):
+        self.durations = []
+
+    def transcribe(self, audio_path):
+        with wave.open(audio_path, "rb") as wav:
+            duration = wav.getnframes() / wav.getframerate()
+        self.durations.append(duration)
+        return [Segment("Speaker 1", "hello", timedelta(0), timedelta(seconds=duration))]
+
+
+class ChunkBackend(ChunkedTranscriptionBackend):
+    def __init__(self):
+        super().__init__(chunk_seconds=30.0, overlap_seconds=2.0)
+        self.seconds = 0.0
+
+    def transcribe_chunk(self, chunk: AudioChunk):
+        length = chunk.end_seconds - chunk.start_seconds
+        self.seconds += length
+        return [Segment("Speaker 1", "hi", timedelta(0), timedelta(seconds=length))]
+
+
+class TestVoiceActivityBackend:
+    def test_only_speech_is_transcribed_at_original_times(self, tmp_path):
+        path = _write_wav(tmp_path / "a.wav", [(1, 3), (6, 8)])
+        inner = RecordingBackend()
+        segments = VoiceActivityBackend(inner, UNPADDED).transcribe(path)
+        assert inner.durations == [2.0, 2.0]
+        assert [(s.start_time.total_seconds(), s.end_time.total_seconds()) for s in segments] == [
+            (1.0, 3.0),
+            (6.0, 8.0),
+        ]
+
+    def test_chunked_backends_receive_speech_chunks(self, tmp_path):
+        path = _write_wav(tmp_path / "a.wav", [(2, 4)])
+        inner = ChunkBackend()
+        segments = VoiceActivityBackend(inner, UNPADDED).transcribe(path)
+        assert inner.seconds == 2.0
+        assert segments[0].start_time == timedelta(seconds=2)
+
+    def test_cache_identity_covers_vad_settings(self):
+        inner = RecordingBackend()
+        a = VoiceActivityBackend(inner).cache_identity()
+        b = VoiceActivityBackend(inner, VADConfig(threshold_db=-30)).cache_identity()
+        assert a != b
+        assert inner.cache_identity() in a
+
+    def test_non_wav_passes_through(self):
+        class Fixed(TranscriptionBackend):
+            def transcribe(self, audio_path):
+                return [Segment("A", audio_path, timedelta(0), timedelta(seconds=1))]
+
+        assert VoiceActivityBackend(Fixed()).transcribe("talk.mp3")[0].text == "talk.mp3"
+
+    def test_unsupported_wav_encoding_passes_through(self, tmp_path):
+        path = str(tmp_path / "a.wav")
+        with wave.open(path, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(3)
+            wav.setframerate(RATE)
+            wav.writeframes(bytes(3 * RATE))
+        inner = RecordingBackend()
+        segments = VoiceActivityBackend(inner, UNPADDED).transcribe(path)
+        assert inner.durations == [1.0]
+        assert segments[0].end_time == timedelta(seconds=1)
@@ -26,3 +26,9 @@ def test_require_db_returns_url_when_set(self):
         with mock.patch.dict(os.environ, {"DATABASE_URL": "postgresql://localhost/test"}):
             url = Settings.require_db()
             assert url == "postgresql+psycopg://localhost/test"
+
+    def test_engine_options_has_pool_settings(self):
+        opts = Settings.engine_options()
+        assert set(opts) == {"pool_size", "max_overflow", "pool_pre_ping", "pool_recycle"}
+        assert opts["pool_size"] == Settings.DB_POOL_SIZE
+        assert isinstance(opts["pool_pre_ping"], bool)
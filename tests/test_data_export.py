@@ -1,15 +1,20 @@
 """Tests for salon_archive data_export — session index and sample generation."""
+
 import json
 from pathlib import Path
 
+import pytest
+
 from src.data_export import (
-    load_seed_sessions,
     build_sessions_index,
-    render_sample_session,
     export_all,
+    export_archive,
+    load_seed_sessions,
+    load_session_files,
+    render_sample_session,
+    session_file_stem,
 )
 
-
 SEED_DIR = Path(__file__).parent.parent.parent / "koinonia-db" / "seed"
 
 
@@ -64,3 +69,138 @@ def test_export_all_writes_files(tmp_path):
     md_path = tmp_path / "sample-session.md"
     assert md_path.exists()
     assert md_path.read_text().startswith("# ")
+
+
+def test_load_session_files(tmp_path):
+    """Accepts single-session exports and seed-style session lists."""
+    single = tmp_path / "one.json"
+    single.write_text(json.dumps({"title": "One", "segments": []}))
+    many = tmp_path / "many.json"
+    many.write_text(json.dumps({"sessions": [{"title": "Two"}, {"title": "Three"}]}))
+    sessions = load_session_files([single, many])
+    assert [s["title"] for s in sessions] == ["One", "Two", "Three"]
+
+
+def _archive_sessions():
+    return [
+        {
+            "id": 1,
+            "title": "Grief and Ritual",
+            "date": "2025-03-01",
+            "format": "circle",
+            "organ_tags": ["ORGAN-I"],
+            "participants": [],
+            "segments": [
+                {"speaker": "Ana", "text": "We begin.", "start_seconds": 0.0, "end_seconds": 2.0}
+            ],
+        },
+        {
+            "id": 2,
+            "title": "Care Work",
+            "date": "2025-04-02",
+            "format": "seminar",
+            "organ_tags": [],
+            "participants": [],
+            "segments": [],
+        },
+    ]
+
+
+def test_session_file_stem():
+    assert session_file_stem({"title": "Grief & Ritual!", "date": "2025-03-01"}) == (
+        "2025-03-01-grief-ritual"
+    )
+    assert session_file_stem({"title": ""}) == "undated-untitled"
+
+
+def test_export_archive_writes_markdown_json_and_manifest(tmp_path):
+    report = export_archive(_archive_sessions(), tmp_path)
+    assert len(report.written) == 4
+    md = (tmp_path / "2025-03-01-grief-and-ritual.md").read_text()
+    assert md.startswith("# Grief and Ritual")
+    data = json.loads((tmp_path / "2025-04-02-care-work.json").read_text())
+    assert data["title"] == "Care Work"
+    manifest = json.loads((tmp_path / "manifest.json").read_text())
+    assert set(manifest["sessions"]) == {"2025-03-01-grief-and-ritual", "2025-04-02-care-work"}
+
+
+def test_export_archive_incremental(tmp_path):
+    sessions = _archive_sessions()
+    export_archive(sessions, tmp_path)
+
+    again = export_archive(sessions, tmp_path)
+    assert again.written == []
+    assert len(again.skipped) == 2
+
+    sessions[1]["notes"] = "Added later."
+    changed = export_archive(sessions, tmp_path)
+    assert changed.skipped == ["2025-03-01-grief-and-ritual"]
+    assert {p.name for p in changed.written} == {
+        "2025-04-02-care-work.md",
+        "2025-04-02-care-work.json",
+    }
+
+    forced = export_archive(sessions, tmp_path, force=True)
+    assert len(forced.written) == 4
+
+
+def test_export_archive_rewrites_missing_files(tmp_path):
+    sessions = _archive_sessions()
+    export_archive(sessions, tmp_path)
+    (tmp_path / "2025-04-02-care-work.md").unlink()
+    report = export_archive(sessions, tmp_path)
+    assert report.skipped == ["2025-03-01-grief-and-ritual"]
+    assert (tmp_path / "2025-04-02-care-work.md").exists()
+
+
+def test_export_archive_removes_stale_files(tmp_path):
+    sessions = _archive_sessions()
+    export_archive(sessions, tmp_path)
+    report = export_archive(sessions[:1], tmp_path)
+    assert {p.name for p in report.removed} == {
+        "2025-04-02-care-work.md",
+        "2025-04-02-care-work.json",
+    }
+    assert not (tmp_path / "2025-04-02-care-work.md").exists()
+
+
+def test_export_archive_duplicate_stems(tmp_path):
+    sessions = _archive_sessions()
+    sessions[1].update(title="Grief and Ritual", date="2025-03-01")
+    export_archive(sessions, tmp_path, formats=("json",))
+    assert (tmp_path / "2025-03-01-grief-and-ritual.json").exists()
+    assert (tmp_path / "2025-03-01-grief-and-ritual-2.json").exists()
+
+
+def test_export_archive_parallel_matches_serial(tmp_path):
+    sessions = _archive_sessions() * 3
+    export_archive(sessions, tmp_path / "serial")
+    export_archive(sessions, tmp_path / "parallel", workers=2)
+    for path in (tmp_path / "serial").iterdir():
+        assert (tmp_path / "parallel" / path.name).read_text() == path.read_text()
+
+
+def test_export_archive_consumes_sessions_as_a_stream(tmp_path):
+    rendered_so_far = []
+
+    def sessions():
+        for i in range(4):
+            rendered_so_far.append(len(list(tmp_path.glob("*.json"))))
+            yield {
+                "id": i,
+                "title": f"Session {i}",
+                "date": "2025-05-01",
+                "format": "circle",
+                "organ_tags": [],
+                "participants": [],
+                "segments": [],
+            }
+
+    report = export_archive(sessions(), tmp_path, formats=("json",))
+    assert rendered_so_far == [0, 1, 2, 3]
+    assert len(report.written) == 4
+
+
+def test_export_archive_unknown_format(tmp_path):
+    with pytest.raises(ValueError, match="pdf"):
+        export_archive(_archive_sessions(), tmp_path, formats=("pdf",))
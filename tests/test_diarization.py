@@ -0,0 +1,105 @@
+"""Tests for speaker smoothing, merging, and metrics."""
+
+from datetime import timedelta
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.diarization import (
+    clean_result,
+    merge_segments,
+    smooth_speakers,
+    speaker_metrics,
+)
+from src.transcription import Segment, SegmentStore, TranscriptionResult
+
+
+def _seg(speaker, start, end, text=None, confidence=0.9):
+    return Segment(
+        speaker=speaker,
+        text=text or f"{speaker}@{start}",
+        start_time=timedelta(seconds=start),
+        end_time=timedelta(seconds=end),
+        confidence=confidence,
+    )
+
+
+def _spans(store):
+    return [(s.speaker, s.start_time.total_seconds(), s.end_time.total_seconds()) for s in store]
+
+
+class TestMerge:
+    def test_joins_close_same_speaker_fragments(self):
+        merged = merge_segments(
+            [_seg("A", 0, 2, "hello"), _seg("A", 2.5, 4, "there"), _seg("B", 4, 6)],
+            max_gap_seconds=1.0,
+        )
+        assert isinstance(merged, SegmentStore)
+        assert _spans(merged) == [("A", 0, 4), ("B", 4, 6)]
+        assert merged[0].text == "hello there"
+
+    def test_keeps_fragments_past_the_gap(self):
+        merged = merge_segments([_seg("A", 0, 1), _seg("A", 3, 4)], max_gap_seconds=1.0)
+        assert len(merged) == 2
+
+    def test_confidence_is_duration_weighted(self):
+        merged = merge_segments([_seg("A", 0, 3, confidence=1.0), _seg("A", 3, 4, confidence=0.6)])
+        assert merged[0].confidence == pytest.approx(0.9)
+
+    def test_sorts_out_of_order_input(self):
+        merged = merge_segments([_seg("A", 5, 6, "b"), _seg("A", 0, 4.5, "a")])
+        assert _spans(merged) == [("A", 0, 6)]
+        assert merged[0].text == "a b"
+
+    def test_empty_and_single(self):
+        assert len(merge_segments([])) == 0
+        assert _spans(merge_segments([_seg("A", 0, 1)])) == [("A", 0, 1)]
+
+
+class TestSmooth:
+    def test_relabels_short_sandwiched_flip(self):
+        smoothed = smooth_speakers([_seg("A", 0, 3), _seg("B", 3, 3.4), _seg("A", 3.4, 6)])
+        assert [s.speaker for s in smoothed] == ["A", "A", "A"]
+
+    def test_keeps_real_turns(self):
+        segments = [_seg("A", 0, 3), _seg("B", 3, 6), _seg("A", 6, 9), _seg("C", 9, 9.2)]
+        assert [s.speaker for s in smooth_speakers(segments)] == ["A", "B", "A", "C"]
+
+    def test_clean_result_smooths_then_merges(self):
+        result = TranscriptionResult(
+            session_id="S001",
+            segments=[_seg("A", 0, 3), _seg("B", 3, 3.4), _seg("A", 3.4, 6), _seg("B", 6, 9)],
+        )
+        cleaned = clean_result(result)
+        assert _spans(cleaned.segments) == [("A", 0, 6), ("B", 6, 9)]
+        assert cleaned.session_id == "S001"
+        assert len(result.segments) == 4
+
+
+class TestMetrics:
+    def test_talk_time_turns_and_overlap(self):
+        metrics = speaker_metrics(
+            [_seg("A", 0, 4), _seg("B", 3, 6), _seg("A", 6, 8), _seg("A", 8, 9), _seg("C", 20, 21)]
+        )
+        assert metrics.speakers == ["A", "B", "C"]
+        np.testing.assert_allclose(metrics.talk_seconds, [7, 3, 1])
+        assert metrics.turns.tolist() == [2, 1, 1]
+        assert metrics.overlap_seconds[0, 1] == pytest.approx(1.0)
+        assert metrics.overlap_seconds[1, 0] == pytest.approx(1.0)
+        assert metrics.overlap_seconds[0, 2] == 0
+        assert metrics.to_dict()["B"] == {
+            "talk_seconds": 3.0,
+            "turns": 1,
+            "overlap_seconds": {"A": 1.0},
+        }
+
+    def test_self_overlap_counts_once_on_diagonal(self):
+        metrics = speaker_metrics([_seg("A", 0, 4), _seg("A", 2, 6)])
+        assert metrics.talk_seconds[0] == pytest.approx(8)
+        assert metrics.overlap_seconds[0, 0] == pytest.approx(6)
+
+    def test_empty(self):
+        metrics = speaker_metrics([])
+        assert metrics.speakers == []
+        assert metrics.to_dict() == {}
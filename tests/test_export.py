@@ -1,13 +1,22 @@
 """Tests for the export module."""
 
+import io
 import json
 from types import SimpleNamespace
 
+import pytest
+
 from src.export import (
+    bundle_to_dict,
     export_session_json,
     export_session_markdown,
     format_time,
+    parse_time,
+    segment_to_dict,
     session_to_dict,
+    write_session_json,
+    write_session_jsonl,
+    write_session_markdown,
 )
 
 
@@ -115,6 +124,21 @@ def test_zero(self):
         assert format_time(0.0) == "0:00"
 
 
+class TestParseTime:
+    def test_round_trips_format_time(self):
+        for seconds in (0, 45, 125, 3661):
+            assert parse_time(format_time(seconds)) == seconds
+
+    def test_plain_and_fractional_seconds(self):
+        assert parse_time("90") == 90
+        assert parse_time("1:05:00.5") == 3900.5
+
+    @pytest.mark.parametrize("value", ["", "1:xx", "1:2:3:4", "1::2", "-5"])
+    def test_rejects_invalid(self, value):
+        with pytest.raises(ValueError, match="invalid time"):
+            parse_time(value)
+
+
 class TestSessionToDict:
     def test_converts_orm_like_object(self):
         from datetime import datetime
@@ -160,3 +184,106 @@ def test_no_participants_or_segments(self):
         assert result["participants"] == []
         assert result["segments"] == []
         assert result["organ_tags"] == []
+
+    def test_row_with_session_attribute_is_not_a_bundle(self):
+        session = SimpleNamespace(
+            id=4,
+            title="Row",
+            date="2026-04-01",
+            format="salon",
+            facilitator=None,
+            notes="",
+            organ_tags=[],
+            session="evening",
+        )
+        result = session_to_dict(session)
+        assert result["id"] == 4
+        assert result["participants"] == []
+
+    def test_bundle_to_dict(self):
+        session = SimpleNamespace(
+            id=3,
+            title="Bundled",
+            date="2026-03-01",
+            format="salon",
+            facilitator=None,
+            notes="",
+            organ_tags=[],
+        )
+        bundle = SimpleNamespace(
+            session=session,
+            participants=[SimpleNamespace(name="Bo", role="guest")],
+            segments=[
+                SimpleNamespace(
+                    speaker="Bo", text="Hi", start_seconds=0.0, end_seconds=1.0, confidence=0.9
+                )
+            ],
+        )
+        result = bundle_to_dict(bundle)
+        assert result["id"] == 3
+        assert result["participants"] == [{"name": "Bo", "role": "guest"}]
+        assert result["segments"][0]["text"] == "Hi"
+
+
+def _segment_rows():
+    """Yield ORM-like segment rows lazily, like a server-side cursor."""
+    for i in range(3):
+        yield SimpleNamespace(
+            speaker=f"S{i}",
+            text=f"line {i}",
+            start_seconds=float(i * 10),
+            end_seconds=float(i * 10 + 10),
+            confidence=0.9,
+        )
+
+
+class TestStreamingWriters:
+    def test_markdown_matches_string_export(self):
+        out = io.StringIO()
+        write_session_markdown(_sample_data(), out)
+        assert out.getvalue() == export_session_markdown(_sample_data())
+
+    def test_markdown_streams_segment_iterable(self):
+        data = _sample_data()
+        data["segments"] = []
+        out = io.StringIO()
+        write_session_markdown(data, out, segments=_segment_rows())
+        md = out.getvalue()
+        assert "## Transcript" in md
+        assert "**[0:20] S2:** line 2" in md
+
+    def test_markdown_empty_iterable_has_no_transcript(self):
+        out = io.StringIO()
+        write_session_markdown(_sample_data(), out, segments=iter([]))
+        assert "## Transcript" not in out.getvalue()
+
+    def test_json_stream_is_valid_json(self):
+        out = io.StringIO()
+        write_session_json(_sample_data(), out)
+        assert json.loads(out.getvalue()) == json.loads(export_session_json(_sample_data()))
+
+    def test_json_stream_with_rows(self):
+        out = io.StringIO()
+        write_session_json(_sample_data(), out, segments=_segment_rows())
+        parsed = json.loads(out.getvalue())
+        assert [s["speaker"] for s in parsed["segments"]] == ["S0", "S1", "S2"]
+        assert parsed["participants"][0]["name"] == "Alice"
+
+    def test_json_stream_no_segments(self):
+        out = io.StringIO()
+        write_session_json(_sample_data(), out, segments=[])
+        assert json.loads(out.getvalue())["segments"] == []
+
+    def test_jsonl_records(self):
+        out = io.StringIO()
+        write_session_jsonl(_sample_data(), out, segments=_segment_rows())
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert records[0]["type"] == "session"
+        assert records[0]["title"] == "Recursion and Identity"
+        assert "segments" not in records[0]
+        assert [r["type"] for r in records[1:]] == ["segment"] * 3
+        assert records[3]["start_seconds"] == 20.0
+
+    def test_segment_to_dict_passes_dicts_through(self):
+        seg = _sample_data()["segments"][0]
+        assert segment_to_dict(seg) is seg
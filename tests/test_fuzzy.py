@@ -0,0 +1,71 @@
+"""Tests for the trigram similarity fallback."""
+
+import pytest
+
+from src.fuzzy import TrigramIndex, similarity, trigrams, word_similarity
+
+
+class TestTrigrams:
+    def test_pads_words_like_pg_trgm(self):
+        assert trigrams("cat") == {"  c", " ca", "cat", "at "}
+
+    def test_ignores_case_and_punctuation(self):
+        assert trigrams("Cat!") == trigrams("cat")
+        assert trigrams("") == frozenset()
+
+
+class TestSimilarity:
+    def test_identical_strings(self):
+        assert similarity("recursion", "Recursion") == 1.0
+
+    def test_typo_scores_between_zero_and_one(self):
+        score = similarity("recusion", "recursion")
+        assert 0.3 < score < 1.0
+
+    def test_unrelated_strings(self):
+        assert similarity("grief", "harmony") == 0.0
+
+    def test_word_similarity_finds_query_inside_long_text(self):
+        title = "Notes on Recursion and Identity in Collective Practice"
+        assert word_similarity("recusion", title) > similarity("recusion", title)
+        assert word_similarity("recursion and identity", title) == 1.0
+
+    # Values returned by Postgres (the pg_trgm documentation's examples)
+    @pytest.mark.parametrize(
+        "query, text, expected",
+        [
+            ("word", "two words", 0.8),
+            ("word", "word", 1.0),
+            ("grief", "harmony", 0.0),
+        ],
+    )
+    def test_word_similarity_matches_pg_trgm(self, query, text, expected):
+        assert word_similarity(query, text) == pytest.approx(expected, abs=1e-6)
+
+    def test_similarity_matches_pg_trgm(self):
+        assert similarity("word", "two words") == pytest.approx(0.363636, abs=1e-6)
+
+
+class TestTrigramIndex:
+    def _index(self):
+        return TrigramIndex(
+            [
+                (1, "Recursion and Identity"),
+                (2, "Grief and Ritual"),
+                (3, "Recursive Poetics"),
+            ]
+        )
+
+    def test_ranks_typo_matches(self):
+        matches = self._index().search("recusion", threshold=0.3)
+        assert matches[0].key == 1
+        assert all(m.score >= 0.3 for m in matches)
+        assert 2 not in {m.key for m in matches}
+
+    def test_threshold_and_limit(self):
+        index = self._index()
+        assert index.search("recusion", threshold=0.99) == []
+        assert len(index.search("recursion", threshold=0.1, limit=1)) == 1
+
+    def test_empty_query(self):
+        assert self._index().search("!!") == []
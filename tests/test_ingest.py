@@ -0,0 +1,154 @@
+"""Tests for the pipelined ingest writer."""
+
+import threading
+from datetime import timedelta
+
+import pytest
+
+from src.ingest import persist_segments
+from src.repository import INGEST_COMPLETED, IngestRun
+from src.transcription import Segment, TranscriptionPipeline
+
+
+def _segments(n):
+    return [
+        Segment(
+            speaker=f"Speaker {i % 2 + 1}",
+            text=f"Segment {i}",
+            start_time=timedelta(seconds=i * 10),
+            end_time=timedelta(seconds=i * 10 + 9),
+        )
+        for i in range(n)
+    ]
+
+
+class MemoryRepo:
+    """Just the ingest-run surface of SalonRepository, kept in memory."""
+
+    def __init__(self, fail_on_batch=None):
+        self.runs = {}
+        self.sessions = {}
+        self.segments = {}
+        self.batches = []
+        self.fail_on_batch = fail_on_batch
+
+    def begin_ingest_run(self, key, session):
+        if key not in self.runs:
+            sid = len(self.sessions) + 1
+            self.sessions[sid] = session
+            self.segments[sid] = []
+            self.runs[key] = IngestRun(key, sid)
+        run = self.runs[key]
+        return IngestRun(run.session_key, run.session_id, run.status, run.segments_written)
+
+    def append_ingest_segments(self, key, session_id, segments):
+        if self.fail_on_batch is not None and len(self.batches) == self.fail_on_batch:
+            raise RuntimeError("connection lost")
+        self.batches.append(threading.current_thread().name)
+        self.segments[session_id].extend(segments)
+        self.runs[key].segments_written += len(segments)
+        return len(segments)
+
+    def finish_ingest_run(self, key):
+        self.runs[key].status = INGEST_COMPLETED
+
+
+SESSION = {"title": "Grief and Ritual", "date": "2026-01-15", "format": "deep_dive"}
+
+
+class TestPersistSegments:
+    def test_writes_all_segments_in_batches_off_thread(self):
+        repo = MemoryRepo()
+        report = persist_segments(repo, "S001", SESSION, _segments(7), batch_size=3)
+        assert report.segments_written == 7
+        assert report.segments_skipped == 0
+        assert [s["text"] for s in repo.segments[1]] == [f"Segment {i}" for i in range(7)]
+        assert len(repo.batches) == 3
+        assert all(name.startswith("ingest-writer-") for name in repo.batches)
+        assert repo.runs["S001"].completed
+
+    def test_completed_key_is_not_reingested(self):
+        repo = MemoryRepo()
+        persist_segments(repo, "S001", SESSION, _segments(4))
+
+        def never():
+            raise AssertionError("completed runs must not consume the stream")
+            yield
+
+        report = persist_segments(repo, "S001", SESSION, never())
+        assert report.already_complete
+        assert report.session_id == 1
+        assert len(repo.sessions) == 1
+        assert len(repo.segments[1]) == 4
+
+    def test_resumes_after_already_written_segments(self):
+        repo = MemoryRepo(fail_on_batch=2)
+        with pytest.raises(RuntimeError, match="connection lost"):
+            persist_segments(repo, "S001", SESSION, _segments(10), batch_size=2)
+        assert repo.runs["S001"].segments_written == 4
+        assert not repo.runs["S001"].completed
+
+        repo.fail_on_batch = None
+        report = persist_segments(repo, "S001", SESSION, _segments(10), batch_size=2)
+        assert report.segments_skipped == 4
+        assert report.segments_written == 6
+        assert [s["text"] for s in repo.segments[1]] == [f"Segment {i}" for i in range(10)]
+        assert len(repo.sessions) == 1
+
+    def test_transcription_failure_keeps_written_batches(self):
+        repo = MemoryRepo()
+
+        def broken():
+            yield from _segments(3)
+            raise OSError("decoder crashed")
+
+        with pytest.raises(OSError, match="decoder crashed"):
+            persist_segments(repo, "S001", SESSION, broken(), batch_size=2)
+        assert repo.runs["S001"].segments_written == 2
+        assert not repo.runs["S001"].completed
+
+    def test_bounded_queue_throttles_transcription(self):
+        release = threading.Event()
+        produced = []
+
+        class SlowRepo(MemoryRepo):
+            def append_ingest_segments(self, key, session_id, segments):
+                release.wait(5)
+                return super().append_ingest_segments(key, session_id, segments)
+
+        def stream():
+            for seg in _segments(20):
+                produced.append(seg)
+                yield seg
+
+        repo = SlowRepo()
+        worker = threading.Thread(
+            target=persist_segments,
+            args=(repo, "S001", SESSION, stream()),
+            kwargs={"batch_size": 1, "queue_depth": 2},
+        )
+        worker.start()
+        worker.join(0.2)
+        # one batch being written, two queued, one blocked in put()
+        assert len(produced) <= 4
+        release.set()
+        worker.join(5)
+        assert len(repo.segments[1]) == 20
+
+    @pytest.mark.parametrize(
+        "option, match", [({"queue_depth": 0}, "queue_depth"), ({"batch_size": 0}, "batch_size")]
+    )
+    def test_rejects_bad_options_before_creating_the_run(self, option, match):
+        repo = MemoryRepo()
+        with pytest.raises(ValueError, match=match):
+            persist_segments(repo, "S001", SESSION, _segments(1), **option)
+        assert repo.runs == {}
+        assert repo.sessions == {}
+
+    def test_streams_from_pipeline(self):
+        repo = MemoryRepo()
+        pipeline = TranscriptionPipeline()
+        stream = pipeline.stream_audio("S001", "/audio/s1.wav", retain=False)
+        report = persist_segments(repo, "S001", SESSION, stream, batch_size=4)
+        assert report.segments_written == 6
+        assert pipeline.get_result("S001").status.value == "completed"
@@ -0,0 +1,222 @@
+"""Tests for the durable ingest job queue."""
+
+import json
+import threading
+import time
+import wave
+from datetime import timedelta
+
+import pytest
+
+from src.jobs import JobQueue, LeaseLost, run_worker, transcribe_job
+from src.transcription import (
+    AudioChunk,
+    ChunkedTranscriptionBackend,
+    Segment,
+    TranscriptionPipeline,
+    TranscriptionStatus,
+)
+
+
+def _write_wav(path, seconds: float, rate: int = 8000) -> str:
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(b"\x00\x00" * int(seconds * rate))
+    return str(path)
+
+
+class SecondsBackend(ChunkedTranscriptionBackend):
+    """One segment per whole second; optionally fails once on a given chunk."""
+
+    def __init__(self, fail_on_chunk=None, **kwargs):
+        super().__init__(**kwargs)
+        self.fail_on_chunk = fail_on_chunk
+        self.chunks_seen = []
+
+    def transcribe_chunk(self, chunk: AudioChunk) -> list[Segment]:
+        if chunk.index == self.fail_on_chunk:
+            self.fail_on_chunk = None
+            raise OSError("backend timeout")
+        self.chunks_seen.append(chunk.index)
+        length = round(chunk.end_seconds - chunk.start_seconds)
+        return [
+            Segment(
+                speaker="Speaker 1",
+                text=f"second {round(chunk.start_seconds) + i}",
+                start_time=timedelta(seconds=i),
+                end_time=timedelta(seconds=i + 1),
+            )
+            for i in range(length)
+        ]
+
+
+class TestQueue:
+    def test_enqueue_is_idempotent(self, tmp_path):
+        queue = JobQueue(tmp_path)
+        assert queue.enqueue([("S1", "a.wav"), ("S2", "b.wav")]) == 2
+        assert queue.enqueue([("S2", "other.wav"), ("S3", "c.wav")]) == 1
+        assert [j.session_id for j in queue.jobs()] == ["S1", "S2", "S3"]
+        assert queue.get("S2").audio_path == "b.wav"
+        assert queue.counts()[TranscriptionStatus.PENDING] == 3
+
+    def test_claims_are_exclusive_and_in_order(self, tmp_path):
+        queue = JobQueue(tmp_path)
+        queue.enqueue([("S1", "a.wav"), ("S2", "b.wav")])
+        first, second = queue.claim("w1"), queue.claim("w2")
+        assert (first.session_id, second.session_id) == ("S1", "S2")
+        assert first.status is TranscriptionStatus.PROCESSING
+        assert first.attempts == 1
+        assert queue.claim("w3") is None
+
+    def test_expired_lease_is_reclaimed(self, tmp_path):
+        queue = JobQueue(tmp_path, lease_seconds=-1)
+        queue.enqueue([("S1", "a.wav")])
+        stale = queue.claim("crashed")
+        queue.checkpoint(stale, 3, 12)
+        job = queue.claim("w2")
+        assert job.session_id == "S1"
+        assert job.attempts == 2
+        assert (job.chunk_offset, job.segments_written) == (3, 12)
+        with pytest.raises(LeaseLost):
+            queue.checkpoint(stale, 4, 16)
+
+    def test_failures_retry_until_out_of_attempts(self, tmp_path):
+        queue = JobQueue(tmp_path, max_attempts=2)
+        queue.enqueue([("S1", "a.wav")])
+        queue.fail(queue.claim("w"), "boom")
+        assert queue.get("S1").status is TranscriptionStatus.PENDING
+        queue.fail(queue.claim("w"), "boom again")
+        job = queue.get("S1")
+        assert job.status is TranscriptionStatus.FAILED
+        assert job.error == "boom again"
+        assert queue.claim("w") is None
+        assert queue.retry_failed() == 1
+        assert queue.claim("w").attempts == 1
+
+    def test_expired_leases_stop_at_max_attempts(self, tmp_path):
+        queue = JobQueue(tmp_path, lease_seconds=-1, max_attempts=2)
+        queue.enqueue([("S1", "a.wav"), ("S2", "b.wav")])
+        assert queue.claim("w1").session_id == "S1"
+        assert queue.claim("w2").session_id == "S1"
+        assert queue.claim("w3").session_id == "S2"
+        job = queue.get("S1")
+        assert job.status is TranscriptionStatus.FAILED
+        assert "lease expired" in job.error
+
+    def test_rejects_zero_attempts(self, tmp_path):
+        with pytest.raises(ValueError, match="max_attempts"):
+            JobQueue(tmp_path, max_attempts=0)
+
+
+class TestWorker:
+    def test_drains_queue_into_transcripts(self, tmp_path):
+        queue = JobQueue(tmp_path / "q")
+        queue.enqueue([("S1", "a.wav"), ("S2", "b.wav")])
+        seen = []
+        report = run_worker(queue, TranscriptionPipeline(), "w", on_result=seen.append)
+        assert report.completed == ["S1", "S2"]
+        assert [job.status for job in seen] == [TranscriptionStatus.COMPLETED] * 2
+        segments = list(queue.read_transcript("S1"))
+        assert len(segments) == 6
+        assert segments[0].text.startswith("Segment 1")
+        assert queue.get("S1").segments_written == 6
+
+    def test_resumes_chunked_job_from_checkpoint(self, tmp_path):
+        audio = _write_wav(tmp_path / "long.wav", 10)
+        backend = SecondsBackend(fail_on_chunk=2, chunk_seconds=4, overlap_seconds=1)
+        queue = JobQueue(tmp_path / "q")
+        queue.enqueue([("S1", audio)])
+        report = run_worker(queue, TranscriptionPipeline(backend=backend), "w", max_jobs=1)
+        assert report.failed == ["S1"]
+        job = queue.get("S1")
+        assert job.status is TranscriptionStatus.PENDING
+        assert job.chunk_offset == 2
+        assert "backend timeout" in job.error
+
+        report = run_worker(queue, TranscriptionPipeline(backend=backend), "w")
+        assert report.completed == ["S1"]
+        assert backend.chunks_seen == [0, 1, 2]
+        texts = [seg.text for seg in queue.read_transcript("S1")]
+        assert texts == [f"second {i}" for i in range(10)]
+
+    def test_discards_lines_after_last_checkpoint(self, tmp_path):
+        queue = JobQueue(tmp_path / "q", lease_seconds=-1)
+        queue.enqueue([("S1", "a.wav")])
+        job = queue.claim("crashed")
+        queue.checkpoint(job, 0, 2)
+        lines = [
+            json.dumps({"speaker": "A", "text": f"t{i}", "start_seconds": i, "end_seconds": i + 1})
+            for i in range(5)
+        ]
+        crashed = queue.transcript_dir / job.attempt_file
+        crashed.write_text("\n".join(lines) + "\n")
+        run_worker(queue, TranscriptionPipeline(), "w")
+        assert not crashed.exists()
+        texts = [seg.text for seg in queue.read_transcript("S1")]
+        assert texts[:2] == ["t0", "t1"]
+        assert len(texts) == 6
+
+    def test_heartbeat_keeps_slow_job_leased(self, tmp_path):
+        queue = JobQueue(tmp_path / "q", lease_seconds=0.15)
+        queue.enqueue([("S1", "a.wav")])
+        job = queue.claim("w")
+        rivals = []
+        with queue.heartbeat(job):
+            for _ in range(10):
+                time.sleep(0.05)
+                rivals.append(queue.claim("rival"))
+        assert not any(rivals)
+        queue.checkpoint(job, 0, 0)
+        assert queue.get("S1").attempts == 1
+
+    def test_heartbeat_reports_lost_lease(self, tmp_path):
+        queue = JobQueue(tmp_path / "q", lease_seconds=0.15)
+        queue.enqueue([("S1", "a.wav")])
+        job = queue.claim("w")
+        with pytest.raises(LeaseLost), queue.heartbeat(job):
+            queue.fail(job, "released elsewhere")
+            time.sleep(0.2)
+
+    def test_stale_worker_cannot_touch_new_attempt(self, tmp_path):
+        queue = JobQueue(tmp_path / "q", lease_seconds=-1)
+        queue.enqueue([("S1", "a.wav")])
+        stale = queue.claim("stale")
+        current = queue.claim("current")
+        transcribe_job(queue, current, TranscriptionPipeline())
+        queue.complete(current)
+        with pytest.raises(LeaseLost):
+            transcribe_job(queue, stale, TranscriptionPipeline())
+        queue.discard_attempt(stale)
+        assert len(list(queue.read_transcript("S1"))) == 6
+        assert [p.name for p in queue.transcript_dir.iterdir()] == ["S1.jsonl"]
+
+    def test_on_transcribed_failure_fails_job(self, tmp_path):
+        queue = JobQueue(tmp_path / "q", max_attempts=1)
+        queue.enqueue([("S1", "a.wav")])
+
+        def persist(job):
+            raise RuntimeError("database down")
+
+        report = run_worker(queue, TranscriptionPipeline(), "w", on_transcribed=persist)
+        assert report.failed == ["S1"]
+        assert queue.get("S1").status is TranscriptionStatus.FAILED
+
+    def test_concurrent_workers_claim_each_job_once(self, tmp_path):
+        queue = JobQueue(tmp_path / "q")
+        queue.enqueue((f"S{i}", f"{i}.wav") for i in range(20))
+        reports = []
+        threads = [
+            threading.Thread(
+                target=lambda: reports.append(run_worker(queue, TranscriptionPipeline()))
+            )
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        done = [sid for report in reports for sid in report.completed]
+        assert sorted(done) == sorted(f"S{i}" for i in range(20))
+        assert all(job.attempts == 1 for job in queue.jobs())
@@ -1,14 +1,59 @@
 """Tests for the repository module.
 
 These tests verify the SalonRepository can be instantiated and that its
-methods exist. Live database tests are skipped unless DATABASE_URL is set.
+methods exist; paging and ingest runs are exercised against SQLite
+(Postgres ARRAY columns are stored as JSON there). Live database tests are skipped unless
+DATABASE_URL is set.
 """
 
+import json
 import os
+import sqlite3
+from datetime import UTC, datetime
+from types import SimpleNamespace
 
 import pytest
+from koinonia_db.models.salon import SalonSessionRow, TaxonomyNodeRow
+from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.compiler import compiles
 
-from src.repository import SalonRepository
+from src.repository import (
+    SalonRepository,
+    TranscriptHit,
+    _batched,
+    _page,
+    decode_cursor,
+    encode_cursor,
+    get_engine,
+)
+from src.schema import ingest_runs_table, stats_table
+from src.stats import ArchiveStats
+
+
+@compiles(ARRAY, "sqlite")
+def _array_as_json(type_, compiler, **kw):
+    return "JSON"
+
+
+sqlite3.register_adapter(list, json.dumps)
+
+
+@pytest.fixture()
+def sqlite_repo(tmp_path):
+    repo = SalonRepository(f"sqlite:///{tmp_path}/archive.db", engine_options={})
+    SalonSessionRow.__table__.create(repo._engine)
+    return repo
+
+
+def _insert_sessions(repo, dates):
+    with repo._engine.begin() as conn:
+        for i, date in enumerate(dates, 1):
+            conn.execute(
+                insert(SalonSessionRow.__table__).values(
+                    id=i, title=f"Session {i}", date=date, format="deep_dive", notes=""
+                )
+            )
 
 
 # Skip live DB tests unless DATABASE_URL is in the environment
@@ -29,24 +74,268 @@ def test_accepts_preconverted_psycopg_url(self):
         url_str = str(repo._engine.url)
         assert "psycopg" in url_str
 
+    def test_repositories_share_engine_for_same_url(self):
+        a = SalonRepository("postgresql+psycopg://localhost/test")
+        b = SalonRepository("postgresql+psycopg://localhost/test")
+        assert a._engine is b._engine
+
+    def test_engine_options_select_distinct_engine(self):
+        default = SalonRepository("postgresql+psycopg://localhost/test")
+        tuned = SalonRepository(
+            "postgresql+psycopg://localhost/test", engine_options={"pool_size": 2}
+        )
+        assert tuned._engine is not default._engine
+        assert tuned._engine is get_engine("postgresql+psycopg://localhost/test", pool_size=2)
+
     def test_has_session_methods(self):
         repo = SalonRepository("postgresql+psycopg://localhost/test")
         assert callable(repo.add_session)
         assert callable(repo.get_session)
         assert callable(repo.list_sessions)
         assert callable(repo.search_by_topic)
+        assert callable(repo.search_fulltext)
+        assert callable(repo.search_transcripts)
+        assert callable(repo.iter_transcript_hits)
         assert callable(repo.get_segments)
+        assert callable(repo.iter_segments)
+        assert callable(repo.iter_sessions)
+        assert callable(repo.get_session_bundle)
+        assert callable(repo.get_session_bundles)
+        assert callable(repo.iter_session_bundles)
+
+    def test_has_paging_methods(self):
+        repo = SalonRepository("postgresql://localhost/test")
+        assert callable(repo.list_sessions_page)
+        assert callable(repo.search_by_topic_page)
+        assert callable(repo.search_by_text_page)
+        assert callable(repo.search_fulltext_page)
+        assert callable(repo.search_transcripts_page)
+        assert callable(repo.iter_search_by_topic)
+        assert callable(repo.iter_search_by_text)
+        assert callable(repo.search_by_taxonomy)
+        assert callable(repo.search_by_tags)
+        assert callable(repo.fuzzy_search_sessions)
+        assert callable(repo.fuzzy_search_taxonomy)
+        assert callable(repo.fuzzy_search_speakers)
+        assert callable(repo.search_by_tags_page)
+        assert callable(repo.iter_search_by_tags)
+        assert callable(repo.search_by_taxonomy_page)
+        assert callable(repo.expand_taxonomy)
+
+    def test_has_bulk_methods(self):
+        repo = SalonRepository("postgresql+psycopg://localhost/test")
+        assert callable(repo.add_sessions_bulk)
+        assert callable(repo.bulk_insert_segments)
+
+    def test_has_ingest_run_methods(self):
+        repo = SalonRepository("postgresql+psycopg://localhost/test")
+        assert callable(repo.get_ingest_run)
+        assert callable(repo.begin_ingest_run)
+        assert callable(repo.append_ingest_segments)
+        assert callable(repo.finish_ingest_run)
 
     def test_has_taxonomy_methods(self):
         repo = SalonRepository("postgresql+psycopg://localhost/test")
         assert callable(repo.add_taxonomy_node)
         assert callable(repo.get_taxonomy_roots)
         assert callable(repo.search_taxonomy)
+        assert callable(repo.get_taxonomy_nodes)
+        assert repo.taxonomy_version == 0
 
     def test_has_count_methods(self):
         repo = SalonRepository("postgresql+psycopg://localhost/test")
         assert callable(repo.count_sessions)
         assert callable(repo.count_taxonomy_nodes)
+        assert callable(repo.compute_stats)
+        assert callable(repo.refresh_stats)
+        assert callable(repo.cached_stats)
+
+
+class TestBatched:
+    def test_splits_into_fixed_size_batches(self):
+        rows = [{"n": i} for i in range(7)]
+        batches = list(_batched(rows, 3))
+        assert [len(b) for b in batches] == [3, 3, 1]
+
+    def test_accepts_generators(self):
+        batches = list(_batched(({"n": i} for i in range(4)), 2))
+        assert batches == [[{"n": 0}, {"n": 1}], [{"n": 2}, {"n": 3}]]
+
+    def test_empty_input(self):
+        assert list(_batched([], 10)) == []
+
+    def test_rejects_non_positive_size(self):
+        with pytest.raises(ValueError, match="batch_size"):
+            list(_batched([{"n": 1}], 0))
+
+
+class TestTagsFilter:
+    def _sql(self, tags, match):
+        from sqlalchemy.dialects import postgresql
+
+        expr = SalonRepository._tags_filter(tags, match)
+        return str(expr.compile(dialect=postgresql.dialect()))
+
+    def test_any_uses_overlap(self):
+        assert "organ_tags &&" in self._sql(["a", "b"], "any")
+
+    def test_all_uses_contains(self):
+        assert "organ_tags @>" in self._sql(["a", "b"], "all")
+
+    def test_rejects_bad_input(self):
+        with pytest.raises(ValueError, match="at least one"):
+            SalonRepository._tags_filter([], "any")
+        with pytest.raises(ValueError, match="match"):
+            SalonRepository._tags_filter(["a"], "some")
+
+
+class TestFulltextRank:
+    def test_rank_is_widened_to_float8(self):
+        from sqlalchemy.dialects import postgresql
+
+        ranks = SalonRepository._fulltext_ranks("grief")
+        sql = str(ranks.compile(dialect=postgresql.dialect()))
+        assert sql.count("CAST(ts_rank(") == 2
+        assert "float4" not in sql
+        assert sql.count("AS DOUBLE PRECISION)") == 2
+
+
+class TestCursors:
+    def test_round_trip(self):
+        token = encode_cursor("sessions", "2026-01-15T00:00:00+00:00", 42)
+        assert "=" not in token
+        assert decode_cursor(token, "sessions") == ["2026-01-15T00:00:00+00:00", 42]
+
+    def test_rejects_other_kind(self):
+        token = encode_cursor("fulltext", 0.5, 3)
+        with pytest.raises(ValueError, match="sessions"):
+            decode_cursor(token, "sessions")
+
+    def test_rejects_garbage(self):
+        with pytest.raises(ValueError, match="Malformed"):
+            decode_cursor("not a cursor!", "sessions")
+
+    def test_page_sets_cursor_only_when_more_rows(self):
+        assert _page([1, 2], 2, "n", lambda r: (r,)).next_cursor is None
+        page = _page([1, 2, 3], 2, "n", lambda r: (r,))
+        assert page.items == [1, 2]
+        assert decode_cursor(page.next_cursor, "n") == [2]
+
+
+class TestTransaction:
+    @pytest.fixture()
+    def repo(self, sqlite_repo):
+        TaxonomyNodeRow.__table__.create(sqlite_repo._engine)
+        return sqlite_repo
+
+    def test_transaction_yields_bound_repository(self, repo):
+        with repo.transaction() as bound:
+            assert bound is not repo
+            assert repo._bound is None
+            with bound._session() as first, bound._session() as second:
+                assert first is second is bound._bound
+            with bound.transaction() as nested:
+                assert nested is bound
+            bound.add_taxonomy_node("poiesis", "Poiesis")
+            assert bound.count_taxonomy_nodes() == 1
+        assert repo.count_taxonomy_nodes() == 1
+
+    def test_transaction_rolls_back_on_error(self, repo):
+        with pytest.raises(RuntimeError, match="abort"), repo.transaction() as bound:
+            root = bound.add_taxonomy_node("poiesis", "Poiesis")
+            bound.add_taxonomy_node("music", "Music", parent_id=root)
+            raise RuntimeError("abort")
+        assert repo.count_taxonomy_nodes() == 0
+
+
+class TestSessionPaging:
+    @pytest.mark.parametrize("page_size", [1, 2, 3, 10])
+    def test_undated_sessions_page_last(self, sqlite_repo, page_size):
+        jan = datetime(2026, 1, 15, tzinfo=UTC)
+        _insert_sessions(sqlite_repo, [jan, None, jan.replace(month=3), None, None])
+        ids, cursor = [], None
+        while True:
+            page = sqlite_repo.list_sessions_page(page_size=page_size, cursor=cursor)
+            ids += [row.id for row in page.items]
+            if (cursor := page.next_cursor) is None:
+                break
+        assert ids == [3, 1, 5, 4, 2]
+
+    def test_undated_cursor_round_trips(self):
+        rows = [SimpleNamespace(date=None, id=4), SimpleNamespace(date=None, id=2)]
+        page = SalonRepository._session_page_result(rows, 1)
+        assert decode_cursor(page.next_cursor, "sessions") == [None, 4]
+
+
+class TestStats:
+    def test_months_are_bucketed_in_utc(self):
+        from sqlalchemy.dialects import postgresql
+
+        stmt = SalonRepository._stats_statements()["by_month"]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "to_char(timezone('UTC', salon_sessions.date), 'YYYY-MM')" in sql
+
+    def test_taxonomy_writes_carry_the_new_node_depth(self, sqlite_repo, monkeypatch):
+        TaxonomyNodeRow.__table__.create(sqlite_repo._engine)
+        deltas = []
+        monkeypatch.setattr(
+            SalonRepository, "_bump_stats", staticmethod(lambda s, delta: deltas.append(delta))
+        )
+        root = sqlite_repo.add_taxonomy_node("poiesis", "Poiesis")
+        child = sqlite_repo.add_taxonomy_node("music", "Music", parent_id=root)
+        sqlite_repo.add_taxonomy_node("jazz", "Jazz", parent_id=child)
+        sqlite_repo.add_taxonomy_node("theoria", "Theoria")
+        assert [d.taxonomy_depth for d in deltas] == [1, 2, 3, 1]
+        assert all(d.taxonomy_nodes == 1 for d in deltas)
+
+    def test_refresh_replaces_figures_in_one_transaction(self, sqlite_repo, monkeypatch):
+        stats_table.create(sqlite_repo._engine)
+        with sqlite_repo._engine.begin() as conn:
+            conn.execute(insert(stats_table).values(dimension="total", key="stale", value=1.0))
+        seen = []
+
+        def compute(cls, s):
+            seen.append(s)
+            return ArchiveStats(sessions=2)
+
+        monkeypatch.setattr(SalonRepository, "_compute_stats", classmethod(compute))
+        with sqlite_repo.transaction() as bound:
+            bound.refresh_stats()
+            assert seen == [bound._bound]
+        cached = sqlite_repo.cached_stats()
+        assert cached.sessions == 2
+        assert cached.refreshed_at is not None
+
+
+INGEST_SESSION = {
+    "title": "Grief and Ritual",
+    "date": datetime(2026, 1, 15, tzinfo=UTC),
+    "format": "deep_dive",
+}
+
+
+class TestIngestRuns:
+    def test_begin_is_idempotent(self, sqlite_repo):
+        ingest_runs_table.create(sqlite_repo._engine)
+        first = sqlite_repo.begin_ingest_run("S001", INGEST_SESSION)
+        assert sqlite_repo.begin_ingest_run("S001", INGEST_SESSION) == first
+        assert sqlite_repo.count_sessions() == 1
+
+    def test_lost_race_returns_winner_without_orphan_session(self, sqlite_repo, monkeypatch):
+        ingest_runs_table.create(sqlite_repo._engine)
+        first = sqlite_repo.begin_ingest_run("S001", INGEST_SESSION)
+        # the existence check misses the run, as if it committed just after the check
+        real = SalonRepository.get_ingest_run
+        checks = []
+
+        def racing(self, key):
+            checks.append(key)
+            return None if len(checks) == 1 else real(self, key)
+
+        monkeypatch.setattr(SalonRepository, "get_ingest_run", racing)
+        second = sqlite_repo.begin_ingest_run("S001", INGEST_SESSION)
+        assert second.session_id == first.session_id
+        assert sqlite_repo.count_sessions() == 1
 
 
 @requires_db
@@ -62,6 +351,12 @@ def test_count_sessions(self, repo):
         assert isinstance(count, int)
         assert count >= 0
 
+    def test_compute_stats_agrees_with_counts(self, repo):
+        stats = repo.compute_stats()
+        assert stats.sessions == repo.count_sessions()
+        assert stats.taxonomy_nodes == repo.count_taxonomy_nodes()
+        assert sum(stats.by_format.values()) == stats.sessions
+
     def test_count_taxonomy_nodes(self, repo):
         count = repo.count_taxonomy_nodes()
         assert isinstance(count, int)
@@ -71,6 +366,102 @@ def test_list_sessions(self, repo):
         sessions = repo.list_sessions(limit=5)
         assert isinstance(sessions, list)
 
+    def test_search_fulltext_returns_ranked_pairs(self, repo):
+        results = repo.search_fulltext("salon", limit=5)
+        assert isinstance(results, list)
+        ranks = [rank for _, rank in results]
+        assert ranks == sorted(ranks, reverse=True)
+
+    def test_search_transcripts_returns_hits(self, repo):
+        hits = repo.search_transcripts("salon", limit=5)
+        assert isinstance(hits, list)
+        for hit in hits:
+            assert isinstance(hit, TranscriptHit)
+            assert hit.start_seconds <= hit.end_seconds
+
+    def test_session_bundles_follow_requested_order(self, repo):
+        ids = [row.id for row in repo.list_sessions(limit=3)]
+        bundles = repo.get_session_bundles(list(reversed(ids)) + [-1])
+        assert [b.session.id for b in bundles] == list(reversed(ids))
+        for bundle in bundles:
+            starts = [seg.start_seconds for seg in bundle.segments]
+            assert starts == sorted(starts)
+            assert all(p.session_id == bundle.session.id for p in bundle.participants)
+
+    def test_list_sessions_pages_do_not_overlap(self, repo):
+        first = repo.list_sessions_page(page_size=2)
+        if first.next_cursor is None:
+            pytest.skip("fewer than three sessions")
+        second = repo.list_sessions_page(page_size=2, cursor=first.next_cursor)
+        assert not {r.id for r in first.items} & {r.id for r in second.items}
+
+    def test_search_pages_keep_rows_tied_on_rank(self, repo):
+        class Rollback(Exception):
+            pass
+
+        word = "zyzzyvaquux"
+        session = {
+            "title": f"{word} evening",
+            "date": "2026-01-01",
+            "format": "deep_dive",
+            "facilitator": None,
+            "notes": "",
+            "organ_tags": [],
+            "participants": [],
+            "segments": [
+                {"speaker": "A", "text": f"{word} again", "start_seconds": 0.0, "end_seconds": 1.0}
+            ],
+        }
+        with pytest.raises(Rollback), repo.transaction() as bound:
+            ids = bound.add_sessions_bulk([session] * 5)
+            seen, cursor = [], None
+            while True:
+                page = bound.search_fulltext_page(word, page_size=2, cursor=cursor)
+                seen += [row.id for row, _ in page.items]
+                if (cursor := page.next_cursor) is None:
+                    break
+            assert seen == sorted(ids, reverse=True)
+            hits, cursor = [], None
+            while True:
+                page = bound.search_transcripts_page(word, page_size=2, cursor=cursor)
+                hits += [hit.session_id for hit in page.items]
+                if (cursor := page.next_cursor) is None:
+                    break
+            assert sorted(hits) == sorted(ids)
+            raise Rollback
+
+    def test_cached_depth_follows_deeper_taxonomy_nodes(self, repo):
+        class Rollback(Exception):
+            pass
+
+        with pytest.raises(Rollback), repo.transaction() as bound:
+            depth = bound.refresh_stats().taxonomy_depth
+            parent = None
+            for level in range(depth + 1):
+                parent = bound.add_taxonomy_node(f"zz-depth-{level}", "Depth", parent_id=parent)
+            cached = bound.cached_stats()
+            assert cached.taxonomy_depth == depth + 1
+            assert cached.taxonomy_depth == bound.compute_stats().taxonomy_depth
+            raise Rollback
+
+    def test_taxonomy_search_includes_exact_tag_matches(self, repo):
+        roots = repo.get_taxonomy_roots()
+        if not roots:
+            pytest.skip("no taxonomy loaded")
+        slug = roots[0].slug
+        assert repo.expand_taxonomy(slug)[0] == slug
+        exact = {row.id for row in repo.search_by_topic(slug)}
+        assert exact <= {row.id for row in repo.search_by_taxonomy(slug)}
+
+    def test_fuzzy_search_orders_by_similarity(self, repo):
+        sessions = repo.list_sessions(limit=1)
+        if not sessions:
+            pytest.skip("no sessions loaded")
+        results = repo.fuzzy_search_sessions(sessions[0].title, threshold=0.5)
+        scores = [score for _, score in results]
+        assert scores == sorted(scores, reverse=True)
+        assert sessions[0].id in {row.id for row, _ in results}
+
     def test_get_taxonomy_roots(self, repo):
         roots = repo.get_taxonomy_roots()
         assert isinstance(roots, list)
@@ -0,0 +1,78 @@
+"""Tests for the schema migrations module."""
+
+from src.schema import (
+    FTS_CONFIG,
+    INGEST_RUNS,
+    MIGRATIONS,
+    SEGMENTS,
+    SESSIONS,
+    STATS,
+    ingest_runs_table,
+    segment_tsvector,
+    session_tsvector,
+    stats_table,
+)
+
+
+class TestTsvectorExpressions:
+    def test_session_document_weights_title_over_notes(self):
+        sql = session_tsvector()
+        assert "coalesce(title, '')), 'A'" in sql
+        assert "coalesce(notes, '')), 'B'" in sql
+
+    def test_qualifier_prefixes_columns(self):
+        assert f"{SESSIONS}.title" in session_tsvector(f"{SESSIONS}.")
+        assert f"{SEGMENTS}.text" in segment_tsvector(f"{SEGMENTS}.")
+
+    def test_config_is_a_literal(self):
+        assert f"to_tsvector('{FTS_CONFIG}'" in segment_tsvector()
+
+
+class TestMigrations:
+    def test_names_are_unique_and_ordered(self):
+        names = [m.name for m in MIGRATIONS]
+        assert names == sorted(names)
+        assert len(names) == len(set(names))
+
+    def test_statements_are_idempotent(self):
+        for migration in MIGRATIONS:
+            for statement in migration.statements:
+                assert "IF NOT EXISTS" in statement
+
+    def test_fulltext_indexes_match_query_expressions(self):
+        ddl = " ".join(MIGRATIONS[0].statements)
+        assert session_tsvector() in ddl
+        assert segment_tsvector() in ddl
+        assert "USING gin" in ddl
+
+    def test_stats_table_matches_migration(self):
+        ddl = next(m for m in MIGRATIONS if m.name == "002_archive_stats").statements[0]
+        assert f"CREATE TABLE IF NOT EXISTS {STATS}" in ddl
+        for column in stats_table.columns:
+            assert column.name in ddl
+        assert "PRIMARY KEY (dimension, key)" in ddl
+
+    def test_organ_tags_index_is_gin(self):
+        ddl = next(m for m in MIGRATIONS if m.name == "003_organ_tags_gin").statements[0]
+        assert f"ON {SESSIONS} USING gin (organ_tags)" in ddl
+
+    def test_trigram_indexes_follow_extension(self):
+        statements = next(m for m in MIGRATIONS if m.name == "004_trigram_search").statements
+        assert statements[0] == "CREATE EXTENSION IF NOT EXISTS pg_trgm"
+        assert all("gin_trgm_ops" in stmt for stmt in statements[1:])
+
+    def test_ingest_runs_table_matches_migration(self):
+        ddl = next(m for m in MIGRATIONS if m.name == "005_ingest_runs").statements[0]
+        assert f"CREATE TABLE IF NOT EXISTS {INGEST_RUNS}" in ddl
+        for column in ingest_runs_table.columns:
+            assert column.name in ddl
+        assert f"REFERENCES {SESSIONS} (id)" in ddl
+
+    def test_segment_seek_indexes_lead_with_session(self):
+        statements = next(m for m in MIGRATIONS if m.name == "006_segment_seek").statements
+        assert f"ON {SEGMENTS} (session_id, start_seconds, end_seconds)" in statements[0]
+        assert f"ON {SEGMENTS} (session_id, speaker, start_seconds)" in statements[1]
+
+    def test_sessions_keyset_index_matches_listing_order(self):
+        ddl = next(m for m in MIGRATIONS if m.name == "007_sessions_date_keyset").statements[0]
+        assert f"ON {SESSIONS} (date DESC NULLS LAST, id DESC)" in ddl
@@ -0,0 +1,141 @@
+"""Tests for the offline search index."""
+
+import json
+
+import pytest
+
+from src.search_index import (
+    LocalSearchIndex,
+    _decode_varint,
+    _encode_varint,
+    build_index,
+    parse_query,
+    tokenize,
+)
+
+
+def _sessions() -> list[dict]:
+    return [
+        {
+            "id": 1,
+            "title": "Recursive Systems as Creative Practice",
+            "date": "2026-02-20",
+            "notes": "Self-reference in art and code.",
+            "organ_tags": ["i-theoria", "ii-poiesis"],
+            "segments": [
+                {"speaker": "Alice", "text": "Recursion is a creative practice."},
+                {"speaker": "Bob", "text": "Systems that describe themselves."},
+            ],
+        },
+        {
+            "id": 2,
+            "title": "Infrastructure as Art",
+            "date": "2026-05-01",
+            "notes": "When does system design become art?",
+            "organ_tags": ["iv-taxis"],
+            "segments": [
+                {"speaker": "Carol", "text": "Practice makes the container creative."},
+            ],
+        },
+        {
+            "id": 3,
+            "title": "Governance Roundtable",
+            "date": "2026-06-01",
+            "notes": "",
+            "organ_tags": ["iv-taxis"],
+            "segments": [],
+        },
+    ]
+
+
+@pytest.fixture()
+def index(tmp_path):
+    build_index(_sessions(), tmp_path / "idx")
+    with LocalSearchIndex(tmp_path / "idx") as idx:
+        yield idx
+
+
+class TestVarint:
+    @pytest.mark.parametrize("value", [0, 1, 127, 128, 300, 2**21, 2**35])
+    def test_roundtrip(self, value):
+        buf = bytearray()
+        _encode_varint(value, buf)
+        decoded, pos = _decode_varint(bytes(buf), 0)
+        assert decoded == value
+        assert pos == len(buf)
+
+
+class TestParseQuery:
+    def test_terms_phrases_and_tags(self):
+        parsed = parse_query('recursion "creative practice" tag:II-Poiesis')
+        assert parsed.terms == ["recursion"]
+        assert parsed.phrases == [["creative", "practice"]]
+        assert parsed.tags == ["ii-poiesis"]
+
+    def test_single_word_phrase_is_a_term(self):
+        assert parse_query('"art"').terms == ["art"]
+
+    def test_tokenize_lowercases(self):
+        assert tokenize("Self-Reference, ART!") == ["self", "reference", "art"]
+
+
+class TestBuildIndex:
+    def test_writes_index_files(self, tmp_path):
+        out = build_index(_sessions(), tmp_path / "idx")
+        meta = json.loads((out / "index.json").read_text())
+        assert meta["doc_count"] == 3
+        assert (out / "postings.bin").stat().st_size > 0
+
+    def test_empty_archive(self, tmp_path):
+        build_index([], tmp_path / "idx")
+        with LocalSearchIndex(tmp_path / "idx") as idx:
+            assert idx.doc_count == 0
+            assert idx.search("anything") == []
+
+
+class TestSearch:
+    def test_term_query_ranks_by_bm25(self, index):
+        hits = index.search("recursion")
+        assert [h.session_id for h in hits] == [1]
+        assert hits[0].score > 0
+
+    def test_or_semantics_for_bare_terms(self, index):
+        ids = {h.session_id for h in index.search("recursion infrastructure")}
+        assert ids == {1, 2}
+
+    def test_phrase_requires_adjacency(self, index):
+        assert [h.session_id for h in index.search('"creative practice"')] == [1]
+        assert index.search('"practice creative"') == []
+
+    def test_phrase_does_not_span_fields(self, index):
+        # "art" ends session 2's title and "when" starts its notes
+        assert index.search('"art when"') == []
+
+    def test_tag_filter(self, index):
+        hits = index.search("tag:iv-taxis")
+        assert {h.session_id for h in hits} == {2, 3}
+
+    def test_tag_filter_combined_with_terms(self, index):
+        hits = index.search("art tag:iv-taxis")
+        assert [h.session_id for h in hits] == [2]
+        assert hits[0].score > 0
+
+    def test_tagged_document_without_terms_is_not_a_hit(self, index):
+        # Session 3 carries the tag but none of the query terms
+        assert index.search("governance tag:iv-taxis")[0].session_id == 3
+        assert index.search("recursion tag:iv-taxis") == []
+
+    def test_unknown_term(self, index):
+        assert index.search("zeitgeist") == []
+
+    def test_limit(self, index):
+        assert len(index.search("tag:iv-taxis", limit=1)) == 1
+
+    def test_postings_positions(self, index):
+        plist = index.postings("recursive")
+        assert plist == {0: [0]}
+
+    def test_fuzzy_title_search_tolerates_typos(self, index):
+        hits = index.fuzzy_search("govenance", threshold=0.3)
+        assert [h.session_id for h in hits] == [3]
+        assert 0.3 <= hits[0].score < 1.0
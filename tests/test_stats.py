@@ -0,0 +1,65 @@
+"""Tests for the archive statistics module."""
+
+from datetime import datetime, timedelta, timezone
+
+from src.stats import ArchiveStats, session_month
+
+
+class TestSessionMonth:
+    def test_datetime(self):
+        assert session_month(datetime(2026, 1, 15, 19, 30)) == "2026-01"
+
+    def test_iso_string(self):
+        assert session_month("2026-02-01T00:00:00+00:00") == "2026-02"
+
+    def test_aware_values_are_bucketed_in_utc(self):
+        evening = datetime(2026, 1, 31, 20, 0, tzinfo=timezone(timedelta(hours=-5)))
+        assert session_month(evening) == "2026-02"
+        assert session_month("2026-01-31T20:00:00-05:00") == "2026-02"
+        assert session_month(datetime(2026, 1, 31, 23, 30)) == "2026-01"
+
+    def test_missing(self):
+        assert session_month(None) == "undated"
+
+
+class TestArchiveStats:
+    def _delta(self) -> ArchiveStats:
+        delta = ArchiveStats()
+        delta.add_session(
+            {"format": "deep_dive", "date": datetime(2026, 1, 15), "organ_tags": ["i", "vi"]}
+        )
+        delta.add_session({"format": "roundtable", "date": "2026-01-20", "organ_tags": None})
+        delta.add_segments(
+            [
+                {"speaker": "Ana", "start_seconds": 0.0, "end_seconds": 90.0},
+                {"speaker": "Bo", "start_seconds": 90.0, "end_seconds": 120.0},
+                {"speaker": "Ana", "start_seconds": 120.0, "end_seconds": 150.0},
+            ]
+        )
+        return delta
+
+    def test_accumulates_sessions_and_segments(self):
+        delta = self._delta()
+        assert delta.sessions == 2
+        assert delta.by_month == {"2026-01": 2}
+        assert delta.by_format == {"deep_dive": 1, "roundtable": 1}
+        assert delta.by_tag == {"i": 1, "vi": 1}
+        assert delta.segments == 3
+        assert delta.transcript_seconds == 150.0
+        assert delta.speaker_seconds == {"Ana": 120.0, "Bo": 30.0}
+
+    def test_rows_omit_zero_totals(self):
+        rows = ArchiveStats(taxonomy_nodes=1).to_rows()
+        assert rows == [("total", "taxonomy_nodes", 1.0)]
+
+    def test_row_round_trip(self):
+        stats = self._delta()
+        stats.taxonomy_depth = 3
+        stats.refreshed_at = 1700000000.0
+        restored = ArchiveStats.from_rows(stats.to_rows())
+        assert restored == stats
+        assert isinstance(restored.sessions, int)
+        assert restored.transcript_hours == 150.0 / 3600
+
+    def test_unknown_rows_are_ignored(self):
+        assert ArchiveStats.from_rows([("future", "x", 1.0)]) == ArchiveStats()
@@ -0,0 +1,139 @@
+"""Tests for the in-memory taxonomy tree."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.taxonomy import TaxonomyService, TaxonomyTree
+
+
+def _row(id, slug, parent_id=None):
+    return SimpleNamespace(
+        id=id,
+        slug=slug,
+        label=slug.title(),
+        parent_id=parent_id,
+        description=None,
+        organ_id=None,
+    )
+
+
+ROWS = [
+    _row(1, "poiesis"),
+    _row(2, "music", 1),
+    _row(3, "rhythm", 2),
+    _row(4, "poetry", 1),
+    _row(5, "koinonia"),
+    _row(6, "melody", 2),
+]
+
+
+@pytest.fixture()
+def tree():
+    return TaxonomyTree.from_rows(ROWS)
+
+
+class TestTaxonomyTree:
+    def test_lookup_by_id_and_slug(self, tree):
+        assert len(tree) == 6
+        assert tree.by_slug("rhythm").id == 3
+        assert tree.get(4).slug == "poetry"
+        assert "music" in tree and 5 in tree and "dance" not in tree
+
+    def test_roots_and_children(self, tree):
+        assert tree.roots == [1, 5]
+        assert [n.slug for n in tree.children("music")] == ["rhythm", "melody"]
+
+    def test_ancestors_and_depth(self, tree):
+        assert [n.slug for n in tree.ancestors("rhythm")] == ["poiesis", "music"]
+        assert tree.by_slug("rhythm").depth == 3
+        assert tree.ancestors(1) == []
+
+    def test_subtree_is_preorder(self, tree):
+        assert [n.slug for n in tree.subtree("poiesis")] == [
+            "poiesis",
+            "music",
+            "rhythm",
+            "melody",
+            "poetry",
+        ]
+        assert [n.slug for n in tree.subtree(5)] == ["koinonia"]
+
+    def test_is_descendant(self, tree):
+        assert tree.is_descendant("rhythm", "poiesis")
+        assert tree.is_descendant("music", "music")
+        assert not tree.is_descendant("poetry", "music")
+        assert not tree.is_descendant("poiesis", "rhythm")
+
+    def test_expand_slugs(self, tree):
+        assert tree.expand_slugs(["music", "rhythm", "free-form"]) == [
+            "music",
+            "rhythm",
+            "melody",
+            "free-form",
+        ]
+
+    def test_unknown_key(self, tree):
+        with pytest.raises(KeyError):
+            tree.subtree("nope")
+
+    def test_orphan_becomes_root(self):
+        tree = TaxonomyTree.from_rows([_row(1, "a"), _row(2, "b", 99)])
+        assert tree.roots == [1, 2]
+
+    def test_cycle_rejected(self):
+        with pytest.raises(ValueError, match="cycle"):
+            TaxonomyTree.from_rows([_row(1, "root"), _row(2, "a", 3), _row(3, "b", 2)])
+
+    def test_deep_chain_does_not_recurse(self):
+        rows = [_row(1, "n1")] + [_row(i, f"n{i}", i - 1) for i in range(2, 5001)]
+        tree = TaxonomyTree.from_rows(rows)
+        assert tree.is_descendant("n5000", "n1")
+        assert tree.by_slug("n5000").depth == 5000
+
+
+class _FakeRepo:
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.taxonomy_version = 0
+        self.loads = 0
+
+    def get_taxonomy_nodes(self):
+        self.loads += 1
+        return list(self.rows)
+
+    def add_taxonomy_node(self, slug, label, parent_id=None, **fields):
+        node_id = max(r.id for r in self.rows) + 1
+        self.rows.append(_row(node_id, slug, parent_id))
+        self.taxonomy_version += 1
+        return node_id
+
+
+class TestTaxonomyService:
+    def test_loads_once(self):
+        repo = _FakeRepo(ROWS)
+        service = TaxonomyService(repo)
+        service.tree()
+        service.tree()
+        assert repo.loads == 1
+
+    def test_reloads_after_write(self):
+        repo = _FakeRepo(ROWS)
+        service = TaxonomyService(repo)
+        new_id = service.add_node("harmony", "Harmony", parent="music")
+        assert service.tree().by_slug("harmony").parent_id == 2
+        assert service.tree().is_descendant(new_id, "poiesis")
+        assert repo.loads == 2
+
+    def test_invalidate_and_ttl(self):
+        repo = _FakeRepo(ROWS)
+        service = TaxonomyService(repo)
+        service.tree()
+        service.invalidate()
+        service.tree()
+        assert repo.loads == 2
+
+        expiring = TaxonomyService(repo, ttl=0.0)
+        expiring.tree()
+        expiring.tree()
+        assert repo.loads == 4
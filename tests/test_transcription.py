@@ -1,15 +1,28 @@
 """Tests for the transcription module."""
+
+import json
+import pickle
+import random
+import wave
 from datetime import timedelta
 
 import pytest
 
 from src.transcription import (
+    AudioChunk,
+    ChunkedTranscriptionBackend,
     MockBackend,
     Segment,
+    SegmentStore,
     TranscriptionBackend,
     TranscriptionPipeline,
+    TranscriptionResult,
     TranscriptionStatus,
     WhisperBackend,
+    discover_audio,
+    iter_wav_chunks,
+    load_manifest,
+    stitch_segments,
 )
 
 
@@ -19,21 +32,27 @@ def test_pipeline_processes_audio():
     assert result.status == TranscriptionStatus.COMPLETED
     assert len(result.segments) > 0
 
+
 def test_pipeline_stores_result():
     pipeline = TranscriptionPipeline()
     pipeline.process_audio("S001", "/audio/session1.wav")
     assert pipeline.get_result("S001") is not None
     assert pipeline.get_result("MISSING") is None
 
+
 def test_segment_duration():
-    seg = Segment(speaker="A", text="Hello", start_time=timedelta(seconds=10), end_time=timedelta(seconds=25))
+    seg = Segment(
+        speaker="A", text="Hello", start_time=timedelta(seconds=10), end_time=timedelta(seconds=25)
+    )
     assert seg.duration == timedelta(seconds=15)
 
+
 def test_result_full_text():
     pipeline = TranscriptionPipeline()
     result = pipeline.process_audio("S001", "/audio/test.wav")
     assert len(result.full_text) > 0
 
+
 def test_extract_segments_by_speaker():
     pipeline = TranscriptionPipeline()
     result = pipeline.process_audio("S001", "/audio/test.wav")
@@ -135,3 +154,332 @@ def transcribe(self, audio_path: str) -> list[Segment]:
         assert backend.call_count == 1
         assert len(result.segments) == 1
         assert result.segments[0].text == "counted"
+
+
+class FlakyBackend(TranscriptionBackend):
+    """Fails for any path containing 'bad'; module-level so process pools can pickle it."""
+
+    def transcribe(self, audio_path: str) -> list[Segment]:
+        if "bad" in audio_path:
+            raise RuntimeError(f"cannot decode {audio_path}")
+        return MockBackend().transcribe(audio_path)
+
+
+class TestProcessMany:
+    def test_results_in_input_order(self):
+        pipeline = TranscriptionPipeline()
+        jobs = [(f"S{i}", f"/audio/{i}.wav") for i in range(5)]
+        results = pipeline.process_many(jobs, max_workers=2)
+        assert [r.session_id for r in results] == ["S0", "S1", "S2", "S3", "S4"]
+        assert all(r.status == TranscriptionStatus.COMPLETED for r in results)
+        assert results[3].audio_path == "/audio/3.wav"
+
+    def test_failures_are_isolated(self):
+        pipeline = TranscriptionPipeline(backend=FlakyBackend())
+        jobs = [("S1", "/audio/good.wav"), ("S2", "/audio/bad.wav"), ("S3", "/audio/ok.wav")]
+        results = pipeline.process_many(jobs, max_workers=3)
+        assert [r.status for r in results] == [
+            TranscriptionStatus.COMPLETED,
+            TranscriptionStatus.FAILED,
+            TranscriptionStatus.COMPLETED,
+        ]
+        assert "cannot decode" in results[1].error
+        assert results[1].segments == []
+
+    def test_results_are_stored(self):
+        pipeline = TranscriptionPipeline()
+        pipeline.process_many([("S1", "/a.wav"), ("S2", "/b.wav")])
+        assert pipeline.get_result("S2").status == TranscriptionStatus.COMPLETED
+
+    def test_on_result_callback(self):
+        seen = []
+        pipeline = TranscriptionPipeline()
+        pipeline.process_many([("S1", "/a.wav"), ("S2", "/b.wav")], on_result=seen.append)
+        assert sorted(r.session_id for r in seen) == ["S1", "S2"]
+
+    def test_process_executor(self):
+        pipeline = TranscriptionPipeline(backend=FlakyBackend())
+        results = pipeline.process_many(
+            [("S1", "/audio/a.wav"), ("S2", "/audio/bad.wav")],
+            max_workers=2,
+            executor="process",
+        )
+        assert results[0].status == TranscriptionStatus.COMPLETED
+        assert results[1].status == TranscriptionStatus.FAILED
+
+    def test_rejects_unknown_executor(self):
+        with pytest.raises(ValueError, match="executor"):
+            TranscriptionPipeline().process_many([], executor="fiber")
+
+
+class TestBatchHelpers:
+    def test_discover_audio(self, tmp_path):
+        (tmp_path / "s2.wav").write_bytes(b"")
+        (tmp_path / "s1.MP3").write_bytes(b"")
+        (tmp_path / "notes.txt").write_text("skip")
+        jobs = discover_audio(tmp_path)
+        assert [sid for sid, _ in jobs] == ["s1", "s2"]
+
+    def test_load_manifest(self, tmp_path):
+        path = tmp_path / "manifest.json"
+        path.write_text(json.dumps([{"session_id": 7, "audio_path": "/a.wav"}]))
+        assert load_manifest(path) == [("7", "/a.wav")]
+
+
+# --- Chunked streaming ---
+
+
+def _write_wav(path, seconds: float, rate: int = 8000) -> str:
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(b"\x00\x00" * int(seconds * rate))
+    return str(path)
+
+
+class SecondsBackend(ChunkedTranscriptionBackend):
+    """Emits one segment per whole second of audio, labelled by absolute second."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.chunks_seen = 0
+
+    def transcribe_chunk(self, chunk: AudioChunk) -> list[Segment]:
+        self.chunks_seen += 1
+        length = round(chunk.end_seconds - chunk.start_seconds)
+        return [
+            Segment(
+                speaker="Speaker 1",
+                text=f"second {round(chunk.start_seconds) + i}",
+                start_time=timedelta(seconds=i),
+                end_time=timedelta(seconds=i + 1),
+            )
+            for i in range(length)
+        ]
+
+
+class TestWavChunks:
+    def test_chunks_overlap_and_cover_file(self, tmp_path):
+        path = _write_wav(tmp_path / "a.wav", 10)
+        chunks = list(iter_wav_chunks(path, chunk_seconds=4, overlap_seconds=1))
+        assert [(c.start_seconds, c.end_seconds) for c in chunks] == [
+            (0.0, 4.0),
+            (3.0, 7.0),
+            (6.0, 10.0),
+        ]
+        assert chunks[0].overlap_before == 0.0
+        assert chunks[1].overlap_before == 1.0
+        assert chunks[-1].overlap_after == 0.0
+        assert len(chunks[1].frames) == 4 * 8000 * 2
+
+    def test_no_overlap(self, tmp_path):
+        path = _write_wav(tmp_path / "a.wav", 5)
+        chunks = list(iter_wav_chunks(path, chunk_seconds=2, overlap_seconds=0))
+        assert [c.end_seconds for c in chunks] == [2.0, 4.0, 5.0]
+
+    def test_rejects_overlap_not_smaller_than_chunk(self, tmp_path):
+        path = _write_wav(tmp_path / "a.wav", 1)
+        with pytest.raises(ValueError, match="overlap_seconds"):
+            list(iter_wav_chunks(path, chunk_seconds=2, overlap_seconds=2))
+
+
+class TestStitching:
+    def test_overlap_is_deduplicated(self, tmp_path):
+        path = _write_wav(tmp_path / "a.wav", 10)
+        backend = SecondsBackend(chunk_seconds=4, overlap_seconds=1)
+        segments = backend.transcribe(path)
+        assert [s.text for s in segments] == [f"second {i}" for i in range(10)]
+        assert segments[-1].end_time == timedelta(seconds=10)
+        assert backend.chunks_seen == 3
+
+    def test_boundary_duplicate_with_jitter_dropped(self):
+        first = AudioChunk(0, 0.0, 4.0, b"", 8000, 1, 2, overlap_after=1.0)
+        second = AudioChunk(1, 3.0, 7.0, b"", 8000, 1, 2, overlap_before=1.0)
+        a = Segment("A", "hello", timedelta(seconds=2.5), timedelta(seconds=3.4))
+        # Same utterance seen again, with its midpoint just past the split
+        b = Segment("A", "hello", timedelta(seconds=0.1), timedelta(seconds=0.6))
+        out = list(stitch_segments([(first, [a]), (second, [b])]))
+        assert len(out) == 1
+
+    def test_stream_is_lazy(self, tmp_path):
+        path = _write_wav(tmp_path / "a.wav", 10)
+        backend = SecondsBackend(chunk_seconds=4, overlap_seconds=1)
+        first = next(backend.stream(path))
+        assert first.text == "second 0"
+        assert backend.chunks_seen == 1
+
+
+class TestStreamAudio:
+    def test_yields_and_completes(self, tmp_path):
+        path = _write_wav(tmp_path / "a.wav", 6)
+        backend = SecondsBackend(chunk_seconds=4, overlap_seconds=1)
+        pipeline = TranscriptionPipeline(backend=backend)
+        stream = pipeline.stream_audio("S1", path)
+        next(stream)
+        assert pipeline.get_result("S1").status == TranscriptionStatus.PROCESSING
+        rest = list(stream)
+        result = pipeline.get_result("S1")
+        assert result.status == TranscriptionStatus.COMPLETED
+        assert len(result.segments) == 1 + len(rest) == 6
+
+    def test_retain_false_keeps_result_empty(self, tmp_path):
+        path = _write_wav(tmp_path / "a.wav", 6)
+        backend = SecondsBackend(chunk_seconds=4, overlap_seconds=1)
+        pipeline = TranscriptionPipeline(backend=backend)
+        assert len(list(pipeline.stream_audio("S1", path, retain=False))) == 6
+        assert pipeline.get_result("S1").segments == []
+
+    def test_default_stream_for_plain_backends(self):
+        pipeline = TranscriptionPipeline()
+        assert len(list(pipeline.stream_audio("S1", "/audio/x.wav"))) == 6
+
+    def test_failure_marks_result(self):
+        pipeline = TranscriptionPipeline(backend=WhisperBackend())
+        with pytest.raises(NotImplementedError):
+            list(pipeline.stream_audio("S1", "/audio/x.wav"))
+        assert pipeline.get_result("S1").status == TranscriptionStatus.FAILED
+
+
+# --- Columnar segment storage ---
+
+
+def _seg(speaker: str, text: str, start: float, end: float, confidence: float = 0.9) -> Segment:
+    return Segment(
+        speaker=speaker,
+        text=text,
+        start_time=timedelta(seconds=start),
+        end_time=timedelta(seconds=end),
+        confidence=confidence,
+    )
+
+
+class TestSegmentStore:
+    def test_rows_roundtrip(self):
+        segs = [_seg("A", "one", 0, 1.5), _seg("B", "two", 1.5, 3.25, 0.5), _seg("A", "", 4, 5)]
+        store = SegmentStore(segs)
+        assert len(store) == 3
+        assert list(store) == segs
+        assert store[1] == segs[1]
+        assert store[-1].text == ""
+        assert store[0:2] == segs[0:2]
+
+    def test_index_error(self):
+        with pytest.raises(IndexError):
+            SegmentStore()[0]
+
+    def test_segments_are_slotted(self):
+        assert not hasattr(_seg("A", "x", 0, 1), "__dict__")
+
+    def test_speakers_are_interned_in_first_appearance_order(self):
+        store = SegmentStore([_seg("B", "x", 0, 1), _seg("A", "y", 1, 2), _seg("B", "z", 2, 3)])
+        assert store.speakers == ["B", "A"]
+        assert [s.text for s in store.by_speaker("B")] == ["x", "z"]
+        assert store.by_speaker("C") == []
+
+    def test_aggregates_track_appends(self):
+        store = SegmentStore([_seg("A", "hello", 0, 10)])
+        assert store.full_text == "hello"
+        store.append(_seg("B", "world", 10, 8 + 4))
+        assert store.full_text == "hello world"
+        assert store.max_end_seconds == 12
+
+    def test_starting_between(self):
+        store = SegmentStore(_seg("A", str(i), i * 10, i * 10 + 10) for i in range(10))
+        assert [s.text for s in store.starting_between(20, 50)] == ["2", "3", "4"]
+        assert store.starting_between(95, 200) == []
+
+    def test_starting_between_unsorted_appends(self):
+        store = SegmentStore([_seg("A", "late", 50, 60), _seg("A", "early", 5, 10)])
+        assert [s.text for s in store.starting_between(0, 100)] == ["early", "late"]
+        store.append(_seg("A", "middle", 20, 30))
+        assert [s.text for s in store.starting_between(0, 100)] == ["early", "middle", "late"]
+
+    def test_overlapping_includes_turns_under_way(self):
+        store = SegmentStore(_seg("AB"[i % 2], str(i), i * 10, i * 10 + 15) for i in range(10))
+        assert [s.text for s in store.overlapping(20, 40)] == ["1", "2", "3"]
+        assert [s.text for s in store.overlapping(20, 40, speaker="B")] == ["1", "3"]
+        assert store.overlapping(200, 300) == []
+        assert store.overlapping(0, 100, speaker="C") == []
+
+    def test_overlapping_matches_scan_for_unsorted_appends(self):
+        rng = random.Random(7)
+        segs = []
+        for i in range(200):
+            start = rng.uniform(0, 500)
+            segs.append(_seg("A", str(i), start, start + rng.choice([0, 1, rng.uniform(0, 60)])))
+        store = SegmentStore(segs)
+        for _ in range(50):
+            lo = rng.uniform(-10, 510)
+            hi = lo + rng.uniform(0, 40)
+            expected = sorted(
+                (
+                    s
+                    for s in segs
+                    if s.start_time.total_seconds() < hi and s.end_time.total_seconds() > lo
+                ),
+                key=lambda s: s.start_time,
+            )
+            assert [s.start_time for s in store.overlapping(lo, hi)] == [
+                s.start_time for s in expected
+            ]
+
+    def test_indexes_track_appends(self):
+        store = SegmentStore([_seg("A", "one", 0, 10), _seg("B", "two", 10, 20)])
+        assert len(store.overlapping(0, 100)) == 2
+        assert [s.text for s in store.by_speaker("A")] == ["one"]
+        store.append(_seg("A", "zero", -5, 1))
+        assert [s.text for s in store.overlapping(0, 100)] == ["zero", "one", "two"]
+        assert [s.text for s in store.by_speaker("A")] == ["one", "zero"]
+
+    def test_columns_and_texts(self):
+        store = SegmentStore([_seg("B", "one", 0, 1.5, 0.5), _seg("A", "two", 2, 3)])
+        starts, ends, confidence, speaker_ids = store.columns()
+        assert list(starts) == [0, 2]
+        assert list(ends) == [1.5, 3]
+        assert list(confidence) == [0.5, 0.9]
+        assert [store.speakers[i] for i in speaker_ids] == ["B", "A"]
+        assert store.texts() == ["one", "two"]
+
+    def test_interleaved_appends_and_reads_keep_few_chunks(self):
+        store = SegmentStore()
+        texts = []
+        for i in range(1000):
+            texts.append("" if i % 7 == 0 else f"turn {i}")
+            store.append(_seg("A", texts[-1], i, i + 1))
+            assert store[-1].text == texts[-1]
+            assert store[i // 2].text == texts[i // 2]
+        assert len(store._chunks) <= (1000).bit_length()
+        assert store.texts() == texts
+        assert pickle.loads(pickle.dumps(store)).texts() == texts
+
+    def test_equality_with_lists(self):
+        segs = [_seg("A", "x", 0, 1)]
+        assert SegmentStore(segs) == segs
+        assert SegmentStore() == []
+        assert SegmentStore(segs) != []
+
+
+class TestTranscriptionResultStore:
+    def test_segments_between(self):
+        result = TranscriptionPipeline().process_audio("S1", "/audio/a.wav")
+        window = result.segments_between(20, 40)
+        assert [s.start_time.total_seconds() for s in window] == [15, 35]
+        assert [s.speaker for s in result.segments_between(20, 40, "Speaker 2")] == ["Speaker 2"]
+
+    def test_list_assignment_is_converted(self):
+        result = TranscriptionResult(session_id="S1")
+        result.segments = [_seg("A", "x", 0, 2)]
+        assert isinstance(result.segments, SegmentStore)
+        assert result.total_duration == timedelta(seconds=2)
+
+    def test_empty_result_aggregates(self):
+        result = TranscriptionResult(session_id="S1")
+        assert result.total_duration == timedelta(0)
+        assert result.speaker_list == []
+        assert result.full_text == ""
+
+    def test_constructor_accepts_list(self):
+        result = TranscriptionResult(session_id="S1", segments=[_seg("A", "x", 0, 1)])
+        assert isinstance(result.segments, SegmentStore)
+        assert result.speaker_list == ["A"]
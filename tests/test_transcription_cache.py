@@ -0,0 +1,148 @@
+"""Tests for the persistent transcription cache."""
+
+import os
+from datetime import timedelta
+
+from src.transcription import (
+    MockBackend,
+    Segment,
+    TranscriptionBackend,
+    TranscriptionPipeline,
+)
+from src.transcription_cache import TranscriptionCache, hash_audio
+
+
+class CountingBackend(TranscriptionBackend):
+    def __init__(self):
+        self.calls = 0
+
+    def transcribe(self, audio_path: str) -> list[Segment]:
+        self.calls += 1
+        return [
+            Segment(
+                speaker="A",
+                text="hello",
+                start_time=timedelta(seconds=1.5),
+                end_time=timedelta(seconds=3),
+                confidence=0.9,
+            )
+        ]
+
+
+def _audio(tmp_path, name="a.wav", content=b"RIFF-audio-bytes"):
+    path = tmp_path / name
+    path.write_bytes(content)
+    return str(path)
+
+
+class TestKeys:
+    def test_hash_is_content_based(self, tmp_path):
+        a = _audio(tmp_path, "a.wav")
+        b = _audio(tmp_path, "b.wav")
+        assert hash_audio(a) == hash_audio(b)
+
+    def test_key_depends_on_language_and_backend(self):
+        mock = MockBackend()
+        base = TranscriptionCache.key_for("h", mock, "en")
+        assert base == TranscriptionCache.key_for("h", mock, "en")
+        assert base != TranscriptionCache.key_for("h", mock, "de")
+        assert base != TranscriptionCache.key_for("h", CountingBackend(), "en")
+
+    def test_key_depends_on_backend_version(self):
+        class V2(MockBackend):
+            version = "2"
+
+        class V1(MockBackend):
+            pass
+
+        assert V1().cache_identity() != MockBackend().cache_identity()
+        v2 = V2()
+        k2 = TranscriptionCache.key_for("h", v2, "en")
+        v2.version = "3"
+        assert TranscriptionCache.key_for("h", v2, "en") != k2
+
+    def test_missing_file_has_no_key(self, tmp_path):
+        cache = TranscriptionCache(tmp_path / "cache")
+        assert cache.key(str(tmp_path / "nope.wav"), MockBackend(), "en") is None
+
+
+class TestCache:
+    def test_roundtrip_preserves_segments(self, tmp_path):
+        cache = TranscriptionCache(tmp_path / "cache")
+        segs = CountingBackend().transcribe("x")
+        cache.put("ab" * 32, segs)
+        assert cache.get("ab" * 32) == segs
+        assert cache.stats.hits == 1
+        assert cache.stats.stores == 1
+
+    def test_miss(self, tmp_path):
+        cache = TranscriptionCache(tmp_path / "cache")
+        assert cache.get("cd" * 32) is None
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_rate == 0.0
+
+    def test_lru_eviction(self, tmp_path):
+        cache = TranscriptionCache(tmp_path / "cache")
+        segs = CountingBackend().transcribe("x")
+        keys = [f"{i:02d}" * 32 for i in range(3)]
+        for i, key in enumerate(keys):
+            cache.put(key, segs)
+            os.utime(cache._path(key), (1000 + i, 1000 + i))
+        entry_size = cache._path(keys[0]).stat().st_size
+        # Touch the oldest so the middle entry becomes least recently used
+        cache.get(keys[0])
+        cache.max_bytes = entry_size * 2
+        assert cache.evict() == 1
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.stats.evictions == 1
+
+    def test_clear(self, tmp_path):
+        cache = TranscriptionCache(tmp_path / "cache")
+        cache.put("ef" * 32, [])
+        cache.clear()
+        assert cache.size_bytes() == 0
+
+
+class TestPipelineCache:
+    def test_second_run_is_served_from_cache(self, tmp_path):
+        backend = CountingBackend()
+        cache = TranscriptionCache(tmp_path / "cache")
+        audio = _audio(tmp_path)
+        first = TranscriptionPipeline(backend=backend, cache=cache).process_audio("S1", audio)
+        second = TranscriptionPipeline(backend=backend, cache=cache).process_audio("S2", audio)
+        assert backend.calls == 1
+        assert second.segments == first.segments
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_changed_audio_misses(self, tmp_path):
+        backend = CountingBackend()
+        pipeline = TranscriptionPipeline(backend=backend, cache=TranscriptionCache(tmp_path / "c"))
+        pipeline.process_audio("S1", _audio(tmp_path, "a.wav", b"one"))
+        pipeline.process_audio("S2", _audio(tmp_path, "b.wav", b"two"))
+        assert backend.calls == 2
+
+    def test_stream_audio_uses_cache(self, tmp_path):
+        backend = CountingBackend()
+        cache = TranscriptionCache(tmp_path / "cache")
+        audio = _audio(tmp_path)
+        pipeline = TranscriptionPipeline(backend=backend, cache=cache)
+        assert len(list(pipeline.stream_audio("S1", audio))) == 1
+        assert len(list(pipeline.stream_audio("S2", audio))) == 1
+        assert backend.calls == 1
+
+    def test_process_many_uses_cache(self, tmp_path):
+        backend = CountingBackend()
+        cache = TranscriptionCache(tmp_path / "cache")
+        audio = _audio(tmp_path)
+        pipeline = TranscriptionPipeline(backend=backend, cache=cache)
+        pipeline.process_many([("S1", audio)], max_workers=1)
+        pipeline.process_many([("S2", audio)], max_workers=1)
+        assert backend.calls == 1
+
+    def test_unreadable_path_bypasses_cache(self, tmp_path):
+        cache = TranscriptionCache(tmp_path / "cache")
+        pipeline = TranscriptionPipeline(cache=cache)
+        result = pipeline.process_audio("S1", "/audio/missing.wav")
+        assert len(result.segments) == 6
+        assert cache.stats.misses == 0